@@ -0,0 +1,50 @@
+"""Replace files atomically, so a crash or a failed write never leaves one truncated.
+
+Data goes to a temporary file in the same directory, which is renamed over
+the target once complete. The temporary file gets the permissions of the
+file it replaces, or those a plain open() would give a new file, rather
+than the owner-only mode of tempfile.mkstemp.
+"""
+import json
+import os
+import stat
+import tempfile
+
+# The process umask, read once: os.umask can only be queried by setting it.
+UMASK = os.umask(0o022)
+os.umask(UMASK)
+
+
+def file_mode(path):
+    """Permission bits for path: those of the existing file, else 0o666 less the umask."""
+    try:
+        return stat.S_IMODE(os.stat(path).st_mode)
+    except FileNotFoundError:
+        return 0o666 & ~UMASK
+
+
+def write_atomic(path, data, fsync=True):
+    """Write bytes to path through a temporary file and a rename.
+
+    fsync flushes the data to disk before the rename; caches that can be
+    rebuilt skip it.
+    """
+    directory = os.path.dirname(os.path.abspath(path))
+    os.makedirs(directory, exist_ok=True)
+    fd, temporary = tempfile.mkstemp(prefix=f'.{os.path.basename(path)}-', suffix='.tmp', dir=directory)
+    try:
+        with os.fdopen(fd, 'wb') as f:
+            f.write(data)
+            if fsync:
+                f.flush()
+                os.fsync(f.fileno())
+        os.chmod(temporary, file_mode(path))
+        os.replace(temporary, path)
+    except BaseException:
+        os.unlink(temporary)
+        raise
+
+
+def write_json_atomic(path, data):
+    """Write data as indented JSON to path through a temporary file and a rename."""
+    write_atomic(path, json.dumps(data, indent=4).encode('utf-8'))
@@ -0,0 +1,238 @@
+"""Time QDex start-up and interaction under the Qt offscreen platform.
+
+Cold start runs in fresh interpreters and is split into its stages:
+imports, building the UI, load_data and font loading, then the time to the
+first paint of the window and until the deferred loading has finished. The
+interaction timings drive one PokemonApp in-process: switching language,
+typing scripted queries one keystroke at a time, scrolling through the whole
+dex and toggling the shiny sprite. Results are printed, and written as JSON
+with --output so runs on different commits can be compared with --compare.
+
+    python benchmarks/bench_gui.py --runs 5 --output before.json
+    python benchmarks/bench_gui.py --runs 5 --compare before.json
+"""
+import argparse
+import json
+import os
+import platform
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+
+BASE_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, BASE_DIR)
+
+from settings_store import ENV_VAR as SETTINGS_ENV_VAR
+
+QUERIES = ['pikachu', 'bulbizarre', 'type:fire', 'ability:levit', '#150', 'chrizard', 'type:water ability:swift']
+LANGUAGES = ['en', 'fr', 'de', 'ja', 'en']
+
+
+def peak_rss_kib():
+    try:
+        import resource
+    except ImportError:
+        return None
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    return peak // 1024 if sys.platform == 'darwin' else peak
+
+
+def summarize(samples):
+    """Summary of a list of durations in seconds, in milliseconds."""
+    ordered = sorted(samples)
+    return {
+        'count': len(ordered),
+        'median_ms': statistics.median(ordered) * 1000,
+        'p95_ms': ordered[min(len(ordered) - 1, int(len(ordered) * 0.95))] * 1000,
+        'max_ms': ordered[-1] * 1000,
+        'total_ms': sum(ordered) * 1000,
+    }
+
+
+def timed(owner, name, samples):
+    """Wrap owner.name so every call appends its duration to samples[name]."""
+    function = getattr(owner, name)
+
+    def wrapper(*args, **kwargs):
+        start = time.perf_counter()
+        try:
+            return function(*args, **kwargs)
+        finally:
+            samples.setdefault(name, []).append(time.perf_counter() - start)
+
+    setattr(owner, name, wrapper)
+
+
+def quiet_settings():
+    """Keep the benchmark away from the user's settings: start from the shipped defaults every time."""
+    os.environ[SETTINGS_ENV_VAR] = os.path.join(tempfile.mkdtemp(prefix='qdex-bench-'), 'settings.json')
+
+
+def cold_start():
+    """Child process: time each start-up stage once and print them as JSON."""
+    os.environ.setdefault('QT_QPA_PLATFORM', 'offscreen')
+    samples = {}
+    start = time.perf_counter()
+    from PyQt6 import QtWidgets
+    from PyQt6.QtCore import QEvent, QObject, QTimer
+    import qdex
+    samples['import'] = [time.perf_counter() - start]
+    quiet_settings()
+    timed(qdex.PokemonApp, 'load_ui', samples)
+    timed(qdex.PokemonApp, 'load_data', samples)
+    timed(qdex.PokemonApp, 'load_custom_font', samples)
+    timed(qdex.PokemonApp, 'finish_loading', samples)
+
+    class FirstPaint(QObject):
+        def eventFilter(self, watched, event):
+            if event.type() == QEvent.Type.Paint and 'first_paint' not in samples:
+                samples['first_paint'] = [time.perf_counter() - start]
+            return False
+
+    app = QtWidgets.QApplication([sys.argv[0]])
+    first_paint = FirstPaint()
+    app.installEventFilter(first_paint)
+    window = qdex.PokemonApp()
+    window.loaded.connect(app.quit)
+    QTimer.singleShot(10000, app.quit)
+    window.show()
+    app.exec()
+    samples['ready'] = [time.perf_counter() - start]
+    print(json.dumps({'samples': samples, 'peak_rss_kib': peak_rss_kib()}))
+
+
+def measure_cold_start(runs):
+    samples, rss = {}, []
+    for _ in range(runs):
+        output = subprocess.run([sys.executable, __file__, '--child'], cwd=BASE_DIR,
+                                check=True, capture_output=True, text=True).stdout
+        result = json.loads(output.strip().splitlines()[-1])
+        for name, values in result['samples'].items():
+            samples.setdefault(name, []).extend(values)
+        rss.append(result['peak_rss_kib'] or 0)
+    results = {f'cold_start.{name}': summarize(values) for name, values in samples.items()}
+    return results, statistics.median(rss)
+
+
+def settle(app, pool):
+    """Let pending decodes finish and deliver their results."""
+    pool.waitForDone()
+    app.processEvents()
+
+
+def measure_interaction(scroll_limit=None):
+    os.environ.setdefault('QT_QPA_PLATFORM', 'offscreen')
+    from PyQt6 import QtWidgets
+    from PyQt6.QtCore import QThreadPool
+    import qdex
+    quiet_settings()
+
+    app = QtWidgets.QApplication.instance() or QtWidgets.QApplication([sys.argv[0]])
+    pool = QThreadPool.globalInstance()
+    window = qdex.PokemonApp()
+    window.loaded.connect(app.quit)
+    window.show()
+    app.exec()
+    settle(app, pool)
+    results = {}
+
+    samples = []
+    for language in LANGUAGES:
+        if language not in window.available_languages:
+            continue
+        start = time.perf_counter()
+        window.languageComboBox.setCurrentIndex(window.languageComboBox.findText(language))
+        app.processEvents()
+        samples.append(time.perf_counter() - start)
+    results['language_switch'] = summarize(samples)
+    settle(app, pool)
+
+    samples = []
+    for query in QUERIES:
+        for end in range(1, len(query) + 1):
+            start = time.perf_counter()
+            window.searchBar.setText(query[:end])
+            app.processEvents()
+            samples.append(time.perf_counter() - start)
+        window.searchBar.clear()
+        app.processEvents()
+    results['keystroke'] = summarize(samples)
+    settle(app, pool)
+
+    view, model = window.pokemonTableView, window.pokemonTableView.model()
+    rows = model.rowCount() if scroll_limit is None else min(scroll_limit, model.rowCount())
+    samples = []
+    for row in range(rows):
+        start = time.perf_counter()
+        view.setCurrentIndex(model.index(row, 0))
+        app.processEvents()
+        samples.append(time.perf_counter() - start)
+    results['scroll_selection'] = summarize(samples)
+    settle(app, pool)
+
+    samples = []
+    for checked in (True, False) * 10:
+        start = time.perf_counter()
+        window.shinyCheckbox.setChecked(checked)
+        settle(app, pool)
+        samples.append(time.perf_counter() - start)
+    results['shiny_toggle'] = summarize(samples)
+    window.close()
+    return results
+
+
+def git_revision():
+    try:
+        return subprocess.run(['git', 'rev-parse', '--short', 'HEAD'], cwd=BASE_DIR,
+                              check=True, capture_output=True, text=True).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+
+def compare(report, baseline):
+    """Print the change of every median against a previous report."""
+    for name, result in report['results'].items():
+        previous = baseline.get('results', {}).get(name)
+        if previous is None or not previous['median_ms']:
+            continue
+        change = (result['median_ms'] - previous['median_ms']) / previous['median_ms'] * 100
+        print(f"{name:<28} {previous['median_ms']:9.2f} -> {result['median_ms']:9.2f} ms  {change:+6.1f}%")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--runs', type=int, default=5, help="cold starts to measure")
+    parser.add_argument('--scroll-limit', type=int, default=None, help="only scroll through this many rows")
+    parser.add_argument('--output', help="write the JSON report to this file")
+    parser.add_argument('--compare', help="compare medians against a previous JSON report")
+    parser.add_argument('--child', action='store_true', help=argparse.SUPPRESS)
+    args = parser.parse_args()
+
+    os.chdir(BASE_DIR)
+    if args.child:
+        cold_start()
+        sys.exit()
+
+    results, cold_rss = measure_cold_start(args.runs)
+    results.update(measure_interaction(args.scroll_limit))
+    report = {
+        'revision': git_revision(),
+        'python': platform.python_version(),
+        'platform': platform.platform(),
+        'results': results,
+        'cold_start_peak_rss_kib': cold_rss,
+        'peak_rss_kib': peak_rss_kib(),
+    }
+
+    for name, result in results.items():
+        print(f"{name:<28} median {result['median_ms']:9.2f} ms   p95 {result['p95_ms']:9.2f} ms"
+              f"   max {result['max_ms']:9.2f} ms   n={result['count']}")
+    print(f"peak RSS: cold start {cold_rss / 1024:.1f} MiB, interaction run {report['peak_rss_kib'] / 1024:.1f} MiB")
+    if args.output:
+        with open(args.output, 'w') as f:
+            json.dump(report, f, indent=4)
+    if args.compare:
+        with open(args.compare, 'r') as f:
+            compare(report, json.load(f))
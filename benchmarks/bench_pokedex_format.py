@@ -0,0 +1,95 @@
+"""Compare cold-start time and resident memory of the JSON and compiled Pokédex loaders.
+
+Each measurement runs in a fresh interpreter and performs the work QDex does
+before its first paint: load the data, read every name in the current
+language, the ability names, and the details of the first row.
+
+    python benchmarks/bench_pokedex_format.py --runs 10 --language fr
+"""
+import argparse
+import json
+import os
+import statistics
+import subprocess
+import sys
+import time
+
+BASE_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, BASE_DIR)
+
+
+def peak_rss_kib():
+    try:
+        import resource
+    except ImportError:
+        return None
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    return peak // 1024 if sys.platform == 'darwin' else peak
+
+
+def load_json(language):
+    with open(os.path.join(BASE_DIR, 'pokemon_details.json'), 'r') as f:
+        data = json.load(f)
+    with open(os.path.join(BASE_DIR, 'abilities.json'), 'r') as f:
+        abilities = json.load(f)
+    names = [details['names'].get(language, 'N/A') for details in data.values()]
+    ability_names = {key: value.get(language) for key, value in abilities.items()}
+    first = data.get('pokemon_1', {})
+    return names, ability_names, first, data
+
+
+def load_compiled(language):
+    from pokedex_format import PokedexReader
+    pokedex = PokedexReader(os.path.join(BASE_DIR, 'data'))
+    table = pokedex.names(language)
+    names = [table.get(row, 'N/A') for row in range(pokedex.count)]
+    ability_names = pokedex.ability_names(language)
+    first = pokedex.details(0, language)
+    return names, ability_names, first, pokedex
+
+
+def child(mode, language):
+    start = time.perf_counter()
+    if mode == 'json':
+        result = load_json(language)
+    elif mode == 'compiled':
+        result = load_compiled(language)
+    else:
+        result = None
+    elapsed = time.perf_counter() - start
+    print(json.dumps({'seconds': elapsed, 'peak_rss_kib': peak_rss_kib()}))
+    return result
+
+
+def measure(mode, language, runs):
+    samples = []
+    for _ in range(runs):
+        output = subprocess.run([sys.executable, __file__, '--child', mode, '--language', language],
+                                check=True, capture_output=True, text=True).stdout
+        samples.append(json.loads(output))
+    return samples
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--runs', type=int, default=10)
+    parser.add_argument('--language', default='fr')
+    parser.add_argument('--child', choices=['baseline', 'json', 'compiled'])
+    args = parser.parse_args()
+
+    if args.child:
+        child(args.child, args.language)
+        sys.exit()
+
+    baseline = measure('baseline', args.language, args.runs)
+    base_rss = statistics.median(s['peak_rss_kib'] or 0 for s in baseline)
+    report = {}
+    for mode in ('json', 'compiled'):
+        samples = measure(mode, args.language, args.runs)
+        report[mode] = {
+            'median_ms': statistics.median(s['seconds'] for s in samples) * 1000,
+            'min_ms': min(s['seconds'] for s in samples) * 1000,
+            'extra_rss_kib': statistics.median(s['peak_rss_kib'] or 0 for s in samples) - base_rss,
+        }
+        print(f"{mode:<9} load {report[mode]['median_ms']:8.2f} ms median ({report[mode]['min_ms']:.2f} min)"
+              f"   +{report[mode]['extra_rss_kib'] / 1024:6.1f} MiB RSS over a bare interpreter")
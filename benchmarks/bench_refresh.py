@@ -0,0 +1,44 @@
+"""Time a data refresh against the offline PokeAPI stub at several concurrency levels.
+
+    python benchmarks/bench_refresh.py --limit 200 --latency 40 --workers 1 8 16
+"""
+import argparse
+import contextlib
+import io
+import os
+import sys
+import tempfile
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import update_data
+from stub_pokeapi import start_in_thread
+
+
+def run_refresh(base_url, workers, limit, rate):
+    with tempfile.TemporaryDirectory() as out_dir:
+        sprites_dir = os.path.join(out_dir, 'sprites')
+        os.makedirs(sprites_dir)
+        client = update_data.ApiClient(base_url, workers, rate, sprites_dir=sprites_dir)
+        start = time.perf_counter()
+        with contextlib.redirect_stdout(io.StringIO()):
+            update_data.fetch_and_save_all_pokemon_details(
+                client, limit=limit, resume=False, output_file=os.path.join(out_dir, 'pokemon_details.json'))
+        return time.perf_counter() - start
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--limit', type=int, default=200)
+    parser.add_argument('--latency', type=float, default=40.0, help="simulated latency per request, in ms")
+    parser.add_argument('--rate', type=float, default=0.0, help="client rate limit, 0 for unlimited")
+    parser.add_argument('--workers', type=int, nargs='+', default=[1, 8, 16])
+    args = parser.parse_args()
+
+    server, base_url = start_in_thread(latency=args.latency / 1000)
+    print(f"{args.limit} Pokémon, {args.latency:.0f} ms simulated latency")
+    for workers in args.workers:
+        elapsed = run_refresh(base_url, workers, args.limit, args.rate)
+        print(f"workers={workers:<3} {elapsed:7.2f}s  {args.limit / elapsed:7.1f} Pokémon/s")
+    server.shutdown()
@@ -0,0 +1,170 @@
+"""Load-test the qdex_server.py HTTP service and report throughput and latency.
+
+Starts a local server on a free port, unless --url points at a running one.
+Concurrent keep-alive connections then replay a fixed mix of searches,
+single-Pokémon lookups in several languages and sprite downloads. With
+--etag, repeated URLs are revalidated with If-None-Match the way a caching
+client would do it.
+
+    python benchmarks/load_test.py --connections 16 --duration 10
+    python benchmarks/load_test.py --url http://127.0.0.1:8765 --requests 20000 --etag
+"""
+import argparse
+import asyncio
+import itertools
+import json
+import os
+import random
+import socket
+import subprocess
+import sys
+import time
+from collections import Counter
+from urllib.parse import quote, urlsplit
+
+BASE_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+QUERIES = ['pikachu', 'bulbizarre', 'type:fire', 'ability:levit', '#150', 'chrizard', 'type:water spe>100',
+           'total>=600', 'type:dragon', 'eevee']
+LANGUAGES = ['en', 'fr', 'de', 'ja']
+DEX_SIZE = 1025
+
+
+def request_mix(count, seed=0):
+    """Request targets: 40% searches, 40% single Pokémon, 20% sprites."""
+    generator = random.Random(seed)
+    targets = []
+    for _ in range(count):
+        kind = generator.random()
+        language = generator.choice(LANGUAGES)
+        pokemon_id = generator.randint(1, DEX_SIZE)
+        if kind < 0.4:
+            targets.append(f"/pokemon?q={quote(generator.choice(QUERIES))}&lang={language}&limit=20")
+        elif kind < 0.8:
+            targets.append(f"/pokemon/{pokemon_id}?lang={language}")
+        else:
+            targets.append(f"/sprites/{pokemon_id}{generator.choice(['', '_shiny'])}.png")
+    return targets
+
+
+def percentile(ordered, percent):
+    return ordered[min(len(ordered) - 1, int(len(ordered) * percent / 100))] if ordered else 0.0
+
+
+async def fetch(reader, writer, host, target, etag=None):
+    """Send one GET on a keep-alive connection. Returns the status, ETag and body size."""
+    request = f"GET {target} HTTP/1.1\r\nHost: {host}\r\n"
+    if etag:
+        request += f"If-None-Match: {etag}\r\n"
+    writer.write((request + "\r\n").encode('latin-1'))
+    status = int((await reader.readline()).split()[1])
+    length, response_etag = 0, None
+    while True:
+        line = (await reader.readline()).decode('latin-1')
+        if line in ('\r\n', '\n', ''):
+            break
+        name, _, value = line.partition(':')
+        name = name.strip().lower()
+        if name == 'content-length':
+            length = int(value)
+        elif name == 'etag':
+            response_etag = value.strip()
+    await reader.readexactly(length)
+    return status, response_etag, length
+
+
+async def client(host, port, targets, deadline, use_etag, results):
+    reader, writer = await asyncio.open_connection(host, port)
+    etags = {}
+    try:
+        for target in targets:
+            if deadline and time.perf_counter() > deadline:
+                break
+            start = time.perf_counter()
+            status, etag, length = await fetch(reader, writer, host, target, etags.get(target) if use_etag else None)
+            results['latencies'].append(time.perf_counter() - start)
+            results['statuses'][status] += 1
+            results['bytes'] += length
+            if etag:
+                etags[target] = etag
+    finally:
+        writer.close()
+
+
+async def run(host, port, connections, total, duration, use_etag):
+    results = {'latencies': [], 'statuses': Counter(), 'bytes': 0}
+    per_client = max(1, total // connections)
+    deadline = time.perf_counter() + duration if duration else None
+    start = time.perf_counter()
+    mixes = [request_mix(per_client, seed=i) for i in range(connections)]
+    await asyncio.gather(*(client(host, port, itertools.cycle(mix) if duration else mix, deadline, use_etag, results)
+                           for mix in mixes))
+    results['elapsed'] = time.perf_counter() - start
+    return results
+
+
+def free_port():
+    with socket.socket() as s:
+        s.bind(('127.0.0.1', 0))
+        return s.getsockname()[1]
+
+
+def start_server(port):
+    """Start qdex_server.py and wait until it listens."""
+    process = subprocess.Popen([sys.executable, os.path.join(BASE_DIR, 'qdex_server.py'), '--port', str(port)],
+                               cwd=BASE_DIR, stdout=subprocess.PIPE, text=True)
+    for line in process.stdout:
+        if line.startswith('Serving'):
+            return process
+    raise RuntimeError("qdex_server.py exited before listening")
+
+
+def report(results):
+    ordered = sorted(results['latencies'])
+    count = len(ordered)
+    summary = {
+        'requests': count,
+        'elapsed_s': results['elapsed'],
+        'requests_per_s': count / results['elapsed'] if results['elapsed'] else 0.0,
+        'p50_ms': percentile(ordered, 50) * 1000,
+        'p90_ms': percentile(ordered, 90) * 1000,
+        'p99_ms': percentile(ordered, 99) * 1000,
+        'max_ms': (ordered[-1] if ordered else 0.0) * 1000,
+        'statuses': dict(results['statuses']),
+        'mib_received': results['bytes'] / 1024 / 1024,
+    }
+    print(f"{count} requests in {summary['elapsed_s']:.2f} s: {summary['requests_per_s']:.0f} requests/s, "
+          f"{summary['mib_received']:.1f} MiB")
+    print(f"latency p50 {summary['p50_ms']:.2f} ms   p90 {summary['p90_ms']:.2f} ms   "
+          f"p99 {summary['p99_ms']:.2f} ms   max {summary['max_ms']:.2f} ms")
+    print(f"statuses: {', '.join(f'{status}: {n}' for status, n in sorted(summary['statuses'].items()))}")
+    return summary
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--url', help="base URL of a running server (default: start one)")
+    parser.add_argument('--connections', type=int, default=16, help="concurrent keep-alive connections")
+    parser.add_argument('--requests', type=int, default=10000, help="requests to send in total")
+    parser.add_argument('--duration', type=float, default=None, help="run for this many seconds instead")
+    parser.add_argument('--etag', action='store_true', help="revalidate repeated URLs with If-None-Match")
+    parser.add_argument('--output', help="write the summary as JSON to this file")
+    args = parser.parse_args()
+
+    server = None
+    if args.url:
+        url = urlsplit(args.url)
+        host, port = url.hostname, url.port or 80
+    else:
+        host, port = '127.0.0.1', free_port()
+        server = start_server(port)
+    try:
+        results = asyncio.run(run(host, port, args.connections, args.requests, args.duration, args.etag))
+    finally:
+        if server is not None:
+            server.terminate()
+            server.wait()
+    summary = report(results)
+    if args.output:
+        with open(args.output, 'w') as f:
+            json.dump(summary, f, indent=4)
@@ -0,0 +1,221 @@
+"""Offline stand-in for PokeAPI, serving responses rebuilt from the committed dataset.
+
+Run it and point the refresh tool at it:
+
+    python benchmarks/stub_pokeapi.py --port 8765 --latency 50
+    python update_data.py all --base-url http://127.0.0.1:8765/api/v2 --rate 0 \
+        --output-dir /tmp/qdex --sprites-dir /tmp/qdex/sprites
+"""
+import argparse
+import hashlib
+import json
+import os
+import re
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+BASE_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+STAT_NAMES = ('hp', 'attack', 'defense', 'special-attack', 'special-defense', 'speed')
+
+# Alternate forms modelled on PokeAPI, served after the dataset's default forms:
+# a mega whose form has full names, and a regional variant with form names only.
+VARIETIES = {
+    10034: {
+        'species': 6, 'name': 'charizard-mega-x', 'types': ['fire', 'dragon'], 'abilities': ['tough-claws'],
+        'stats': [78, 130, 111, 130, 85, 100],
+        'names': {'en': 'Mega Charizard X', 'fr': 'Méga-Dracaufeu X', 'de': 'Mega-Glurak X'},
+        'form_names': {'en': 'Mega Charizard X', 'fr': 'Méga-Dracaufeu X', 'de': 'Mega-Glurak X'},
+    },
+    10091: {
+        'species': 19, 'name': 'rattata-alola', 'types': ['dark', 'normal'],
+        'abilities': ['gluttony', 'hustle', 'thick-fat'], 'stats': [30, 56, 35, 25, 35, 72],
+        'names': {},
+        'form_names': {'en': 'Alolan Form', 'fr': 'Forme d’Alola', 'de': 'Alola-Form'},
+    },
+}
+
+
+class RecordedApi:
+    """PokeAPI-shaped documents derived from pokemon_details.json and abilities.json."""
+
+    def __init__(self, base_dir=BASE_DIR):
+        self.base_dir = base_dir
+        with open(os.path.join(base_dir, 'pokemon_details.json'), 'r') as f:
+            self.pokemon = {int(key.split('_')[1]): details for key, details in json.load(f).items()}
+        with open(os.path.join(base_dir, 'abilities.json'), 'r') as f:
+            self.abilities = list(json.load(f).items())
+
+    def pokemon_list(self, host):
+        """The /pokemon list: every default form, then the varieties."""
+        ids = sorted(index for index in self.pokemon if index not in VARIETIES) + sorted(VARIETIES)
+        return {'count': len(ids), 'results': [
+            {'name': VARIETIES[index]['name'] if index in VARIETIES else self.pokemon[index]['species'],
+             'url': f"http://{host}/api/v2/pokemon/{index}/"} for index in ids]}
+
+    def pokemon_document(self, host, index):
+        variety = VARIETIES.get(index)
+        if variety is not None:
+            species = self.pokemon[variety['species']]
+            # Varieties reuse their species' sprite files.
+            return self._pokemon_document(host, index, variety['name'], variety['species'], species['species'],
+                                          variety['types'], variety['abilities'], variety['stats'])
+        details = self.pokemon.get(index)
+        if details is None:
+            return None
+        stats = [value for stat in details['stats'] for value in stat.values()]
+        return self._pokemon_document(host, index, details['species'], index, details['species'],
+                                      details['types'], details['abilities'], stats)
+
+    def _pokemon_document(self, host, index, name, species_index, species_name, types, abilities, stats):
+        sprite = f"http://{host}/sprites/pokemon_{species_index}.png"
+        shiny = f"http://{host}/sprites/pokemon_{species_index}_shiny.png"
+        has_shiny = os.path.exists(os.path.join(self.base_dir, 'sprites', f"pokemon_{species_index}_shiny.png"))
+        is_default = index not in VARIETIES
+        return {
+            'id': index,
+            'name': name,
+            'is_default': is_default,
+            'forms': [] if is_default else [{'name': name, 'url': f"http://{host}/api/v2/pokemon-form/{index}/"}],
+            'species': {'name': species_name, 'url': f"http://{host}/api/v2/pokemon-species/{species_index}/"},
+            'types': [{'slot': slot, 'type': {'name': type_name}} for slot, type_name in enumerate(types, 1)],
+            'abilities': [{'ability': {'name': ability}} for ability in abilities],
+            'stats': [{'base_stat': value, 'stat': {'name': stat}} for stat, value in zip(STAT_NAMES, stats)],
+            'sprites': {'front_default': sprite, 'front_shiny': shiny if has_shiny else None},
+        }
+
+    def form_document(self, index):
+        variety = VARIETIES.get(index)
+        if variety is None:
+            return None
+        return {
+            'id': index,
+            'name': variety['name'],
+            'names': [{'language': {'name': lang}, 'name': name} for lang, name in variety['names'].items()],
+            'form_names': [{'language': {'name': lang}, 'name': name}
+                           for lang, name in variety['form_names'].items()],
+        }
+
+    def species_document(self, index):
+        details = self.pokemon.get(index)
+        if details is None:
+            return None
+        gender_rate = details.get('gender_rate')
+        return {
+            'id': details['national_pokedex_number'],
+            'name': details['species'],
+            'names': [{'language': {'name': lang}, 'name': name} for lang, name in details['names'].items()],
+            'flavor_text_entries': [{'language': {'name': lang}, 'flavor_text': text}
+                                    for lang, text in details['descriptions'].items()],
+            'gender_rate': -1 if gender_rate is None else round(gender_rate['female'] * 8 / 100),
+        }
+
+    def ability_document(self, index):
+        if not 1 <= index <= len(self.abilities):
+            return None
+        name, names = self.abilities[index - 1]
+        return {'id': index, 'name': name,
+                'names': [{'language': {'name': lang}, 'name': value} for lang, value in names.items()]}
+
+    def sprite_bytes(self, filename):
+        path = os.path.join(self.base_dir, 'sprites', os.path.basename(filename))
+        if not os.path.exists(path):
+            return None
+        with open(path, 'rb') as f:
+            return f.read()
+
+
+ROUTES = [
+    (re.compile(r'^/api/v2/pokemon/?\?limit=(\d+)$'), 'list'),
+    (re.compile(r'^/api/v2/pokemon/(\d+)/?$'), 'pokemon'),
+    (re.compile(r'^/api/v2/pokemon-form/(\d+)/?$'), 'form'),
+    (re.compile(r'^/api/v2/pokemon-species/(\d+)/?$'), 'species'),
+    (re.compile(r'^/api/v2/ability/(\d+)/?$'), 'ability'),
+    (re.compile(r'^/sprites/([\w.]+)$'), 'sprite'),
+]
+
+
+class StubHandler(BaseHTTPRequestHandler):
+    protocol_version = 'HTTP/1.1'
+
+    def do_GET(self):
+        if self.server.latency:
+            time.sleep(self.server.latency)
+        for pattern, kind in ROUTES:
+            match = pattern.match(self.path)
+            if match:
+                break
+        else:
+            return self.respond(404, b'Not Found', 'text/plain')
+
+        api = self.server.api
+        host = self.headers.get('Host', 'localhost')
+        if kind == 'sprite':
+            body = api.sprite_bytes(match.group(1))
+            content_type = 'image/png'
+        else:
+            index = int(match.group(1))
+            if kind == 'list':
+                document = api.pokemon_list(host)
+            elif kind == 'pokemon':
+                document = api.pokemon_document(host, index)
+            elif kind == 'form':
+                document = api.form_document(index)
+            elif kind == 'species':
+                document = api.species_document(index)
+            else:
+                document = api.ability_document(index)
+            body = None if document is None else json.dumps(document).encode('utf-8')
+            content_type = 'application/json'
+
+        if body is None:
+            return self.respond(404, b'Not Found', 'text/plain')
+        etag = f'"{hashlib.sha1(body).hexdigest()}"'
+        if self.headers.get('If-None-Match') == etag:
+            return self.respond(304, b'', content_type, etag)
+        self.respond(200, body, content_type, etag)
+
+    def respond(self, status, body, content_type, etag=None):
+        self.send_response(status)
+        self.send_header('Content-Type', content_type)
+        self.send_header('Content-Length', str(len(body)))
+        if etag:
+            self.send_header('ETag', etag)
+            self.send_header('Cache-Control', f"public, max-age={self.server.max_age}")
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, format, *args):
+        if self.server.verbose:
+            super().log_message(format, *args)
+
+
+def make_server(port=0, latency=0.0, verbose=False, base_dir=BASE_DIR, max_age=86400):
+    """Create a stub server bound to localhost. Port 0 picks a free port."""
+    server = ThreadingHTTPServer(('127.0.0.1', port), StubHandler)
+    server.daemon_threads = True
+    server.api = RecordedApi(base_dir)
+    server.latency = latency
+    server.max_age = max_age
+    server.verbose = verbose
+    return server
+
+
+def start_in_thread(port=0, latency=0.0, max_age=86400):
+    """Start a stub server on a background thread and return it with its API base URL."""
+    server = make_server(port, latency, max_age=max_age)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    return server, f"http://127.0.0.1:{server.server_address[1]}/api/v2"
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Serve recorded PokeAPI responses locally.")
+    parser.add_argument('--port', type=int, default=8765)
+    parser.add_argument('--latency', type=float, default=0.0, help="simulated latency per request, in ms")
+    parser.add_argument('--max-age', type=int, default=86400, help="Cache-Control max-age sent with responses")
+    parser.add_argument('--verbose', action='store_true')
+    args = parser.parse_args()
+
+    server = make_server(args.port, args.latency / 1000, args.verbose, max_age=args.max_age)
+    print(f"Serving recorded PokeAPI on http://127.0.0.1:{server.server_address[1]}/api/v2")
+    server.serve_forever()
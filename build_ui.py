@@ -0,0 +1,46 @@
+"""Compile design.ui into design_ui.py so QDex does not parse the XML at start-up.
+
+    python build_ui.py
+
+The generated module records the SHA-1 of the design.ui it was built from;
+qdex.py falls back to loading design.ui when the two no longer match.
+"""
+import hashlib
+import io
+import os
+
+from PyQt6 import uic
+
+BASE_DIR = os.path.dirname(os.path.abspath(__file__))
+UI_FILE = os.path.join(BASE_DIR, 'design.ui')
+UI_MODULE = os.path.join(BASE_DIR, 'design_ui.py')
+
+
+def ui_hash(path=UI_FILE):
+    with open(path, 'rb') as f:
+        return hashlib.sha1(f.read()).hexdigest()
+
+
+def build_ui(ui_file=UI_FILE, module_file=UI_MODULE):
+    """Regenerate module_file from ui_file. Returns False if it was already up to date."""
+    digest = ui_hash(ui_file)
+    source = io.StringIO()
+    source.write(f"# Generated from {os.path.basename(ui_file)} by build_ui.py. Do not edit.\n")
+    source.write(f"UI_SOURCE_SHA1 = '{digest}'\n\n")
+    with open(ui_file, 'r', encoding='utf-8') as f:
+        uic.compileUi(f, source)
+    source = source.getvalue().replace(repr(ui_file)[1:-1], os.path.basename(ui_file))
+    if os.path.exists(module_file):
+        with open(module_file, 'r', encoding='utf-8') as f:
+            if f.read() == source:
+                return False
+    with open(module_file, 'w', encoding='utf-8') as f:
+        f.write(source)
+    return True
+
+
+if __name__ == "__main__":
+    if build_ui():
+        print(f"Compiled {UI_FILE} to {UI_MODULE}.")
+    else:
+        print(f"{UI_MODULE} is already up to date.")
@@ -0,0 +1,542 @@
+# Generated from design.ui by build_ui.py. Do not edit.
+UI_SOURCE_SHA1 = 'ee37f7d2e3189321bfa548211b54520d3c71ddd4'
+
+# Form implementation generated from reading ui file 'design.ui'
+#
+# Created by: PyQt6 UI code generator 6.11.0
+#
+# WARNING: Any manual changes made to this file will be lost when pyuic6 is
+# run again.  Do not edit this file unless you know what you are doing.
+
+
+from PyQt6 import QtCore, QtGui, QtWidgets
+
+
+class Ui_MainWindow(object):
+    def setupUi(self, MainWindow):
+        MainWindow.setObjectName("MainWindow")
+        MainWindow.resize(935, 507)
+        sizePolicy = QtWidgets.QSizePolicy(QtWidgets.QSizePolicy.Policy.Fixed, QtWidgets.QSizePolicy.Policy.Fixed)
+        sizePolicy.setHorizontalStretch(0)
+        sizePolicy.setVerticalStretch(0)
+        sizePolicy.setHeightForWidth(MainWindow.sizePolicy().hasHeightForWidth())
+        MainWindow.setSizePolicy(sizePolicy)
+        self.centralwidget = QtWidgets.QWidget(parent=MainWindow)
+        sizePolicy = QtWidgets.QSizePolicy(QtWidgets.QSizePolicy.Policy.Fixed, QtWidgets.QSizePolicy.Policy.Fixed)
+        sizePolicy.setHorizontalStretch(0)
+        sizePolicy.setVerticalStretch(0)
+        sizePolicy.setHeightForWidth(self.centralwidget.sizePolicy().hasHeightForWidth())
+        self.centralwidget.setSizePolicy(sizePolicy)
+        self.centralwidget.setObjectName("centralwidget")
+        self.gridLayout_2 = QtWidgets.QGridLayout(self.centralwidget)
+        self.gridLayout_2.setSizeConstraint(QtWidgets.QLayout.SizeConstraint.SetDefaultConstraint)
+        self.gridLayout_2.setObjectName("gridLayout_2")
+        self.topFrame = QtWidgets.QFrame(parent=self.centralwidget)
+        sizePolicy = QtWidgets.QSizePolicy(QtWidgets.QSizePolicy.Policy.Preferred, QtWidgets.QSizePolicy.Policy.Fixed)
+        sizePolicy.setHorizontalStretch(0)
+        sizePolicy.setVerticalStretch(0)
+        sizePolicy.setHeightForWidth(self.topFrame.sizePolicy().hasHeightForWidth())
+        self.topFrame.setSizePolicy(sizePolicy)
+        self.topFrame.setObjectName("topFrame")
+        self.horizontalLayout = QtWidgets.QHBoxLayout(self.topFrame)
+        self.horizontalLayout.setContentsMargins(6, -1, 6, 0)
+        self.horizontalLayout.setObjectName("horizontalLayout")
+        self.randomButton = QtWidgets.QPushButton(parent=self.topFrame)
+        self.randomButton.setObjectName("randomButton")
+        self.horizontalLayout.addWidget(self.randomButton)
+        self.searchBar = QtWidgets.QLineEdit(parent=self.topFrame)
+        sizePolicy = QtWidgets.QSizePolicy(QtWidgets.QSizePolicy.Policy.Expanding, QtWidgets.QSizePolicy.Policy.Fixed)
+        sizePolicy.setHorizontalStretch(0)
+        sizePolicy.setVerticalStretch(0)
+        sizePolicy.setHeightForWidth(self.searchBar.sizePolicy().hasHeightForWidth())
+        self.searchBar.setSizePolicy(sizePolicy)
+        self.searchBar.setObjectName("searchBar")
+        self.horizontalLayout.addWidget(self.searchBar)
+        self.shinyCheckbox = QtWidgets.QCheckBox(parent=self.topFrame)
+        self.shinyCheckbox.setObjectName("shinyCheckbox")
+        self.horizontalLayout.addWidget(self.shinyCheckbox)
+        self.languageComboBox = QtWidgets.QComboBox(parent=self.topFrame)
+        self.languageComboBox.setObjectName("languageComboBox")
+        self.horizontalLayout.addWidget(self.languageComboBox)
+        self.gridLayout_2.addWidget(self.topFrame, 0, 0, 1, 3)
+        self.dexLayout = QtWidgets.QGridLayout()
+        self.dexLayout.setContentsMargins(6, -1, -1, 6)
+        self.dexLayout.setObjectName("dexLayout")
+        self.pokemonTableView = QtWidgets.QTableView(parent=self.centralwidget)
+        sizePolicy = QtWidgets.QSizePolicy(QtWidgets.QSizePolicy.Policy.Minimum, QtWidgets.QSizePolicy.Policy.Minimum)
+        sizePolicy.setHorizontalStretch(0)
+        sizePolicy.setVerticalStretch(0)
+        sizePolicy.setHeightForWidth(self.pokemonTableView.sizePolicy().hasHeightForWidth())
+        self.pokemonTableView.setSizePolicy(sizePolicy)
+        self.pokemonTableView.setFrameShape(QtWidgets.QFrame.Shape.Box)
+        self.pokemonTableView.setFrameShadow(QtWidgets.QFrame.Shadow.Sunken)
+        self.pokemonTableView.setObjectName("pokemonTableView")
+        self.dexLayout.addWidget(self.pokemonTableView, 0, 0, 1, 1)
+        self.gridLayout_2.addLayout(self.dexLayout, 1, 0, 1, 1)
+        self.rightPanel = QtWidgets.QGridLayout()
+        self.rightPanel.setContentsMargins(-1, -1, 6, 6)
+        self.rightPanel.setObjectName("rightPanel")
+        self.ability2Frame_2 = QtWidgets.QFrame(parent=self.centralwidget)
+        sizePolicy = QtWidgets.QSizePolicy(QtWidgets.QSizePolicy.Policy.Maximum, QtWidgets.QSizePolicy.Policy.Preferred)
+        sizePolicy.setHorizontalStretch(0)
+        sizePolicy.setVerticalStretch(0)
+        sizePolicy.setHeightForWidth(self.ability2Frame_2.sizePolicy().hasHeightForWidth())
+        self.ability2Frame_2.setSizePolicy(sizePolicy)
+        self.ability2Frame_2.setMinimumSize(QtCore.QSize(150, 0))
+        self.ability2Frame_2.setMaximumSize(QtCore.QSize(150, 16777215))
+        self.ability2Frame_2.setFrameShape(QtWidgets.QFrame.Shape.NoFrame)
+        self.ability2Frame_2.setFrameShadow(QtWidgets.QFrame.Shadow.Raised)
+        self.ability2Frame_2.setObjectName("ability2Frame_2")
+        self.ability2Frame = QtWidgets.QGridLayout(self.ability2Frame_2)
+        self.ability2Frame.setObjectName("ability2Frame")
+        self.ability2Label = QtWidgets.QLabel(parent=self.ability2Frame_2)
+        sizePolicy = QtWidgets.QSizePolicy(QtWidgets.QSizePolicy.Policy.Maximum, QtWidgets.QSizePolicy.Policy.Preferred)
+        sizePolicy.setHorizontalStretch(0)
+        sizePolicy.setVerticalStretch(0)
+        sizePolicy.setHeightForWidth(self.ability2Label.sizePolicy().hasHeightForWidth())
+        self.ability2Label.setSizePolicy(sizePolicy)
+        self.ability2Label.setMinimumSize(QtCore.QSize(150, 0))
+        self.ability2Label.setMaximumSize(QtCore.QSize(150, 16777215))
+        font = QtGui.QFont()
+        font.setBold(False)
+        self.ability2Label.setFont(font)
+        self.ability2Label.setObjectName("ability2Label")
+        self.ability2Frame.addWidget(self.ability2Label, 0, 0, 1, 1)
+        self.rightPanel.addWidget(self.ability2Frame_2, 2, 2, 1, 1)
+        self.statsFrame = QtWidgets.QFrame(parent=self.centralwidget)
+        self.statsFrame.setFrameShape(QtWidgets.QFrame.Shape.NoFrame)
+        self.statsFrame.setFrameShadow(QtWidgets.QFrame.Shadow.Raised)
+        self.statsFrame.setObjectName("statsFrame")
+        self.statsLayout = QtWidgets.QGridLayout(self.statsFrame)
+        self.statsLayout.setObjectName("statsLayout")
+        self.hpBar = QtWidgets.QProgressBar(parent=self.statsFrame)
+        font = QtGui.QFont()
+        font.setItalic(True)
+        self.hpBar.setFont(font)
+        self.hpBar.setMaximum(255)
+        self.hpBar.setProperty("value", 0)
+        self.hpBar.setTextVisible(False)
+        self.hpBar.setObjectName("hpBar")
+        self.statsLayout.addWidget(self.hpBar, 0, 1, 1, 1)
+        self.defBar = QtWidgets.QProgressBar(parent=self.statsFrame)
+        font = QtGui.QFont()
+        font.setBold(False)
+        font.setItalic(True)
+        self.defBar.setFont(font)
+        self.defBar.setMaximum(255)
+        self.defBar.setProperty("value", 0)
+        self.defBar.setTextVisible(False)
+        self.defBar.setObjectName("defBar")
+        self.statsLayout.addWidget(self.defBar, 2, 1, 1, 1)
+        self.spdBar = QtWidgets.QProgressBar(parent=self.statsFrame)
+        font = QtGui.QFont()
+        font.setItalic(True)
+        self.spdBar.setFont(font)
+        self.spdBar.setMaximum(255)
+        self.spdBar.setProperty("value", 0)
+        self.spdBar.setTextVisible(False)
+        self.spdBar.setOrientation(QtCore.Qt.Orientation.Horizontal)
+        self.spdBar.setObjectName("spdBar")
+        self.statsLayout.addWidget(self.spdBar, 5, 1, 1, 1)
+        self.spdefBar = QtWidgets.QProgressBar(parent=self.statsFrame)
+        font = QtGui.QFont()
+        font.setItalic(True)
+        self.spdefBar.setFont(font)
+        self.spdefBar.setMaximum(255)
+        self.spdefBar.setProperty("value", 0)
+        self.spdefBar.setTextVisible(False)
+        self.spdefBar.setObjectName("spdefBar")
+        self.statsLayout.addWidget(self.spdefBar, 4, 1, 1, 1)
+        self.spatkBar = QtWidgets.QProgressBar(parent=self.statsFrame)
+        font = QtGui.QFont()
+        font.setItalic(True)
+        self.spatkBar.setFont(font)
+        self.spatkBar.setMaximum(255)
+        self.spatkBar.setProperty("value", 0)
+        self.spatkBar.setTextVisible(False)
+        self.spatkBar.setObjectName("spatkBar")
+        self.statsLayout.addWidget(self.spatkBar, 3, 1, 1, 1)
+        self.atkBar = QtWidgets.QProgressBar(parent=self.statsFrame)
+        font = QtGui.QFont()
+        font.setBold(False)
+        font.setItalic(True)
+        self.atkBar.setFont(font)
+        self.atkBar.setMaximum(255)
+        self.atkBar.setProperty("value", 0)
+        self.atkBar.setTextVisible(False)
+        self.atkBar.setObjectName("atkBar")
+        self.statsLayout.addWidget(self.atkBar, 1, 1, 1, 1)
+        self.hpLabel = QtWidgets.QLabel(parent=self.statsFrame)
+        self.hpLabel.setMinimumSize(QtCore.QSize(50, 0))
+        self.hpLabel.setBaseSize(QtCore.QSize(0, 0))
+        font = QtGui.QFont()
+        font.setBold(True)
+        self.hpLabel.setFont(font)
+        self.hpLabel.setAlignment(QtCore.Qt.AlignmentFlag.AlignRight|QtCore.Qt.AlignmentFlag.AlignTrailing|QtCore.Qt.AlignmentFlag.AlignVCenter)
+        self.hpLabel.setObjectName("hpLabel")
+        self.statsLayout.addWidget(self.hpLabel, 0, 2, 1, 1)
+        self.atkLabel = QtWidgets.QLabel(parent=self.statsFrame)
+        font = QtGui.QFont()
+        font.setBold(True)
+        self.atkLabel.setFont(font)
+        self.atkLabel.setAlignment(QtCore.Qt.AlignmentFlag.AlignRight|QtCore.Qt.AlignmentFlag.AlignTrailing|QtCore.Qt.AlignmentFlag.AlignVCenter)
+        self.atkLabel.setObjectName("atkLabel")
+        self.statsLayout.addWidget(self.atkLabel, 1, 2, 1, 1)
+        self.defLabel = QtWidgets.QLabel(parent=self.statsFrame)
+        font = QtGui.QFont()
+        font.setBold(True)
+        self.defLabel.setFont(font)
+        self.defLabel.setAlignment(QtCore.Qt.AlignmentFlag.AlignRight|QtCore.Qt.AlignmentFlag.AlignTrailing|QtCore.Qt.AlignmentFlag.AlignVCenter)
+        self.defLabel.setObjectName("defLabel")
+        self.statsLayout.addWidget(self.defLabel, 2, 2, 1, 1)
+        self.spatkLabel = QtWidgets.QLabel(parent=self.statsFrame)
+        font = QtGui.QFont()
+        font.setBold(True)
+        self.spatkLabel.setFont(font)
+        self.spatkLabel.setAlignment(QtCore.Qt.AlignmentFlag.AlignRight|QtCore.Qt.AlignmentFlag.AlignTrailing|QtCore.Qt.AlignmentFlag.AlignVCenter)
+        self.spatkLabel.setObjectName("spatkLabel")
+        self.statsLayout.addWidget(self.spatkLabel, 3, 2, 1, 1)
+        self.spdefLabel = QtWidgets.QLabel(parent=self.statsFrame)
+        font = QtGui.QFont()
+        font.setBold(True)
+        self.spdefLabel.setFont(font)
+        self.spdefLabel.setAlignment(QtCore.Qt.AlignmentFlag.AlignRight|QtCore.Qt.AlignmentFlag.AlignTrailing|QtCore.Qt.AlignmentFlag.AlignVCenter)
+        self.spdefLabel.setObjectName("spdefLabel")
+        self.statsLayout.addWidget(self.spdefLabel, 4, 2, 1, 1)
+        self.spdLabel = QtWidgets.QLabel(parent=self.statsFrame)
+        font = QtGui.QFont()
+        font.setBold(True)
+        self.spdLabel.setFont(font)
+        self.spdLabel.setAlignment(QtCore.Qt.AlignmentFlag.AlignRight|QtCore.Qt.AlignmentFlag.AlignTrailing|QtCore.Qt.AlignmentFlag.AlignVCenter)
+        self.spdLabel.setObjectName("spdLabel")
+        self.statsLayout.addWidget(self.spdLabel, 5, 2, 1, 1)
+        self.hpRankLabel = QtWidgets.QLabel(parent=self.statsFrame)
+        self.hpRankLabel.setMinimumSize(QtCore.QSize(90, 0))
+        self.hpRankLabel.setAlignment(QtCore.Qt.AlignmentFlag.AlignRight|QtCore.Qt.AlignmentFlag.AlignTrailing|QtCore.Qt.AlignmentFlag.AlignVCenter)
+        self.hpRankLabel.setObjectName("hpRankLabel")
+        self.statsLayout.addWidget(self.hpRankLabel, 0, 3, 1, 1)
+        self.atkRankLabel = QtWidgets.QLabel(parent=self.statsFrame)
+        self.atkRankLabel.setMinimumSize(QtCore.QSize(90, 0))
+        self.atkRankLabel.setAlignment(QtCore.Qt.AlignmentFlag.AlignRight|QtCore.Qt.AlignmentFlag.AlignTrailing|QtCore.Qt.AlignmentFlag.AlignVCenter)
+        self.atkRankLabel.setObjectName("atkRankLabel")
+        self.statsLayout.addWidget(self.atkRankLabel, 1, 3, 1, 1)
+        self.defRankLabel = QtWidgets.QLabel(parent=self.statsFrame)
+        self.defRankLabel.setMinimumSize(QtCore.QSize(90, 0))
+        self.defRankLabel.setAlignment(QtCore.Qt.AlignmentFlag.AlignRight|QtCore.Qt.AlignmentFlag.AlignTrailing|QtCore.Qt.AlignmentFlag.AlignVCenter)
+        self.defRankLabel.setObjectName("defRankLabel")
+        self.statsLayout.addWidget(self.defRankLabel, 2, 3, 1, 1)
+        self.spatkRankLabel = QtWidgets.QLabel(parent=self.statsFrame)
+        self.spatkRankLabel.setMinimumSize(QtCore.QSize(90, 0))
+        self.spatkRankLabel.setAlignment(QtCore.Qt.AlignmentFlag.AlignRight|QtCore.Qt.AlignmentFlag.AlignTrailing|QtCore.Qt.AlignmentFlag.AlignVCenter)
+        self.spatkRankLabel.setObjectName("spatkRankLabel")
+        self.statsLayout.addWidget(self.spatkRankLabel, 3, 3, 1, 1)
+        self.spdefRankLabel = QtWidgets.QLabel(parent=self.statsFrame)
+        self.spdefRankLabel.setMinimumSize(QtCore.QSize(90, 0))
+        self.spdefRankLabel.setAlignment(QtCore.Qt.AlignmentFlag.AlignRight|QtCore.Qt.AlignmentFlag.AlignTrailing|QtCore.Qt.AlignmentFlag.AlignVCenter)
+        self.spdefRankLabel.setObjectName("spdefRankLabel")
+        self.statsLayout.addWidget(self.spdefRankLabel, 4, 3, 1, 1)
+        self.spdRankLabel = QtWidgets.QLabel(parent=self.statsFrame)
+        self.spdRankLabel.setMinimumSize(QtCore.QSize(90, 0))
+        self.spdRankLabel.setAlignment(QtCore.Qt.AlignmentFlag.AlignRight|QtCore.Qt.AlignmentFlag.AlignTrailing|QtCore.Qt.AlignmentFlag.AlignVCenter)
+        self.spdRankLabel.setObjectName("spdRankLabel")
+        self.statsLayout.addWidget(self.spdRankLabel, 5, 3, 1, 1)
+        self.gridLayout = QtWidgets.QGridLayout()
+        self.gridLayout.setObjectName("gridLayout")
+        self.label_5 = QtWidgets.QLabel(parent=self.statsFrame)
+        self.label_5.setObjectName("label_5")
+        self.gridLayout.addWidget(self.label_5, 4, 0, 1, 1)
+        self.label_2 = QtWidgets.QLabel(parent=self.statsFrame)
+        self.label_2.setObjectName("label_2")
+        self.gridLayout.addWidget(self.label_2, 5, 0, 1, 1)
+        self.label_3 = QtWidgets.QLabel(parent=self.statsFrame)
+        self.label_3.setObjectName("label_3")
+        self.gridLayout.addWidget(self.label_3, 1, 0, 1, 1)
+        self.label = QtWidgets.QLabel(parent=self.statsFrame)
+        self.label.setObjectName("label")
+        self.gridLayout.addWidget(self.label, 0, 0, 1, 1)
+        self.label_4 = QtWidgets.QLabel(parent=self.statsFrame)
+        self.label_4.setObjectName("label_4")
+        self.gridLayout.addWidget(self.label_4, 2, 0, 1, 1)
+        self.label_6 = QtWidgets.QLabel(parent=self.statsFrame)
+        self.label_6.setObjectName("label_6")
+        self.gridLayout.addWidget(self.label_6, 3, 0, 1, 1)
+        self.statsLayout.addLayout(self.gridLayout, 0, 0, 6, 1)
+        self.rightPanel.addWidget(self.statsFrame, 3, 1, 1, 3)
+        self.ability1Frame = QtWidgets.QFrame(parent=self.centralwidget)
+        sizePolicy = QtWidgets.QSizePolicy(QtWidgets.QSizePolicy.Policy.Maximum, QtWidgets.QSizePolicy.Policy.Fixed)
+        sizePolicy.setHorizontalStretch(0)
+        sizePolicy.setVerticalStretch(0)
+        sizePolicy.setHeightForWidth(self.ability1Frame.sizePolicy().hasHeightForWidth())
+        self.ability1Frame.setSizePolicy(sizePolicy)
+        self.ability1Frame.setMinimumSize(QtCore.QSize(150, 0))
+        self.ability1Frame.setMaximumSize(QtCore.QSize(150, 16777215))
+        self.ability1Frame.setFrameShape(QtWidgets.QFrame.Shape.NoFrame)
+        self.ability1Frame.setFrameShadow(QtWidgets.QFrame.Shadow.Raised)
+        self.ability1Frame.setObjectName("ability1Frame")
+        self.abilityLayout = QtWidgets.QGridLayout(self.ability1Frame)
+        self.abilityLayout.setObjectName("abilityLayout")
+        self.ability1Label = QtWidgets.QLabel(parent=self.ability1Frame)
+        sizePolicy = QtWidgets.QSizePolicy(QtWidgets.QSizePolicy.Policy.Maximum, QtWidgets.QSizePolicy.Policy.Preferred)
+        sizePolicy.setHorizontalStretch(0)
+        sizePolicy.setVerticalStretch(0)
+        sizePolicy.setHeightForWidth(self.ability1Label.sizePolicy().hasHeightForWidth())
+        self.ability1Label.setSizePolicy(sizePolicy)
+        self.ability1Label.setMinimumSize(QtCore.QSize(150, 0))
+        self.ability1Label.setMaximumSize(QtCore.QSize(150, 16777215))
+        font = QtGui.QFont()
+        font.setBold(False)
+        self.ability1Label.setFont(font)
+        self.ability1Label.setObjectName("ability1Label")
+        self.abilityLayout.addWidget(self.ability1Label, 0, 0, 1, 1)
+        self.rightPanel.addWidget(self.ability1Frame, 2, 1, 1, 1)
+        self.ability3Frame = QtWidgets.QFrame(parent=self.centralwidget)
+        sizePolicy = QtWidgets.QSizePolicy(QtWidgets.QSizePolicy.Policy.Maximum, QtWidgets.QSizePolicy.Policy.Preferred)
+        sizePolicy.setHorizontalStretch(0)
+        sizePolicy.setVerticalStretch(0)
+        sizePolicy.setHeightForWidth(self.ability3Frame.sizePolicy().hasHeightForWidth())
+        self.ability3Frame.setSizePolicy(sizePolicy)
+        self.ability3Frame.setMinimumSize(QtCore.QSize(150, 0))
+        self.ability3Frame.setMaximumSize(QtCore.QSize(150, 16777215))
+        self.ability3Frame.setFrameShape(QtWidgets.QFrame.Shape.NoFrame)
+        self.ability3Frame.setFrameShadow(QtWidgets.QFrame.Shadow.Raised)
+        self.ability3Frame.setObjectName("ability3Frame")
+        self.gridLayout_4 = QtWidgets.QGridLayout(self.ability3Frame)
+        self.gridLayout_4.setObjectName("gridLayout_4")
+        self.ability3Label = QtWidgets.QLabel(parent=self.ability3Frame)
+        sizePolicy = QtWidgets.QSizePolicy(QtWidgets.QSizePolicy.Policy.Maximum, QtWidgets.QSizePolicy.Policy.Preferred)
+        sizePolicy.setHorizontalStretch(150)
+        sizePolicy.setVerticalStretch(0)
+        sizePolicy.setHeightForWidth(self.ability3Label.sizePolicy().hasHeightForWidth())
+        self.ability3Label.setSizePolicy(sizePolicy)
+        self.ability3Label.setMinimumSize(QtCore.QSize(150, 0))
+        self.ability3Label.setMaximumSize(QtCore.QSize(150, 16777215))
+        font = QtGui.QFont()
+        font.setBold(False)
+        self.ability3Label.setFont(font)
+        self.ability3Label.setObjectName("ability3Label")
+        self.gridLayout_4.addWidget(self.ability3Label, 0, 0, 1, 1)
+        self.rightPanel.addWidget(self.ability3Frame, 2, 3, 1, 1)
+        self.gridFrame_2 = QtWidgets.QFrame(parent=self.centralwidget)
+        self.gridFrame_2.setFrameShape(QtWidgets.QFrame.Shape.NoFrame)
+        self.gridFrame_2.setFrameShadow(QtWidgets.QFrame.Shadow.Raised)
+        self.gridFrame_2.setObjectName("gridFrame_2")
+        self.gridLayout_9 = QtWidgets.QGridLayout(self.gridFrame_2)
+        self.gridLayout_9.setObjectName("gridLayout_9")
+        self.pokemonLabel = QtWidgets.QLabel(parent=self.gridFrame_2)
+        sizePolicy = QtWidgets.QSizePolicy(QtWidgets.QSizePolicy.Policy.Preferred, QtWidgets.QSizePolicy.Policy.Preferred)
+        sizePolicy.setHorizontalStretch(0)
+        sizePolicy.setVerticalStretch(0)
+        sizePolicy.setHeightForWidth(self.pokemonLabel.sizePolicy().hasHeightForWidth())
+        self.pokemonLabel.setSizePolicy(sizePolicy)
+        self.pokemonLabel.setMinimumSize(QtCore.QSize(0, 0))
+        font = QtGui.QFont()
+        font.setPointSize(17)
+        font.setBold(True)
+        self.pokemonLabel.setFont(font)
+        self.pokemonLabel.setFrameShape(QtWidgets.QFrame.Shape.NoFrame)
+        self.pokemonLabel.setFrameShadow(QtWidgets.QFrame.Shadow.Plain)
+        self.pokemonLabel.setAlignment(QtCore.Qt.AlignmentFlag.AlignRight|QtCore.Qt.AlignmentFlag.AlignTrailing|QtCore.Qt.AlignmentFlag.AlignVCenter)
+        self.pokemonLabel.setObjectName("pokemonLabel")
+        self.gridLayout_9.addWidget(self.pokemonLabel, 0, 1, 1, 1)
+        self.dexLabel = QtWidgets.QLabel(parent=self.gridFrame_2)
+        self.dexLabel.setMinimumSize(QtCore.QSize(0, 0))
+        font = QtGui.QFont()
+        font.setBold(False)
+        self.dexLabel.setFont(font)
+        self.dexLabel.setObjectName("dexLabel")
+        self.gridLayout_9.addWidget(self.dexLabel, 0, 0, 1, 1)
+        self.rightPanel.addWidget(self.gridFrame_2, 0, 0, 1, 4)
+        self.gridFrame = QtWidgets.QFrame(parent=self.centralwidget)
+        sizePolicy = QtWidgets.QSizePolicy(QtWidgets.QSizePolicy.Policy.Preferred, QtWidgets.QSizePolicy.Policy.Fixed)
+        sizePolicy.setHorizontalStretch(0)
+        sizePolicy.setVerticalStretch(0)
+        sizePolicy.setHeightForWidth(self.gridFrame.sizePolicy().hasHeightForWidth())
+        self.gridFrame.setSizePolicy(sizePolicy)
+        self.gridFrame.setFrameShape(QtWidgets.QFrame.Shape.NoFrame)
+        self.gridFrame.setFrameShadow(QtWidgets.QFrame.Shadow.Raised)
+        self.gridFrame.setObjectName("gridFrame")
+        self.gridLayout_3 = QtWidgets.QGridLayout(self.gridFrame)
+        self.gridLayout_3.setObjectName("gridLayout_3")
+        self.maleLabel = QtWidgets.QLabel(parent=self.gridFrame)
+        font = QtGui.QFont()
+        font.setBold(True)
+        self.maleLabel.setFont(font)
+        self.maleLabel.setObjectName("maleLabel")
+        self.gridLayout_3.addWidget(self.maleLabel, 0, 0, 1, 1)
+        self.genderBar = QtWidgets.QProgressBar(parent=self.gridFrame)
+        self.genderBar.setProperty("value", 24)
+        self.genderBar.setTextVisible(False)
+        self.genderBar.setObjectName("genderBar")
+        self.gridLayout_3.addWidget(self.genderBar, 0, 1, 1, 1)
+        self.femaleLabel = QtWidgets.QLabel(parent=self.gridFrame)
+        font = QtGui.QFont()
+        font.setBold(True)
+        self.femaleLabel.setFont(font)
+        self.femaleLabel.setObjectName("femaleLabel")
+        self.gridLayout_3.addWidget(self.femaleLabel, 0, 2, 1, 1)
+        self.rightPanel.addWidget(self.gridFrame, 1, 1, 1, 3)
+        self.pokemonFrame = QtWidgets.QFrame(parent=self.centralwidget)
+        sizePolicy = QtWidgets.QSizePolicy(QtWidgets.QSizePolicy.Policy.Fixed, QtWidgets.QSizePolicy.Policy.Fixed)
+        sizePolicy.setHorizontalStretch(0)
+        sizePolicy.setVerticalStretch(0)
+        sizePolicy.setHeightForWidth(self.pokemonFrame.sizePolicy().hasHeightForWidth())
+        self.pokemonFrame.setSizePolicy(sizePolicy)
+        self.pokemonFrame.setFrameShape(QtWidgets.QFrame.Shape.NoFrame)
+        self.pokemonFrame.setFrameShadow(QtWidgets.QFrame.Shadow.Raised)
+        self.pokemonFrame.setObjectName("pokemonFrame")
+        self.pokemonLayout = QtWidgets.QGridLayout(self.pokemonFrame)
+        self.pokemonLayout.setObjectName("pokemonLayout")
+        self.spriteLabel = QtWidgets.QLabel(parent=self.pokemonFrame)
+        sizePolicy = QtWidgets.QSizePolicy(QtWidgets.QSizePolicy.Policy.Maximum, QtWidgets.QSizePolicy.Policy.Maximum)
+        sizePolicy.setHorizontalStretch(0)
+        sizePolicy.setVerticalStretch(0)
+        sizePolicy.setHeightForWidth(self.spriteLabel.sizePolicy().hasHeightForWidth())
+        self.spriteLabel.setSizePolicy(sizePolicy)
+        self.spriteLabel.setMinimumSize(QtCore.QSize(384, 384))
+        self.spriteLabel.setAlignment(QtCore.Qt.AlignmentFlag.AlignCenter)
+        self.spriteLabel.setObjectName("spriteLabel")
+        self.pokemonLayout.addWidget(self.spriteLabel, 0, 1, 1, 1)
+        self.rightPanel.addWidget(self.pokemonFrame, 1, 0, 3, 1)
+        self.typeFrame = QtWidgets.QFrame(parent=self.centralwidget)
+        self.typeFrame.setFrameShape(QtWidgets.QFrame.Shape.NoFrame)
+        self.typeFrame.setFrameShadow(QtWidgets.QFrame.Shadow.Raised)
+        self.typeFrame.setObjectName("typeFrame")
+        self.typeGrid = QtWidgets.QGridLayout(self.typeFrame)
+        self.typeGrid.setObjectName("typeGrid")
+        self.gridFrame_21 = QtWidgets.QFrame(parent=self.typeFrame)
+        self.gridFrame_21.setObjectName("gridFrame_21")
+        self.gridLayout_7 = QtWidgets.QGridLayout(self.gridFrame_21)
+        self.gridLayout_7.setObjectName("gridLayout_7")
+        self.type2Label = QtWidgets.QLabel(parent=self.gridFrame_21)
+        sizePolicy = QtWidgets.QSizePolicy(QtWidgets.QSizePolicy.Policy.Fixed, QtWidgets.QSizePolicy.Policy.Fixed)
+        sizePolicy.setHorizontalStretch(0)
+        sizePolicy.setVerticalStretch(0)
+        sizePolicy.setHeightForWidth(self.type2Label.sizePolicy().hasHeightForWidth())
+        self.type2Label.setSizePolicy(sizePolicy)
+        self.type2Label.setMinimumSize(QtCore.QSize(64, 64))
+        self.type2Label.setObjectName("type2Label")
+        self.gridLayout_7.addWidget(self.type2Label, 0, 0, 1, 1)
+        self.typeGrid.addWidget(self.gridFrame_21, 0, 3, 1, 1)
+        self.gridFrame1 = QtWidgets.QFrame(parent=self.typeFrame)
+        self.gridFrame1.setObjectName("gridFrame1")
+        self.gridLayout_11 = QtWidgets.QGridLayout(self.gridFrame1)
+        self.gridLayout_11.setContentsMargins(0, 0, 0, 0)
+        self.gridLayout_11.setSpacing(0)
+        self.gridLayout_11.setObjectName("gridLayout_11")
+        self.flavorComboBox = QtWidgets.QComboBox(parent=self.gridFrame1)
+        sizePolicy = QtWidgets.QSizePolicy(QtWidgets.QSizePolicy.Policy.Preferred, QtWidgets.QSizePolicy.Policy.Fixed)
+        sizePolicy.setHorizontalStretch(0)
+        sizePolicy.setVerticalStretch(0)
+        sizePolicy.setHeightForWidth(self.flavorComboBox.sizePolicy().hasHeightForWidth())
+        self.flavorComboBox.setSizePolicy(sizePolicy)
+        self.flavorComboBox.setObjectName("flavorComboBox")
+        self.gridLayout_11.addWidget(self.flavorComboBox, 2, 0, 1, 1)
+        spacerItem = QtWidgets.QSpacerItem(20, 1, QtWidgets.QSizePolicy.Policy.Minimum, QtWidgets.QSizePolicy.Policy.Expanding)
+        self.gridLayout_11.addItem(spacerItem, 3, 0, 1, 1)
+        self.descLabel = QtWidgets.QLabel(parent=self.gridFrame1)
+        sizePolicy = QtWidgets.QSizePolicy(QtWidgets.QSizePolicy.Policy.Preferred, QtWidgets.QSizePolicy.Policy.Preferred)
+        sizePolicy.setHorizontalStretch(0)
+        sizePolicy.setVerticalStretch(0)
+        sizePolicy.setHeightForWidth(self.descLabel.sizePolicy().hasHeightForWidth())
+        self.descLabel.setSizePolicy(sizePolicy)
+        self.descLabel.setMinimumSize(QtCore.QSize(400, 0))
+        font = QtGui.QFont()
+        font.setBold(False)
+        self.descLabel.setFont(font)
+        self.descLabel.setObjectName("descLabel")
+        self.gridLayout_11.addWidget(self.descLabel, 1, 0, 1, 1)
+        spacerItem1 = QtWidgets.QSpacerItem(20, 1, QtWidgets.QSizePolicy.Policy.Minimum, QtWidgets.QSizePolicy.Policy.Expanding)
+        self.gridLayout_11.addItem(spacerItem1, 0, 0, 1, 1)
+        self.typeGrid.addWidget(self.gridFrame1, 0, 0, 1, 1)
+        self.gridFrame2 = QtWidgets.QFrame(parent=self.typeFrame)
+        self.gridFrame2.setMinimumSize(QtCore.QSize(0, 0))
+        self.gridFrame2.setObjectName("gridFrame2")
+        self.gridLayout_5 = QtWidgets.QGridLayout(self.gridFrame2)
+        self.gridLayout_5.setObjectName("gridLayout_5")
+        self.type1Label = QtWidgets.QLabel(parent=self.gridFrame2)
+        sizePolicy = QtWidgets.QSizePolicy(QtWidgets.QSizePolicy.Policy.Fixed, QtWidgets.QSizePolicy.Policy.Fixed)
+        sizePolicy.setHorizontalStretch(0)
+        sizePolicy.setVerticalStretch(0)
+        sizePolicy.setHeightForWidth(self.type1Label.sizePolicy().hasHeightForWidth())
+        self.type1Label.setSizePolicy(sizePolicy)
+        self.type1Label.setMinimumSize(QtCore.QSize(64, 64))
+        self.type1Label.setObjectName("type1Label")
+        self.gridLayout_5.addWidget(self.type1Label, 0, 0, 1, 1)
+        self.typeGrid.addWidget(self.gridFrame2, 0, 2, 1, 1)
+        self.rightPanel.addWidget(self.typeFrame, 4, 0, 1, 4)
+        self.weaknessLabel = QtWidgets.QLabel(parent=self.centralwidget)
+        self.weaknessLabel.setWordWrap(True)
+        self.weaknessLabel.setObjectName("weaknessLabel")
+        self.rightPanel.addWidget(self.weaknessLabel, 5, 0, 1, 4)
+        self.similarFrame = QtWidgets.QFrame(parent=self.centralwidget)
+        self.similarFrame.setFrameShape(QtWidgets.QFrame.Shape.NoFrame)
+        self.similarFrame.setObjectName("similarFrame")
+        self.similarLayout = QtWidgets.QHBoxLayout(self.similarFrame)
+        self.similarLayout.setContentsMargins(0, -1, 0, -1)
+        self.similarLayout.setObjectName("similarLayout")
+        self.similarTitleLabel = QtWidgets.QLabel(parent=self.similarFrame)
+        self.similarTitleLabel.setObjectName("similarTitleLabel")
+        self.similarLayout.addWidget(self.similarTitleLabel)
+        self.similarList = QtWidgets.QListWidget(parent=self.similarFrame)
+        sizePolicy = QtWidgets.QSizePolicy(QtWidgets.QSizePolicy.Policy.Expanding, QtWidgets.QSizePolicy.Policy.Fixed)
+        sizePolicy.setHorizontalStretch(0)
+        sizePolicy.setVerticalStretch(0)
+        sizePolicy.setHeightForWidth(self.similarList.sizePolicy().hasHeightForWidth())
+        self.similarList.setSizePolicy(sizePolicy)
+        self.similarList.setMaximumSize(QtCore.QSize(16777215, 40))
+        self.similarList.setFrameShape(QtWidgets.QFrame.Shape.NoFrame)
+        self.similarList.setHorizontalScrollBarPolicy(QtCore.Qt.ScrollBarPolicy.ScrollBarAsNeeded)
+        self.similarList.setVerticalScrollBarPolicy(QtCore.Qt.ScrollBarPolicy.ScrollBarAlwaysOff)
+        self.similarList.setFlow(QtWidgets.QListView.Flow.LeftToRight)
+        self.similarList.setObjectName("similarList")
+        self.similarLayout.addWidget(self.similarList)
+        self.rightPanel.addWidget(self.similarFrame, 6, 0, 1, 4)
+        self.gridLayout_2.addLayout(self.rightPanel, 1, 1, 1, 2)
+        MainWindow.setCentralWidget(self.centralwidget)
+
+        self.retranslateUi(MainWindow)
+        QtCore.QMetaObject.connectSlotsByName(MainWindow)
+
+    def retranslateUi(self, MainWindow):
+        _translate = QtCore.QCoreApplication.translate
+        MainWindow.setWindowTitle(_translate("MainWindow", "MainWindow"))
+        self.randomButton.setText(_translate("MainWindow", "Random"))
+        self.shinyCheckbox.setText(_translate("MainWindow", "Shiny"))
+        self.ability2Label.setText(_translate("MainWindow", "talent2"))
+        self.hpBar.setFormat(_translate("MainWindow", "HP"))
+        self.defBar.setFormat(_translate("MainWindow", "Defense"))
+        self.spdBar.setFormat(_translate("MainWindow", "Speed"))
+        self.spdefBar.setFormat(_translate("MainWindow", "Sp. Defense"))
+        self.spatkBar.setFormat(_translate("MainWindow", "Sp. Attack"))
+        self.atkBar.setFormat(_translate("MainWindow", "Attack"))
+        self.hpLabel.setText(_translate("MainWindow", "hp"))
+        self.atkLabel.setText(_translate("MainWindow", "atk"))
+        self.defLabel.setText(_translate("MainWindow", "def"))
+        self.spatkLabel.setText(_translate("MainWindow", "spatk"))
+        self.spdefLabel.setText(_translate("MainWindow", "spdef"))
+        self.spdLabel.setText(_translate("MainWindow", "spd"))
+        self.hpRankLabel.setText(_translate("MainWindow", "top"))
+        self.atkRankLabel.setText(_translate("MainWindow", "top"))
+        self.defRankLabel.setText(_translate("MainWindow", "top"))
+        self.spatkRankLabel.setText(_translate("MainWindow", "top"))
+        self.spdefRankLabel.setText(_translate("MainWindow", "top"))
+        self.spdRankLabel.setText(_translate("MainWindow", "top"))
+        self.label_5.setText(_translate("MainWindow", "Sp. Defense"))
+        self.label_2.setText(_translate("MainWindow", "Speed"))
+        self.label_3.setText(_translate("MainWindow", "Attack"))
+        self.label.setText(_translate("MainWindow", "HP"))
+        self.label_4.setText(_translate("MainWindow", "Defense"))
+        self.label_6.setText(_translate("MainWindow", "Sp. Attack"))
+        self.ability1Label.setText(_translate("MainWindow", "talent1"))
+        self.ability3Label.setText(_translate("MainWindow", "talent3"))
+        self.pokemonLabel.setText(_translate("MainWindow", "pokemon name"))
+        self.dexLabel.setText(_translate("MainWindow", "dex"))
+        self.maleLabel.setText(_translate("MainWindow", "TextLabel"))
+        self.femaleLabel.setText(_translate("MainWindow", "TextLabel"))
+        self.spriteLabel.setText(_translate("MainWindow", "pokemon image container"))
+        self.type2Label.setText(_translate("MainWindow", "type 2"))
+        self.flavorComboBox.setToolTip(_translate("MainWindow", "Games with this Pokédex entry"))
+        self.descLabel.setText(_translate("MainWindow", "pokemon description"))
+        self.type1Label.setText(_translate("MainWindow", "type 1"))
+        self.weaknessLabel.setText(_translate("MainWindow", "weaknesses"))
+        self.similarTitleLabel.setText(_translate("MainWindow", "Similar:"))
@@ -0,0 +1,129 @@
+import hashlib
+import json
+import os
+import re
+import threading
+import time
+
+from atomic_file import write_atomic
+
+
+class CachedResponse:
+    """Response served (or revalidated) through the on-disk cache."""
+
+    def __init__(self, url, content, headers, sha256, not_modified):
+        self.url = url
+        self.status_code = 200
+        self.content = content
+        self.headers = headers
+        self.sha256 = sha256
+        self.not_modified = not_modified
+
+    def json(self):
+        return json.loads(self.content)
+
+
+class ResponseCache:
+    """Persistent HTTP response cache keyed by URL.
+
+    Each URL gets a metadata file holding its ETag, Last-Modified, freshness
+    lifetime and the SHA-256 of the body, next to a file with the body itself.
+    Entries are written with an atomic rename, so worker threads and
+    interrupted runs never leave a half-written entry behind.
+    """
+
+    def __init__(self, cache_dir):
+        self.cache_dir = cache_dir
+        self.lock = threading.Lock()
+        self.stats = {'fresh': 0, 'not_modified': 0, 'downloaded': 0, 'bytes': 0}
+        os.makedirs(cache_dir, exist_ok=True)
+
+    def _paths(self, url):
+        key = hashlib.sha1(url.encode('utf-8')).hexdigest()
+        folder = os.path.join(self.cache_dir, key[:2])
+        return os.path.join(folder, f"{key}.json"), os.path.join(folder, f"{key}.body")
+
+    def lookup(self, url):
+        """Return the cached metadata for a URL, or None."""
+        meta_path, body_path = self._paths(url)
+        try:
+            with open(meta_path, 'r', encoding='utf-8') as f:
+                meta = json.load(f)
+        except (OSError, ValueError):
+            return None
+        return meta if os.path.exists(body_path) else None
+
+    def is_fresh(self, meta):
+        """True while the entry is within the max-age the server sent with it."""
+        return time.time() < meta.get('expires', 0)
+
+    def conditional_headers(self, meta):
+        """Headers that let the server answer 304 Not Modified."""
+        headers = {}
+        if meta.get('etag'):
+            headers['If-None-Match'] = meta['etag']
+        if meta.get('last_modified'):
+            headers['If-Modified-Since'] = meta['last_modified']
+        return headers
+
+    def load(self, url, meta, not_modified=True):
+        """Build a response from a cached entry."""
+        _, body_path = self._paths(url)
+        with open(body_path, 'rb') as f:
+            content = f.read()
+        return CachedResponse(url, content, meta.get('headers', {}), meta['sha256'], not_modified)
+
+    def revalidated(self, url, meta, response):
+        """Refresh the lifetime of an entry after a 304 and return it as a response."""
+        meta = dict(meta, expires=self._expires(response.headers))
+        if response.headers.get('ETag'):
+            meta['etag'] = response.headers['ETag']
+        self._write_meta(url, meta)
+        self._count('not_modified')
+        return self.load(url, meta)
+
+    def store(self, url, response, previous=None):
+        """Store a 200 response. It counts as not modified if the body hash is unchanged."""
+        content = response.content
+        sha256 = hashlib.sha256(content).hexdigest()
+        headers = {key: response.headers[key] for key in ('Content-Type',) if key in response.headers}
+        meta = {
+            'url': url,
+            'etag': response.headers.get('ETag'),
+            'last_modified': response.headers.get('Last-Modified'),
+            'expires': self._expires(response.headers),
+            'sha256': sha256,
+            'size': len(content),
+            'headers': headers,
+        }
+        meta_path, body_path = self._paths(url)
+        unchanged = previous is not None and previous['sha256'] == sha256
+        if not unchanged:
+            write_atomic(body_path, content, fsync=False)
+        self._write_meta(url, meta)
+        self._count('downloaded', len(content))
+        return CachedResponse(url, content, headers, sha256, unchanged)
+
+    def _write_meta(self, url, meta):
+        meta_path, _ = self._paths(url)
+        write_atomic(meta_path, json.dumps(meta).encode('utf-8'), fsync=False)
+
+    def _count(self, key, size=0):
+        with self.lock:
+            self.stats[key] += 1
+            self.stats['bytes'] += size
+
+    def hit_fresh(self):
+        self._count('fresh')
+
+    @staticmethod
+    def _expires(headers):
+        match = re.search(r'max-age=(\d+)', headers.get('Cache-Control', ''))
+        return time.time() + int(match.group(1)) if match else 0
+
+    def summary(self):
+        """One-line description of how much traffic the cache saved."""
+        s = self.stats
+        return (f"{s['fresh']} served from cache, {s['not_modified']} not modified, "
+                f"{s['downloaded']} downloaded ({s['bytes'] / 1024:.1f} KiB)")
+
@@ -0,0 +1,109 @@
+"""Opt-in timing of QDex's hot paths.
+
+Instrumentation is off unless QDEX_PROFILE is set or qdex.py is started with
+--profile. QDEX_PROFILE=1 only enables it; any other value, or the path
+given after --profile, is where the report is written on exit and by the
+"Dump performance data" shortcut (Ctrl+Shift+D).
+
+Handlers are timed with perf_counter_ns into a fixed-size ring buffer per
+handler, so the cost per call is two clock reads and a deque append.
+File opens are counted through an audit hook.
+"""
+import collections
+import functools
+import json
+import os
+import sys
+import time
+
+ENV_VAR = 'QDEX_PROFILE'
+CLI_FLAG = '--profile'
+DEFAULT_DUMP_FILE = 'qdex-profile.json'
+RING_SIZE = 512
+
+
+def from_args(argv):
+    """Return the dump path if instrumentation is requested, or None.
+
+    The --profile flag and its optional path are removed from argv.
+    """
+    path = None
+    if CLI_FLAG in argv:
+        position = argv.index(CLI_FLAG)
+        del argv[position]
+        path = DEFAULT_DUMP_FILE
+        if position < len(argv) and not argv[position].startswith('-'):
+            path = argv.pop(position)
+    value = os.environ.get(ENV_VAR)
+    if path is None and value:
+        path = DEFAULT_DUMP_FILE if value == '1' else value
+    return path
+
+
+class Recorder:
+    """Durations of the last RING_SIZE calls of each handler, and event counters."""
+
+    def __init__(self, ring_size=RING_SIZE):
+        self.ring_size = ring_size
+        self.durations = collections.defaultdict(lambda: collections.deque(maxlen=ring_size))
+        self.calls = collections.Counter()
+        self.counters = collections.Counter()
+        self.started = time.time()
+
+    def record(self, name, nanoseconds):
+        self.durations[name].append(nanoseconds)
+        self.calls[name] += 1
+
+    def count(self, name, amount=1):
+        self.counters[name] += amount
+
+    def percentile(self, name, percent):
+        """Percentile of a handler's recent durations in milliseconds, or None without samples."""
+        samples = sorted(self.durations.get(name, ()))
+        if not samples:
+            return None
+        return samples[min(len(samples) - 1, int(len(samples) * percent / 100))] / 1e6
+
+    def snapshot(self):
+        handlers = {}
+        for name, samples in self.durations.items():
+            handlers[name] = {
+                'calls': self.calls[name],
+                'p50_ms': self.percentile(name, 50),
+                'p99_ms': self.percentile(name, 99),
+                'max_ms': max(samples) / 1e6,
+                'recent_ms': [value / 1e6 for value in samples],
+            }
+        return {'started': self.started, 'handlers': handlers, 'counters': dict(self.counters)}
+
+    def dump(self, path, extra=None):
+        """Write a snapshot, merged with extra, as JSON."""
+        report = self.snapshot()
+        report.update(extra or {})
+        with open(path, 'w', encoding='utf-8') as f:
+            json.dump(report, f, indent=4)
+
+    def count_file_opens(self):
+        """Count every file the interpreter opens. Audit hooks cannot be removed, so call this once."""
+        def hook(event, args):
+            if event == 'open':
+                self.counters['file_opens'] += 1
+        sys.addaudithook(hook)
+
+
+def timed(function, name, recorder):
+    """Wrap function so each call records its duration under name."""
+    @functools.wraps(function)
+    def wrapper(*args, **kwargs):
+        start = time.perf_counter_ns()
+        try:
+            return function(*args, **kwargs)
+        finally:
+            recorder.record(name, time.perf_counter_ns() - start)
+    return wrapper
+
+
+def instrument(cls, names, recorder):
+    """Time the given methods of cls. Must run before instances connect them to signals."""
+    for name in names:
+        setattr(cls, name, timed(getattr(cls, name), name, recorder))
@@ -0,0 +1,164 @@
+"""Derived Pokédex data computed once with NumPy: stat totals, percentile
+ranks, type matchups, the Pokémon sharing each ability and a nearest
+neighbour search over stats, types and abilities.
+
+Everything is computed from the compiled Pokédex columns when the
+analytics are built, so the detail pane and table only index arrays.
+"""
+import numpy as np
+
+from pokedex_format import MAX_ABILITIES, MAX_TYPES, NO_ABILITY, NO_TYPE
+
+STAT_COUNT = 6
+DEFAULT_SIMILAR = 8
+# Weights of the type and ability mismatch (1 - Jaccard overlap) against the
+# RMS distance of the standardized stat vectors.
+TYPE_WEIGHT = 1.0
+ABILITY_WEIGHT = 0.5
+
+# Attacking type -> multipliers against the defending types that are not
+# hit for normal damage.
+TYPE_CHART = {
+    'normal': {'rock': 0.5, 'ghost': 0, 'steel': 0.5},
+    'fire': {'fire': 0.5, 'water': 0.5, 'grass': 2, 'ice': 2, 'bug': 2, 'rock': 0.5, 'dragon': 0.5, 'steel': 2},
+    'water': {'fire': 2, 'water': 0.5, 'grass': 0.5, 'ground': 2, 'rock': 2, 'dragon': 0.5},
+    'electric': {'water': 2, 'electric': 0.5, 'grass': 0.5, 'ground': 0, 'flying': 2, 'dragon': 0.5},
+    'grass': {'fire': 0.5, 'water': 2, 'grass': 0.5, 'poison': 0.5, 'ground': 2, 'flying': 0.5, 'bug': 0.5,
+              'rock': 2, 'dragon': 0.5, 'steel': 0.5},
+    'ice': {'fire': 0.5, 'water': 0.5, 'grass': 2, 'ice': 0.5, 'ground': 2, 'flying': 2, 'dragon': 2, 'steel': 0.5},
+    'fighting': {'normal': 2, 'ice': 2, 'poison': 0.5, 'flying': 0.5, 'psychic': 0.5, 'bug': 0.5, 'rock': 2,
+                 'ghost': 0, 'dark': 2, 'steel': 2, 'fairy': 0.5},
+    'poison': {'grass': 2, 'poison': 0.5, 'ground': 0.5, 'rock': 0.5, 'ghost': 0.5, 'steel': 0, 'fairy': 2},
+    'ground': {'fire': 2, 'electric': 2, 'grass': 0.5, 'poison': 2, 'flying': 0, 'bug': 0.5, 'rock': 2, 'steel': 2},
+    'flying': {'electric': 0.5, 'grass': 2, 'fighting': 2, 'bug': 2, 'rock': 0.5, 'steel': 0.5},
+    'psychic': {'fighting': 2, 'poison': 2, 'psychic': 0.5, 'dark': 0, 'steel': 0.5},
+    'bug': {'fire': 0.5, 'grass': 2, 'fighting': 0.5, 'poison': 0.5, 'flying': 0.5, 'psychic': 2, 'ghost': 0.5,
+            'dark': 2, 'steel': 0.5, 'fairy': 0.5},
+    'rock': {'fire': 2, 'ice': 2, 'fighting': 0.5, 'ground': 0.5, 'flying': 2, 'bug': 2, 'steel': 0.5},
+    'ghost': {'normal': 0, 'psychic': 2, 'ghost': 2, 'dark': 0.5},
+    'dragon': {'dragon': 2, 'steel': 0.5, 'fairy': 0},
+    'dark': {'fighting': 0.5, 'psychic': 2, 'ghost': 2, 'dark': 0.5, 'fairy': 0.5},
+    'steel': {'fire': 0.5, 'water': 0.5, 'electric': 0.5, 'ice': 2, 'rock': 2, 'steel': 0.5, 'fairy': 2},
+    'fairy': {'fire': 0.5, 'fighting': 2, 'poison': 0.5, 'dragon': 2, 'dark': 2, 'steel': 0.5},
+}
+
+
+def type_chart(type_names):
+    """Multiplier matrix indexed [attacking type, defending type] in the order of type_names."""
+    chart = np.ones((len(type_names), len(type_names)), dtype=np.float32)
+    ids = {name: i for i, name in enumerate(type_names)}
+    for attacker, multipliers in TYPE_CHART.items():
+        if attacker not in ids:
+            continue
+        for defender, multiplier in multipliers.items():
+            if defender in ids:
+                chart[ids[attacker], ids[defender]] = multiplier
+    return chart
+
+
+def top_percent(values):
+    """Share of values, in percent, greater than or equal to each value. 1.0 means the very top."""
+    ordered = np.sort(values)
+    below = np.searchsorted(ordered, values, side='left')
+    return (len(values) - below) * 100.0 / max(len(values), 1)
+
+
+class PokedexAnalytics:
+    """Stat, ranking and matchup arrays for every row of a PokedexReader.
+
+    ``stats`` is a (count, 6) array, ``totals`` the base-stat totals and
+    ``top`` the (count, 7) top-percentile of each stat followed by the total.
+    ``defense`` is a (count, types) array of damage multipliers taken from
+    each attacking type.
+    """
+
+    def __init__(self, pokedex):
+        self.pokedex = pokedex
+        count = pokedex.count
+        self.dex_numbers = np.frombuffer(pokedex.dex_number, dtype=np.uint16)
+        self.stats = np.frombuffer(pokedex.stats, dtype=np.uint8).reshape(count, STAT_COUNT)
+        self.totals = self.stats.sum(axis=1, dtype=np.int32)
+        self.top = np.column_stack([top_percent(self.stats[:, i]) for i in range(STAT_COUNT)]
+                                   + [top_percent(self.totals)]) if count else np.zeros((0, STAT_COUNT + 1))
+
+        self.chart = type_chart(pokedex.type_names)
+        self.types = np.frombuffer(pokedex.types, dtype=np.uint8).reshape(count, MAX_TYPES)
+        types = self.types.astype(np.intp)
+        # A missing second type indexes an extra column of neutral multipliers.
+        types[types == NO_TYPE] = len(pokedex.type_names)
+        neutral = np.hstack([self.chart, np.ones((len(self.chart), 1), dtype=np.float32)])
+        self.defense = np.prod(neutral[:, types], axis=2).T
+        self.weakness_counts = (self.defense > 1).sum(axis=1)
+
+        abilities = np.frombuffer(pokedex.abilities, dtype=np.uint16).reshape(count, MAX_ABILITIES)
+        self.abilities = abilities
+        self.type_counts = (self.types != NO_TYPE).sum(axis=1)
+        self.ability_counts = (abilities != NO_ABILITY).sum(axis=1)
+        spread = self.stats.std(axis=0) if count else np.ones(STAT_COUNT)
+        self.standard_stats = ((self.stats - self.stats.mean(axis=0)) / np.where(spread > 0, spread, 1)
+                               if count else np.zeros((0, STAT_COUNT))).astype(np.float32)
+        rows, slots = np.nonzero(abilities != NO_ABILITY)
+        ability_ids = abilities[rows, slots]
+        order = np.argsort(ability_ids, kind='stable')
+        ability_ids, rows = ability_ids[order], rows[order]
+        starts = np.flatnonzero(np.r_[True, ability_ids[1:] != ability_ids[:-1]]) if len(rows) else []
+        self._ability_rows = {
+            pokedex.ability_keys[ability_ids[start]]: np.unique(group)
+            for start, group in zip(starts, np.split(rows, starts[1:]))
+        }
+
+    @staticmethod
+    def sorted_rows(values, descending=False):
+        """Rows ordered by a column of values. Ties keep their row order."""
+        values = np.asarray(values, dtype=np.int64)
+        return np.argsort(-values if descending else values, kind='stable').tolist()
+
+    def top_percent(self, row, stat):
+        """Top percentile of a row for a stat index, or for the total when stat is 6."""
+        return float(self.top[row, stat])
+
+    def weaknesses(self, row):
+        """(type name, multiplier) pairs for the types a row takes extra damage from, worst first."""
+        multipliers = self.defense[row]
+        weak = np.flatnonzero(multipliers > 1)
+        weak = weak[np.argsort(-multipliers[weak], kind='stable')]
+        return [(self.pokedex.type_names[i], float(multipliers[i])) for i in weak]
+
+    def resistances(self, row):
+        """(type name, multiplier) pairs for the types a row resists or is immune to, strongest first."""
+        multipliers = self.defense[row]
+        resisted = np.flatnonzero(multipliers < 1)
+        resisted = resisted[np.argsort(multipliers[resisted], kind='stable')]
+        return [(self.pokedex.type_names[i], float(multipliers[i])) for i in resisted]
+
+    def rows_with_ability(self, ability):
+        """Sorted array of the rows that can have an ability key."""
+        return self._ability_rows.get(ability, np.zeros(0, dtype=np.intp))
+
+    def distances(self, row):
+        """Distance from a row to every row: stat RMS distance plus weighted type and ability mismatch."""
+        difference = self.standard_stats - self.standard_stats[row]
+        stat_distance = np.sqrt(np.einsum('ij,ij->i', difference, difference) / STAT_COUNT)
+        stat_distance += TYPE_WEIGHT * (1 - self._overlap(self.types, self.type_counts, row, NO_TYPE))
+        stat_distance += ABILITY_WEIGHT * (1 - self._overlap(self.abilities, self.ability_counts, row, NO_ABILITY))
+        return stat_distance
+
+    @staticmethod
+    def _overlap(values, counts, row, missing):
+        """Jaccard overlap between the id set of a row and the id set of every row."""
+        shared = np.zeros(len(values), dtype=np.float32)
+        for value in values[row]:
+            if value != missing:
+                for column in values.T:
+                    shared += column == value
+        return shared / np.maximum(counts + counts[row] - shared, 1)
+
+    def similar(self, row, k=DEFAULT_SIMILAR):
+        """The k rows closest to a row, nearest first, excluding rows with the same Pokédex number."""
+        distances = self.distances(row)
+        distances[self.dex_numbers == self.dex_numbers[row]] = np.inf
+        k = min(k, int(np.isfinite(distances).sum()))
+        if k <= 0:
+            return []
+        nearest = np.argpartition(distances, k - 1)[:k]
+        return nearest[np.argsort(distances[nearest], kind='stable')].tolist()
@@ -0,0 +1,326 @@
+"""Compact, memory-mappable Pokédex format compiled from pokemon_details.json.
+
+A compiled Pokédex is a directory holding:
+
+* ``manifest.json``: format version, entry count and the available languages.
+* ``pokedex.bin``: language-independent data. Fixed-width numeric columns
+  indexed by row (ids, dex numbers, stats, gender rates, interned type and
+  ability ids, flags) and string tables for species and sprite paths.
+* ``lang/<code>.bin``: one shard per language with the names, flavor text
+  and ability names in that language. Shards compiled from datasets that
+  keep every flavor text version add them as flavor_texts and
+  flavor_versions string tables, with flavor_rows holding count + 1 u32
+  offsets of each row's first entry.
+
+Both kinds of .bin file start with b'QDEX', a little-endian u32 header length
+and a JSON header listing the offset of every section, relative to the end of
+the header. String tables are a u32 count, count + 1 u32 offsets and a UTF-8
+blob. Readers memory-map the files and only decode the strings they are
+asked for; language shards are opened on first use and kept in a small LRU.
+"""
+import json
+import mmap
+import os
+import struct
+import sys
+from collections import OrderedDict
+
+from pokedex_store import MAX_ABILITIES, MAX_TYPES, PokemonRecord
+
+MAGIC = b'QDEX'
+FORMAT_VERSION = 2
+MANIFEST_FILE = 'manifest.json'
+CORE_FILE = 'pokedex.bin'
+LANGUAGE_DIR = 'lang'
+DEFAULT_MAX_LANGUAGES = 3
+NO_TYPE = 0xFF
+NO_ABILITY = 0xFFFF
+FLAG_SHINY = 0x01
+
+COLUMNS = {
+    # name: (array typecode, values per row)
+    'pokemon_id': ('H', 1),
+    'dex_number': ('H', 1),
+    'stats': ('B', 6),
+    'gender': ('b', 1),
+    'types': ('B', MAX_TYPES),
+    'abilities': ('H', MAX_ABILITIES),
+    'flags': ('B', 1),
+}
+
+
+def encode_strings(strings):
+    """Encode a list of strings (None for missing) as a string table."""
+    blobs = [(s or '').encode('utf-8') for s in strings]
+    offsets = [0]
+    for blob in blobs:
+        offsets.append(offsets[-1] + len(blob))
+    return struct.pack(f'<I{len(offsets)}I', len(blobs), *offsets) + b''.join(blobs)
+
+
+class StringTable:
+    """Read-only view of an encoded string table. Strings are decoded on access."""
+
+    def __init__(self, buffer=None):
+        if buffer is None:
+            self.count, self.offsets, self.blob = 0, (), b''
+            return
+        self.count = struct.unpack_from('<I', buffer)[0]
+        end = 4 * (self.count + 2)
+        self.offsets = buffer[4:end].cast('I')
+        self.blob = buffer[end:]
+
+    def __len__(self):
+        return self.count
+
+    def __getitem__(self, index):
+        if not 0 <= index < self.count:
+            raise IndexError(index)
+        return str(self.blob[self.offsets[index]:self.offsets[index + 1]], 'utf-8')
+
+    def get(self, index, default=None):
+        """Return the string at index, or default if it is missing or empty."""
+        if 0 <= index < self.count:
+            value = self[index]
+            if value:
+                return value
+        return default
+
+    def __iter__(self):
+        return (self[i] for i in range(self.count))
+
+
+def write_container(path, header, sections):
+    """Write a QDEX container: magic, JSON header with the section layout, then the sections."""
+    layout, position = {}, 0
+    for name, blob in sections.items():
+        layout[name] = [position, len(blob)]
+        position += len(blob) + (-len(blob) % 4)
+    header = dict(header, version=FORMAT_VERSION, sections=layout)
+    header_bytes = json.dumps(header, ensure_ascii=False).encode('utf-8')
+    header_bytes += b' ' * (-(8 + len(header_bytes)) % 8)
+
+    with open(path, 'wb') as f:
+        f.write(MAGIC + struct.pack('<I', len(header_bytes)) + header_bytes)
+        for blob in sections.values():
+            f.write(blob + b'\0' * (-len(blob) % 4))
+
+
+class Container:
+    """Memory-mapped QDEX container."""
+
+    def __init__(self, path):
+        if sys.byteorder != 'little':
+            raise RuntimeError("The compiled Pokédex format is little-endian only.")
+        with open(path, 'rb') as f:
+            self._mmap = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        self._buffer = memoryview(self._mmap)
+        if self._buffer[:4] != MAGIC:
+            raise ValueError(f"{path} is not a compiled Pokédex file")
+        header_length = struct.unpack_from('<I', self._buffer, 4)[0]
+        self.header = json.loads(bytes(self._buffer[8:8 + header_length]))
+        if self.header['version'] != FORMAT_VERSION:
+            raise ValueError(f"{path} has format version {self.header['version']}, expected {FORMAT_VERSION}")
+        self._base = 8 + header_length
+
+    def __contains__(self, name):
+        return name in self.header['sections']
+
+    def section(self, name):
+        offset, length = self.header['sections'][name]
+        return self._buffer[self._base + offset:self._base + offset + length]
+
+    def strings(self, name):
+        """String table stored in a section, or an empty one if the section is absent."""
+        return StringTable(self.section(name)) if name in self else StringTable()
+
+
+def compile_pokedex(store, output_dir, base_dir='.'):
+    """Compile a PokedexStore into output_dir.
+
+    Sprite paths are resolved against base_dir to record which entries have a
+    shiny sprite.
+    """
+    records = store.records
+    stat_names = store.stat_names
+    languages = store.languages()
+    type_names = sorted(store.type_names)
+    type_ids = [type_names.index(name) for name in store.type_names]
+    ability_keys = store.ability_keys
+
+    columns = {name: [] for name in COLUMNS}
+    for record in records:
+        columns['pokemon_id'].append(record.pokemon_id)
+        columns['dex_number'].append(record.dex_number)
+        columns['stats'].extend(record.stats)
+        columns['gender'].append(record.gender)
+        types = [type_ids[t] for t in record.types]
+        columns['types'].extend(types + [NO_TYPE] * (MAX_TYPES - len(types)))
+        ability_list = list(record.abilities)
+        columns['abilities'].extend(ability_list + [NO_ABILITY] * (MAX_ABILITIES - len(ability_list)))
+        shiny_path = (record.sprite_path or '').replace('.png', '_shiny.png')
+        columns['flags'].append(FLAG_SHINY if os.path.exists(os.path.join(base_dir, shiny_path)) else 0)
+
+    sections = {}
+    for name, (typecode, _) in COLUMNS.items():
+        sections[name] = struct.pack(f'<{len(columns[name])}{typecode}', *columns[name])
+    sections['species'] = encode_strings([record.species for record in records])
+    sections['sprite_path'] = encode_strings([record.sprite_path for record in records])
+    os.makedirs(os.path.join(output_dir, LANGUAGE_DIR), exist_ok=True)
+    write_container(os.path.join(output_dir, CORE_FILE), {
+        'count': len(records),
+        'types': type_names,
+        'abilities': ability_keys,
+        'stats': stat_names,
+    }, sections)
+
+    coverage = {}
+    for lang in languages:
+        names = [record.names.get(lang) for record in records]
+        descriptions = [record.descriptions.get(lang) for record in records]
+        ability_names = [store.ability_names.get(key, {}).get(lang) for key in ability_keys]
+        sections = {
+            'names': encode_strings(names),
+            'descriptions': encode_strings(descriptions),
+            'abilities': encode_strings(ability_names),
+        }
+        coverage[lang] = {
+            'names': sum(1 for name in names if name),
+            'descriptions': sum(1 for text in descriptions if text),
+            'abilities': sum(1 for name in ability_names if name),
+        }
+        flavor_texts = [record.flavor_texts.get(lang, ()) for record in records]
+        if any(flavor_texts):
+            flavor_rows = [0]
+            for texts in flavor_texts:
+                flavor_rows.append(flavor_rows[-1] + len(texts))
+            sections['flavor_rows'] = struct.pack(f'<{len(flavor_rows)}I', *flavor_rows)
+            sections['flavor_texts'] = encode_strings([text for texts in flavor_texts for _, text in texts])
+            sections['flavor_versions'] = encode_strings([','.join(versions)
+                                                          for texts in flavor_texts for versions, _ in texts])
+            coverage[lang]['flavor_texts'] = flavor_rows[-1]
+        write_container(os.path.join(output_dir, LANGUAGE_DIR, f'{lang}.bin'), {'language': lang}, sections)
+
+    with open(os.path.join(output_dir, MANIFEST_FILE), 'w', encoding='utf-8') as f:
+        json.dump({'version': FORMAT_VERSION, 'count': len(records), 'languages': coverage}, f, indent=4)
+
+
+class LanguagePack:
+    """Names, flavor text and ability names of one language, from its shard."""
+
+    def __init__(self, path, ability_keys):
+        container = Container(path)
+        self.language = container.header['language']
+        self.names = container.strings('names')
+        self.descriptions = container.strings('descriptions')
+        table = container.strings('abilities')
+        self.ability_names = {key: name for key, name in zip(ability_keys, table) if name}
+        self.flavor_rows = container.section('flavor_rows').cast('I') if 'flavor_rows' in container else None
+        self.flavor_table = container.strings('flavor_texts')
+        self.flavor_versions = container.strings('flavor_versions')
+
+    def flavor_texts(self, row):
+        """Every flavor text of a row as (versions, text) pairs, oldest first.
+
+        Shards without flavor text versions give the description alone, with no versions.
+        """
+        if self.flavor_rows is not None:
+            start, end = self.flavor_rows[row], self.flavor_rows[row + 1]
+            if start < end:
+                return [(tuple(filter(None, self.flavor_versions[i].split(','))), self.flavor_table[i])
+                        for i in range(start, end)]
+        description = self.descriptions.get(row)
+        return [((), description)] if description else []
+
+
+class PokedexReader:
+    """Memory-mapped reader for a compiled Pokédex directory, addressed by row.
+
+    Only the manifest and the core file are read up front. Language shards
+    are opened on demand and at most max_languages of them stay loaded.
+    """
+
+    def __init__(self, data_dir, max_languages=DEFAULT_MAX_LANGUAGES):
+        self.data_dir = data_dir
+        self.max_languages = max_languages
+        self._packs = OrderedDict()
+        with open(os.path.join(data_dir, MANIFEST_FILE), 'r', encoding='utf-8') as f:
+            manifest = json.load(f)
+        if manifest['version'] != FORMAT_VERSION:
+            raise ValueError(f"{data_dir} has format version {manifest['version']}, expected {FORMAT_VERSION}")
+        self.languages = sorted(manifest['languages'])
+
+        core = Container(os.path.join(data_dir, CORE_FILE))
+        self.count = core.header['count']
+        self.type_names = core.header['types']
+        self.ability_keys = core.header['abilities']
+        self.stat_names = core.header['stats']
+        for name, (typecode, _) in COLUMNS.items():
+            setattr(self, name, core.section(name).cast(typecode))
+        self.species = core.strings('species')
+        self.sprite_paths = core.strings('sprite_path')
+        self.rows = {pokemon_id: row for row, pokemon_id in enumerate(self.pokemon_id)}
+
+    def language(self, language, cache=True):
+        """Return the LanguagePack for a language, loading its shard if needed.
+
+        With cache=False a shard that is not already loaded is read without
+        being added to the LRU, for one-off passes over every language.
+        """
+        pack = self._packs.get(language)
+        if pack is not None:
+            self._packs.move_to_end(language)
+            return pack
+        if language not in self.languages:
+            raise KeyError(f"No language shard for {language!r}")
+        pack = LanguagePack(os.path.join(self.data_dir, LANGUAGE_DIR, f'{language}.bin'), self.ability_keys)
+        if not cache:
+            return pack
+        self._packs[language] = pack
+        while len(self._packs) > self.max_languages:
+            self._packs.popitem(last=False)
+        return pack
+
+    def row(self, pokemon_id):
+        """Row of a Pokémon ID, or None. IDs stay stable as forms are added; rows do not."""
+        return self.rows.get(pokemon_id)
+
+    def loaded_languages(self):
+        """Languages whose shards are currently held, least recently used first."""
+        return list(self._packs)
+
+    def names(self, language):
+        """Names of every row in one language."""
+        return self.language(language).names
+
+    def descriptions(self, language):
+        """Flavor text of every row in one language."""
+        return self.language(language).descriptions
+
+    def flavor_texts(self, row, language):
+        """Every flavor text of one row in one language as (versions, text) pairs, oldest first."""
+        return self.language(language).flavor_texts(row)
+
+    def ability_names(self, language):
+        """Map ability keys to their names in one language."""
+        return self.language(language).ability_names
+
+    def record(self, row, language):
+        """One row as a PokemonRecord holding a single language. Its ids index type_names and ability_keys."""
+        types = self.types[row * MAX_TYPES:(row + 1) * MAX_TYPES]
+        abilities = self.abilities[row * MAX_ABILITIES:(row + 1) * MAX_ABILITIES]
+        pack = self.language(language)
+        name = pack.names.get(row)
+        description = pack.descriptions.get(row)
+        return PokemonRecord(
+            self.pokemon_id[row], self.dex_number[row], self.species[row],
+            tuple(t for t in types if t != NO_TYPE),
+            tuple(a for a in abilities if a != NO_ABILITY),
+            tuple(self.stats[row * 6:row * 6 + 6]), self.gender[row], self.sprite_paths[row],
+            {language: name} if name else {},
+            {language: description} if description else {},
+        )
+
+    def details(self, row, language):
+        """Details of one row shaped like a pokemon_details.json entry, holding a single language."""
+        return self.record(row, language).to_entry(self)
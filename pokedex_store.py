@@ -0,0 +1,218 @@
+"""Typed, validated in-memory Pokédex built from pokemon_details.json and abilities.json.
+
+Entries become PokemonRecord objects with __slots__, indexed by Pokémon ID.
+Type names and ability keys are interned as small ints shared by every
+record, and stats are a tuple in STAT_NAMES order. PokedexStore.from_json
+validates the data and raises SchemaError naming the offending field.
+"""
+import re
+
+STAT_NAMES = ('hp', 'attack', 'defense', 'special-attack', 'special-defense', 'speed')
+MAX_TYPES = 2
+MAX_ABILITIES = 3
+GENDERLESS = -1
+ENTRY_KEY = re.compile(r'^pokemon_(\d+)$')
+
+
+class SchemaError(ValueError):
+    """Raised when a dataset entry does not have the expected shape."""
+
+
+class PokemonRecord:
+    """One Pokémon. types and abilities hold ids into the owning table's type_names and ability_keys.
+
+    gender is the female share in eighths, or GENDERLESS. names and
+    descriptions map language codes to text. flavor_texts maps language
+    codes to every flavor text of the species as (versions, text) pairs,
+    oldest first; it is empty for datasets fetched without them.
+    """
+
+    __slots__ = ('pokemon_id', 'dex_number', 'species', 'types', 'abilities', 'stats', 'gender',
+                 'sprite_path', 'names', 'descriptions', 'flavor_texts')
+
+    def __init__(self, pokemon_id, dex_number, species, types, abilities, stats, gender,
+                 sprite_path, names, descriptions, flavor_texts=None):
+        self.pokemon_id = pokemon_id
+        self.dex_number = dex_number
+        self.species = species
+        self.types = types
+        self.abilities = abilities
+        self.stats = stats
+        self.gender = gender
+        self.sprite_path = sprite_path
+        self.names = names
+        self.descriptions = descriptions
+        self.flavor_texts = flavor_texts or {}
+
+    def female_rate(self):
+        """Percentage of females, or None if the Pokémon is genderless."""
+        return None if self.gender == GENDERLESS else self.gender * 12.5
+
+    def to_entry(self, table):
+        """The record as a pokemon_details.json entry, resolving ids against table."""
+        female = self.female_rate()
+        entry = {
+            'names': dict(self.names),
+            'species': self.species,
+            'types': [table.type_names[t] for t in self.types],
+            'abilities': [table.ability_keys[a] for a in self.abilities],
+            'stats': [{name: value} for name, value in zip(table.stat_names, self.stats)],
+            'descriptions': dict(self.descriptions),
+            'sprite_path': self.sprite_path,
+            'national_pokedex_number': self.dex_number,
+            'gender_rate': None if female is None else {'female': female, 'male': 100 - female},
+        }
+        if self.flavor_texts:
+            entry['flavor_texts'] = {language: [{'text': text, 'versions': list(versions)} for versions, text in texts]
+                                     for language, texts in self.flavor_texts.items()}
+        return entry
+
+
+def _expect(condition, where, message):
+    if not condition:
+        raise SchemaError(f"{where}: {message}")
+
+
+def _text_map(value, where):
+    _expect(isinstance(value, dict), where, "expected an object mapping languages to text")
+    for language, text in value.items():
+        _expect(isinstance(text, str), f"{where}.{language}", "expected a string")
+    return value
+
+
+def _flavor_texts(value, where):
+    _expect(isinstance(value, dict), where, "expected an object mapping languages to flavor text lists")
+    flavor_texts = {}
+    for language, texts in value.items():
+        _expect(isinstance(texts, list), f"{where}.{language}", "expected a list")
+        pairs = []
+        for i, item in enumerate(texts):
+            item_where = f"{where}.{language}[{i}]"
+            _expect(isinstance(item, dict) and isinstance(item.get('text'), str), item_where,
+                    "expected {'text': text, 'versions': [names]}")
+            versions = item.get('versions', [])
+            _expect(isinstance(versions, list) and all(isinstance(v, str) and v for v in versions),
+                    f"{item_where}.versions", "expected a list of version names")
+            pairs.append((tuple(versions), item['text']))
+        flavor_texts[language] = tuple(pairs)
+    return flavor_texts
+
+
+def _name_list(value, where, minimum, maximum):
+    _expect(isinstance(value, list) and minimum <= len(value) <= maximum, where,
+            f"expected a list of {minimum} to {maximum} names")
+    for i, name in enumerate(value):
+        _expect(isinstance(name, str) and name, f"{where}[{i}]", "expected a non-empty string")
+    return value
+
+
+def _int(value, where, minimum, maximum):
+    _expect(isinstance(value, int) and not isinstance(value, bool) and minimum <= value <= maximum,
+            where, f"expected an integer between {minimum} and {maximum}")
+    return value
+
+
+class PokedexStore:
+    """Records indexed by Pokémon ID, in insertion order, with interned types and abilities."""
+
+    def __init__(self, stat_names=STAT_NAMES):
+        self.stat_names = list(stat_names)
+        self.records = []
+        self.rows = {}
+        self.type_names = []
+        self.ability_keys = []
+        self.ability_names = {}
+        self._type_ids = {}
+        self._ability_ids = {}
+
+    def __len__(self):
+        return len(self.records)
+
+    def __iter__(self):
+        return iter(self.records)
+
+    def intern_type(self, name):
+        type_id = self._type_ids.get(name)
+        if type_id is None:
+            type_id = self._type_ids[name] = len(self.type_names)
+            self.type_names.append(name)
+        return type_id
+
+    def intern_ability(self, key):
+        ability_id = self._ability_ids.get(key)
+        if ability_id is None:
+            ability_id = self._ability_ids[key] = len(self.ability_keys)
+            self.ability_keys.append(key)
+        return ability_id
+
+    def languages(self):
+        """Every language that has a name for at least one Pokémon."""
+        return sorted({language for record in self.records for language in record.names})
+
+    def add_ability(self, key, names, where=None):
+        """Add the localized names of an ability."""
+        where = where or f"abilities.{key}"
+        _expect(isinstance(key, str) and key, where, "expected a non-empty ability key")
+        self.intern_ability(key)
+        self.ability_names[key] = dict(_text_map(names, where))
+
+    def add_entry(self, key, entry):
+        """Validate a pokemon_details.json entry and add it as a record. Returns the record."""
+        match = ENTRY_KEY.match(key) if isinstance(key, str) else None
+        _expect(match is not None, repr(key), "expected a key like 'pokemon_25'")
+        pokemon_id = int(match.group(1))
+        _expect(pokemon_id not in self.rows, key, "duplicate Pokémon ID")
+        _expect(isinstance(entry, dict), key, "expected an object")
+        missing = [field for field in ('names', 'species', 'types', 'abilities', 'stats', 'descriptions',
+                                       'national_pokedex_number') if field not in entry]
+        _expect(not missing, key, f"missing {', '.join(missing)}")
+
+        species = entry['species']
+        _expect(isinstance(species, str) and species, f"{key}.species", "expected a non-empty string")
+        types = _name_list(entry['types'], f"{key}.types", 1, MAX_TYPES)
+        abilities = _name_list(entry['abilities'], f"{key}.abilities", 0, MAX_ABILITIES)
+        stats = entry['stats']
+        _expect(isinstance(stats, list) and len(stats) == len(self.stat_names), f"{key}.stats",
+                f"expected {len(self.stat_names)} stats")
+        values = []
+        for i, (stat, name) in enumerate(zip(stats, self.stat_names)):
+            _expect(isinstance(stat, dict) and list(stat) == [name], f"{key}.stats[{i}]",
+                    f"expected {{'{name}': value}}")
+            values.append(_int(stat[name], f"{key}.stats[{i}].{name}", 0, 255))
+        dex_number = _int(entry['national_pokedex_number'], f"{key}.national_pokedex_number", 1, 0xFFFF)
+
+        gender_rate = entry.get('gender_rate')
+        gender = GENDERLESS
+        if gender_rate is not None:
+            _expect(isinstance(gender_rate, dict) and isinstance(gender_rate.get('female'), (int, float)),
+                    f"{key}.gender_rate", "expected null or {'female': rate, 'male': rate}")
+            gender = gender_rate['female'] * 8 / 100
+            _expect(gender == int(gender) and 0 <= gender <= 8, f"{key}.gender_rate.female",
+                    "expected a multiple of 12.5 between 0 and 100")
+            gender = int(gender)
+        sprite_path = entry.get('sprite_path')
+        _expect(sprite_path is None or isinstance(sprite_path, str), f"{key}.sprite_path", "expected a string")
+
+        record = PokemonRecord(
+            pokemon_id, dex_number, species,
+            tuple(self.intern_type(name) for name in types),
+            tuple(self.intern_ability(name) for name in abilities),
+            tuple(values), gender, sprite_path,
+            dict(_text_map(entry['names'], f"{key}.names")),
+            dict(_text_map(entry['descriptions'], f"{key}.descriptions")),
+            _flavor_texts(entry.get('flavor_texts', {}), f"{key}.flavor_texts"),
+        )
+        self.rows[pokemon_id] = len(self.records)
+        self.records.append(record)
+        return record
+
+    @classmethod
+    def from_json(cls, details, abilities=None):
+        """Build a store from the pokemon_details.json and abilities.json structures, validating both."""
+        store = cls()
+        _expect(isinstance(details, dict), 'pokemon_details', "expected an object")
+        for key, names in (abilities or {}).items():
+            store.add_ability(key, names)
+        for key, entry in details.items():
+            store.add_entry(key, entry)
+        return store
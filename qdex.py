@@ -1,41 +1,317 @@
 import sys
 import os
-import json
 import random
+import hashlib
 import platform
-from PyQt6 import QtWidgets, uic
-from PyQt6.QtCore import Qt
-from PyQt6.QtGui import QPixmap, QFontDatabase, QFont, QColor, QPalette, QStandardItemModel, QStandardItem, QIcon
-from unidecode import unidecode
+from PyQt6 import QtWidgets
+from PyQt6.QtCore import Qt, QAbstractTableModel, QByteArray, QModelIndex, QSortFilterProxyModel, QTimer, pyqtSignal
+from PyQt6.QtGui import QFontDatabase, QFont, QColor, QPalette, QIcon, QAction
+import instrumentation
+from design_ui import UI_SOURCE_SHA1, Ui_MainWindow
+from pokedex_format import PokedexReader, StringTable, MAX_TYPES, NO_TYPE, FLAG_SHINY
+from settings_store import SettingsStore
+from sprite_archive import SpriteArchive, SPRITE_ARCHIVE_FILE
+from sprite_cache import PixmapCache, SPRITE_SCALE, TYPE_ICON_SCALE
+from text_layout import TextLayoutCache
+
+DATA_DIR = 'data'
+UI_FILE = 'design.ui'
+PREFETCH_DISTANCE = 2
+ABILITY_TOOLTIP_NAMES = 10
+INSTRUMENTED_HANDLERS = {
+    'update_ui_with_selected_pokemon': 'select',
+    'filter_table': 'filter',
+    'setup_table': 'setup',
+    'load_and_display_sprite': 'sprite',
+    'change_language': 'language',
+}
+
+
+class PokemonTableModel(QAbstractTableModel):
+    """Read-only table model that reads straight from the compiled Pokédex.
+
+    Names come from the current language's string table and are decoded only
+    for the rows the view asks for, so switching language swaps the table and
+    emits dataChanged instead of rebuilding. Sorting permutes an index of
+    Pokédex rows here rather than in the proxy, which would call back into
+    Python for every comparison; numeric columns are sorted with NumPy once
+    the analytics are available. Until then the total and weakness columns
+    are blank.
+    """
+
+    NAME, NUMBER, TYPES, TOTAL = range(4)
+    HEADERS = ['Name', 'No.', 'Type', 'Total', 'HP', 'Atk', 'Def', 'SpA', 'SpD', 'Spe', 'Weak']
+    FIRST_STAT = 4
+    WEAKNESSES = len(HEADERS) - 1
+
+    def __init__(self, pokedex, analytics=None, parent=None):
+        super().__init__(parent)
+        self.pokedex = pokedex
+        self.analytics = analytics
+        self.names = StringTable()
+        self.order = list(range(pokedex.count))
+        self.positions = list(range(pokedex.count))
+        self.sort_column = self.NUMBER
+        self.sort_order = Qt.SortOrder.AscendingOrder
+
+    def set_names(self, names):
+        """Show names from another language's string table."""
+        self.names = names
+        if self.sort_column == self.NAME:
+            self.sort(self.sort_column, self.sort_order)
+        if self.pokedex.count:
+            self.dataChanged.emit(self.index(0, self.NAME), self.index(self.pokedex.count - 1, self.NAME))
+
+    def set_analytics(self, analytics):
+        """Fill in the columns derived from the analytics."""
+        self.analytics = analytics
+        if self.pokedex.count:
+            self.dataChanged.emit(self.index(0, self.TOTAL), self.index(self.pokedex.count - 1, self.WEAKNESSES))
+
+    def pokedex_row(self, row):
+        """Pokédex row shown at a model row."""
+        return self.order[row]
+
+    def model_row(self, pokedex_row):
+        """Model row showing a Pokédex row."""
+        return self.positions[pokedex_row]
+
+    def rowCount(self, parent=QModelIndex()):
+        return 0 if parent.isValid() else self.pokedex.count
+
+    def columnCount(self, parent=QModelIndex()):
+        return 0 if parent.isValid() else len(self.HEADERS)
 
-
-class NonEditableModel(QStandardItemModel):
     def flags(self, index):
         return Qt.ItemFlag.ItemIsSelectable | Qt.ItemFlag.ItemIsEnabled
 
+    def data(self, index, role=Qt.ItemDataRole.DisplayRole):
+        if not index.isValid():
+            return None
+        row, column = self.order[index.row()], index.column()
+        if role == Qt.ItemDataRole.DisplayRole:
+            if column == self.NAME:
+                return self.names.get(row, 'N/A')
+            if column == self.TYPES:
+                return self.type_text(row)
+            value = self.value(row, column)
+            return '' if value is None else str(value)
+        if role == Qt.ItemDataRole.TextAlignmentRole and column not in (self.NAME, self.TYPES):
+            return Qt.AlignmentFlag.AlignRight | Qt.AlignmentFlag.AlignVCenter
+        return None
+
+    def type_text(self, row):
+        types = self.pokedex.types[row * MAX_TYPES:(row + 1) * MAX_TYPES]
+        return ' / '.join(self.pokedex.type_names[t].capitalize() for t in types if t != NO_TYPE)
+
+    def value(self, row, column):
+        """Numeric value of a number, total, stat or weakness column for a Pokédex row.
+
+        None for derived columns while the analytics are not loaded.
+        """
+        if column == self.NUMBER:
+            return self.pokedex.dex_number[row]
+        if column < self.FIRST_STAT or column == self.WEAKNESSES:
+            if self.analytics is None:
+                return None
+            values = self.analytics.totals if column == self.TOTAL else self.analytics.weakness_counts
+            return int(values[row])
+        return self.pokedex.stats[row * 6 + column - self.FIRST_STAT]
+
+    def column_values(self, column):
+        """Array of a numeric column's values, indexed by Pokédex row."""
+        if column == self.NUMBER:
+            return self.analytics.dex_numbers
+        if column == self.TOTAL:
+            return self.analytics.totals
+        if column == self.WEAKNESSES:
+            return self.analytics.weakness_counts
+        return self.analytics.stats[:, column - self.FIRST_STAT]
+
+    def sorted_rows(self, column, descending):
+        """Pokédex rows ordered by a column. Ties keep their Pokédex order."""
+        if column == self.NAME:
+            key = lambda row: self.names.get(row, '').lower()
+        elif column == self.TYPES:
+            key = self.type_text
+        elif self.analytics is not None:
+            return self.analytics.sorted_rows(self.column_values(column), descending)
+        else:
+            key = lambda row: self.value(row, column) or 0
+        return sorted(range(self.pokedex.count), key=key, reverse=descending)
+
+    def sort(self, column, order=Qt.SortOrder.AscendingOrder):
+        if column < 0:
+            return
+        self.sort_column, self.sort_order = column, order
+        self.layoutAboutToBeChanged.emit()
+        old_order = self.order
+        self.order = self.sorted_rows(column, order == Qt.SortOrder.DescendingOrder)
+        for position, row in enumerate(self.order):
+            self.positions[row] = position
+        persistent = self.persistentIndexList()
+        self.changePersistentIndexList(persistent, [
+            self.index(self.positions[old_order[index.row()]], index.column()) for index in persistent])
+        self.layoutChanged.emit()
+
+    def headerData(self, section, orientation, role=Qt.ItemDataRole.DisplayRole):
+        if role == Qt.ItemDataRole.DisplayRole and orientation == Qt.Orientation.Horizontal:
+            return self.HEADERS[section]
+        return None
+
+
+class PokemonFilterProxyModel(QSortFilterProxyModel):
+    """Shows only the Pokédex rows returned by the search index.
+
+    Changing the visible rows resets the proxy instead of invalidating the
+    filter: Qt would otherwise emit one removal per hidden range, which costs
+    more than rebuilding the mapping when a keystroke hides hundreds of rows.
+    Sorting is delegated to the source model.
+    """
+
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self.visible_rows = None
+
+    def set_visible_rows(self, rows):
+        """Show only the given Pokédex rows, or every row if rows is None."""
+        self.beginResetModel()
+        self.visible_rows = rows
+        self.endResetModel()
+
+    def filterAcceptsRow(self, source_row, source_parent):
+        return self.visible_rows is None or self.sourceModel().pokedex_row(source_row) in self.visible_rows
+
+    def sort(self, column, order=Qt.SortOrder.AscendingOrder):
+        if self.sourceModel() is not None:
+            self.sourceModel().sort(column, order)
+
+    def pokedex_row(self, index):
+        """Pokédex row shown at a proxy index."""
+        return self.sourceModel().pokedex_row(self.mapToSource(index).row())
+
+    def index_for_pokedex_row(self, row):
+        """Proxy index showing a Pokédex row, invalid if the row is filtered out."""
+        source = self.sourceModel()
+        return self.mapFromSource(source.index(source.model_row(row), 0))
+
 
-class PokemonApp(QtWidgets.QMainWindow):
-    def __init__(self):
+def version_label(versions):
+    """Games sharing a flavor text, such as 'Red / Blue', from PokeAPI version names."""
+    return ' / '.join(version.replace('-', ' ').title() for version in versions) or 'Pokédex'
+
+
+def compiled_ui_is_current():
+    """Whether design_ui.py was generated from the design.ui next to it, if there is one."""
+    if not os.path.exists(UI_FILE):
+        return True
+    with open(UI_FILE, 'rb') as f:
+        return hashlib.sha1(f.read()).hexdigest() == UI_SOURCE_SHA1
+
+
+class PokemonApp(QtWidgets.QMainWindow, Ui_MainWindow):
+    loaded = pyqtSignal()
+
+    def __init__(self, recorder=None, profile_path=None, settings=None):
         super().__init__()
-        uic.loadUi('design.ui', self)
+        self.settings = settings or SettingsStore()
+        self.load_ui()
 
         self.setWindowTitle("QDex")
         icon_path = "icons/icon.png"
         self.setWindowIcon(QIcon(icon_path))
         self.init_ui_components()
-        self.data = {}
+        self.pokedex = None
+        self.analytics = None
+        self.search_index = None
         self.abilities = {}
         self.available_languages = []
-        self.current_language = self.load_language_setting()
-        self.show_shiny = False
+        self.current_language = self.settings.get('language', 'en')
+        self.show_shiny = bool(self.settings.get('shiny', False))
+        self.displayed_row = None
+        self.flavor_texts = []
+        self.pixmap_cache = PixmapCache(parent=self)
+        self.pixmap_cache.failed.connect(lambda path: print(f"Failed to load image from path: {path}"))
+        self.wanted_pixmaps = {}
         self.load_data()
         self.load_custom_font()
+        self.restore_settings()
+        self.searchBar.textChanged.connect(self.filter_table)
         self.languageComboBox.currentIndexChanged.connect(self.handle_language_change)
         self.randomButton.clicked.connect(self.select_random_pokemon)
+        self.similarList.itemClicked.connect(self.select_similar_pokemon)
         self.pokemonTableView.selectionModel().currentChanged.connect(self.on_table_selection_changed)
-        self.shinyCheckbox = self.findChild(QtWidgets.QCheckBox, 'shinyCheckbox')
         self.shinyCheckbox.toggled.connect(self.toggle_shiny_sprite)
+        self.flavorComboBox.currentIndexChanged.connect(self.show_flavor_text)
         self.update_ui_with_selected_pokemon(self.pokemonTableView.currentIndex())
+        self.recorder = recorder
+        if recorder is not None:
+            self.init_instrumentation(profile_path)
+        self.painted = False
+
+    def load_ui(self):
+        """Build the widgets from design_ui.py, or from design.ui if it was edited since it was compiled."""
+        if compiled_ui_is_current():
+            self.setupUi(self)
+        else:
+            from PyQt6 import uic
+            print(f"design_ui.py is out of date, loading {UI_FILE}. Run build_ui.py to recompile it.")
+            uic.loadUi(UI_FILE, self)
+
+    def paintEvent(self, event):
+        super().paintEvent(event)
+        if not self.painted:
+            # Defer the rest of the loading until the window is on screen.
+            self.painted = True
+            QTimer.singleShot(0, self.finish_loading)
+
+    def finish_loading(self):
+        """Load what the first paint does not need: the analytics and the search index."""
+        if self.pokedex is None:
+            return
+        from pokedex_analytics import PokedexAnalytics
+        self.analytics = PokedexAnalytics(self.pokedex)
+        self.table_model.set_analytics(self.analytics)
+        self.update_search_index()
+        if self.displayed_row is not None:
+            self.update_ui_with_selected_pokemon(self.proxy_model.index_for_pokedex_row(self.displayed_row))
+        self.loaded.emit()
+
+    def init_instrumentation(self, profile_path):
+        """Show handler latencies in the status bar and allow dumping them to profile_path."""
+        self.profile_path = profile_path
+        self.profileLabel = QtWidgets.QLabel(self)
+        self.statusBar().addPermanentWidget(self.profileLabel)
+        dump_action = QAction("Dump performance data", self)
+        dump_action.setShortcut("Ctrl+Shift+D")
+        dump_action.triggered.connect(self.dump_profile)
+        self.addAction(dump_action)
+        self.profile_timer = QTimer(self)
+        self.profile_timer.timeout.connect(self.update_profile_status)
+        self.profile_timer.start(1000)
+        self.update_profile_status()
+
+    def update_profile_status(self):
+        """Refresh the p50/p99 latencies and cache counters shown in the status bar."""
+        parts = []
+        for name, label in INSTRUMENTED_HANDLERS.items():
+            p50 = self.recorder.percentile(name, 50)
+            if p50 is not None:
+                parts.append(f"{label} {p50:.1f}/{self.recorder.percentile(name, 99):.1f} ms")
+        cache_stats = self.pixmap_cache.stats
+        parts.append(f"sprites {self.pixmap_cache.hit_rate():.0%} hit, {cache_stats['decoded']} decoded")
+        parts.append(f"{self.recorder.counters['file_opens'] + cache_stats['file_reads']} file opens")
+        self.profileLabel.setText("  |  ".join(parts))
+
+    def dump_profile(self):
+        """Write the recorded timings and counters to the profile file."""
+        self.recorder.dump(self.profile_path, {
+            'pixmap_cache': dict(self.pixmap_cache.stats, hit_rate=self.pixmap_cache.hit_rate(),
+                                 cost=self.pixmap_cache.cost),
+            'languages_loaded': self.pokedex.loaded_languages() if self.pokedex else [],
+        })
+        self.statusBar().showMessage(f"Performance data written to {self.profile_path}", 3000)
+        print(f"Performance data written to {self.profile_path}")
 
     def load_custom_font(self):
         """Load and set the custom font from the font folder."""
@@ -62,42 +338,39 @@ class PokemonApp(QtWidgets.QMainWindow):
         self.pokemonLabel.setFont(custom_font)
         self.searchBar.setFont(custom_font)
         self.descLabel.setFont(custom_font)
+        self.text_layouts.set_font(custom_font)
         self.languageComboBox.setFont(custom_font)
+        self.flavorComboBox.setFont(custom_font)
         self.pokemonLabel.setFont(custom_font_title)
 
     def init_ui_components(self):
         """Initialize UI components and their connections."""
-        self.pokemonTableView = self.findChild(QtWidgets.QTableView, 'pokemonTableView')
-        self.pokemonLabel = self.findChild(QtWidgets.QLabel, 'pokemonLabel')
-
-        self.stat_components = [
-            ('hpBar', 'hpLabel'),
-            ('atkBar', 'atkLabel'),
-            ('defBar', 'defLabel'),
-            ('spatkBar', 'spatkLabel'),
-            ('spdefBar', 'spdefLabel'),
-            ('spdBar', 'spdLabel')
+        self.table_model = None
+        self.proxy_model = PokemonFilterProxyModel(self)
+        self.pokemonTableView.setModel(self.proxy_model)
+
+        # Widgets are resolved once here; the update_* methods run on every selection.
+        self.stat_widgets = [
+            (self.hpBar, self.hpLabel, self.hpRankLabel),
+            (self.atkBar, self.atkLabel, self.atkRankLabel),
+            (self.defBar, self.defLabel, self.defRankLabel),
+            (self.spatkBar, self.spatkLabel, self.spatkRankLabel),
+            (self.spdefBar, self.spdefLabel, self.spdefRankLabel),
+            (self.spdBar, self.spdLabel, self.spdRankLabel)
         ]
-        self.type1Label = self.findChild(QtWidgets.QLabel, 'type1Label')
-        self.type2Label = self.findChild(QtWidgets.QLabel, 'type2Label')
-        self.searchBar = self.findChild(QtWidgets.QLineEdit, 'searchBar')
-        self.searchBar.setPlaceholderText("Search Pokémon by name...")
-        self.searchBar.textChanged.connect(self.filter_table)
-        self.languageComboBox = self.findChild(QtWidgets.QComboBox, 'languageComboBox')
-        self.randomButton = self.findChild(QtWidgets.QPushButton, 'randomButton')
-        self.descLabel = self.findChild(QtWidgets.QLabel, 'descLabel')
+        self.ability_labels = [self.ability1Label, self.ability2Label, self.ability3Label]
+        self.type_labels = [self.type1Label, self.type2Label]
+        self.searchBar.setPlaceholderText("Search Pokémon by name, #number, type: or ability:...")
         self.descLabel.setWordWrap(True)
-        self.maleLabel = self.findChild(QtWidgets.QLabel, 'maleLabel')
-        self.femaleLabel = self.findChild(QtWidgets.QLabel, 'femaleLabel')
+        self.text_layouts = TextLayoutCache(self.descLabel.font())
 
-        for bar_name, _ in self.stat_components:
-            bar = self.findChild(QtWidgets.QProgressBar, bar_name)
+        for bar, _, _ in self.stat_widgets:
             bar.setMinimum(0)
             bar.setMaximum(255)
             bar.setValue(0)
             bar.setAlignment(Qt.AlignmentFlag.AlignRight | Qt.AlignmentFlag.AlignVCenter)
 
-        genderBar = self.findChild(QtWidgets.QProgressBar, 'genderBar')
+        genderBar = self.genderBar
         genderBar.setMinimum(0)
         genderBar.setMaximum(100)
         genderBar.setValue(0)
@@ -112,24 +385,6 @@ class PokemonApp(QtWidgets.QMainWindow):
         self.maleLabel.setPalette(male_palette)
         self.femaleLabel.setPalette(female_palette)
 
-    def wrap_text(self, text, max_chars_per_line):
-        """Wrap the text to a specific number of characters per line."""
-        words = text.split()
-        lines = []
-        current_line = []
-
-        for word in words:
-            if len(' '.join(current_line + [word])) > max_chars_per_line:
-                lines.append(' '.join(current_line))
-                current_line = [word]
-            else:
-                current_line.append(word)
-
-        if current_line:
-            lines.append(' '.join(current_line))
-
-        return '\n'.join(lines)
-    
     def populate_language_combobox(self):
         """Populate the language selection ComboBox."""
         self.languageComboBox.clear()
@@ -146,199 +401,341 @@ class PokemonApp(QtWidgets.QMainWindow):
 
     def filter_table(self, text):
         """Filter the Pokémon table based on search input."""
-        model = self.pokemonTableView.model()
-        normalized_text = unidecode(text).lower()
-        for row in range(model.rowCount()):
-            pokemon_name_index = model.index(row, 0)
-            pokemon_name = model.data(pokemon_name_index)
-            normalized_pokemon_name = unidecode(pokemon_name).lower()
-            self.pokemonTableView.setRowHidden(row, normalized_text not in normalized_pokemon_name)
+        self.settings.update(search=text)
+        if self.search_index is None:
+            return
+        self.proxy_model.set_visible_rows(self.search_index.search(text))
+        if self.displayed_row is not None:
+            index = self.proxy_model.index_for_pokedex_row(self.displayed_row)
+            if index.isValid():
+                self.pokemonTableView.setCurrentIndex(index)
+                self.pokemonTableView.scrollTo(index)
 
     def load_data(self):
-        """Load Pokémon and abilities data from files."""
+        """Load Pokémon and abilities data from the compiled Pokédex."""
         try:
-            with open('pokemon_details.json', 'r') as f:
-                self.data = json.load(f)
-
-            with open('abilities.json', 'r') as f:
-                self.abilities = json.load(f)
+            self.pokedex = PokedexReader(DATA_DIR)
+            self.pixmap_cache.archive = self.load_sprite_archive()
+            self.abilities = self.pokedex.ability_names(self.current_language)
 
             self.available_languages = self.get_available_languages()
             self.populate_language_combobox()
-            self.setup_table(self.data)
+            self.setup_table()
         except Exception as e:
             print(f"Error loading data: {e}")
 
+    def load_sprite_archive(self):
+        """Open the packed sprites, or return None to read sprites from the sprites folder."""
+        archive_path = os.path.join(DATA_DIR, SPRITE_ARCHIVE_FILE)
+        try:
+            return SpriteArchive(archive_path)
+        except (OSError, ValueError) as e:
+            print(f"Sprite archive not available, reading sprite files: {e}")
+            return None
+
     def get_available_languages(self):
-        """Extract available languages from the loaded data."""
-        languages = set()
-        for details in self.data.values():
-            names = details['names']
-            languages.update(names.keys())
-        return sorted(languages)
+        """Return the languages listed in the Pokédex manifest."""
+        return self.pokedex.languages
 
     def change_language(self, language):
         """Change the application's display language."""
         print(f"Changing language to: {language}")
         self.current_language = language
-        self.save_language_setting(language)
-        self.setup_table(self.data)
+        self.settings.update(language=language)
+        self.abilities = self.pokedex.ability_names(language)
+        self.update_table_language()
+        self.update_ui_with_selected_pokemon(self.pokemonTableView.currentIndex())
 
-    def setup_table(self, data):
+    def setup_table(self):
         """Setup the table view with Pokémon data."""
-
-        model = NonEditableModel()
-        model.setHorizontalHeaderLabels([''])
-
-        for details in data.values():
-            name = details['names'].get(self.current_language, 'N/A')
-            model.appendRow([QStandardItem(name)])
-
-        self.pokemonTableView.setModel(model)
-        self.pokemonTableView.horizontalHeader().setSectionResizeMode(0, QtWidgets.QHeaderView.ResizeMode.Stretch)
-        self.pokemonTableView.horizontalHeader().setDefaultAlignment(Qt.AlignmentFlag.AlignLeft)
-        
-        if model.rowCount() > 0:
-            first_index = model.index(0, 0)
+        self.table_model = PokemonTableModel(self.pokedex, self.analytics, self)
+        self.proxy_model.setSourceModel(self.table_model)
+
+        header = self.pokemonTableView.horizontalHeader()
+        header.setDefaultAlignment(Qt.AlignmentFlag.AlignLeft)
+        header.setDefaultSectionSize(header.fontMetrics().horizontalAdvance('00000') + 12)
+        header.setSectionResizeMode(PokemonTableModel.NAME, QtWidgets.QHeaderView.ResizeMode.Stretch)
+        header.moveSection(header.visualIndex(PokemonTableModel.NUMBER), 0)
+        # The number column replaces the vertical header, whose width Qt
+        # recomputes from every row's header data on each filter change.
+        self.pokemonTableView.verticalHeader().setVisible(False)
+        header.setContextMenuPolicy(Qt.ContextMenuPolicy.ActionsContextMenu)
+        for column, label in enumerate(PokemonTableModel.HEADERS):
+            if column == PokemonTableModel.NAME:
+                continue
+            visible = column == PokemonTableModel.NUMBER
+            self.pokemonTableView.setColumnHidden(column, not visible)
+            action = QAction(label, header)
+            action.setCheckable(True)
+            action.setChecked(visible)
+            action.toggled.connect(lambda checked, column=column: self.pokemonTableView.setColumnHidden(column, not checked))
+            header.addAction(action)
+        header.setSortIndicator(PokemonTableModel.NUMBER, Qt.SortOrder.AscendingOrder)
+        self.pokemonTableView.setSortingEnabled(True)
+
+        self.update_table_language()
+        if self.proxy_model.rowCount() > 0:
+            saved_row = self.pokedex.row(self.settings.get('pokemon_id'))
+            if saved_row is None:
+                first_index = self.proxy_model.index(0, 0)
+            else:
+                first_index = self.proxy_model.index_for_pokedex_row(saved_row)
             self.pokemonTableView.setCurrentIndex(first_index)
             self.update_ui_with_selected_pokemon(first_index)
-            
-        self.pokemonTableView.selectionModel().currentChanged.connect(self.on_table_selection_changed)
 
-    def load_language_setting(self):
-        """Load the saved language setting."""
-        try:
-            with open('settings.json', 'r') as f:
-                settings = json.load(f)
-                return settings.get('language', 'en')
-        except FileNotFoundError:
-            return 'en'
-
-    def save_language_setting(self, language):
-        """Save the current language setting."""
-        settings = {'language': language}
-        with open('settings.json', 'w') as f:
-            json.dump(settings, f, indent=4)
+    def update_table_language(self):
+        """Show names in the current language and rebuild the search index for it."""
+        self.table_model.set_names(self.pokedex.names(self.current_language))
+        if self.search_index is not None:
+            self.update_search_index()
+
+    def update_search_index(self):
+        """Build the search index for the current language and re-run the search."""
+        from search_index import SearchIndex
+        self.search_index = SearchIndex(self.pokedex, self.current_language, previous=self.search_index)
+        QTimer.singleShot(0, self.search_index.warm_up)
+        self.filter_table(self.searchBar.text())
+
+    def restore_settings(self):
+        """Restore the shiny toggle, search text and window geometry saved by the last session.
+
+        Runs before the signals are connected and before the search index
+        exists, so nothing is recomputed; the search is applied once the
+        index has been built.
+        """
+        self.shinyCheckbox.setChecked(self.show_shiny)
+        self.searchBar.setText(self.settings.get('search', ''))
+        geometry = self.settings.get('geometry')
+        if geometry:
+            self.restoreGeometry(QByteArray.fromBase64(geometry.encode('ascii')))
+
+    def closeEvent(self, event):
+        """Save the window geometry and write any pending settings before closing."""
+        self.settings.update(geometry=bytes(self.saveGeometry().toBase64()).decode('ascii'))
+        self.settings.flush()
+        super().closeEvent(event)
 
     def update_ui_with_selected_pokemon(self, index):
         """Update the UI with details of the selected Pokémon."""
-        model = self.pokemonTableView.model()
-        item = model.itemFromIndex(index)
-        pokemon_index = index.row() + 1
-        pokemon_name = item.text()
+        if not index.isValid():
+            return
+        row = self.proxy_model.pokedex_row(index)
+        self.displayed_row = row
+        pokemon_name = self.table_model.names.get(row, 'N/A')
         self.pokemonLabel.setText(pokemon_name)
-        pokemon_details = self.data.get(f"pokemon_{pokemon_index}", {})
-        self.update_abilities(pokemon_details.get('abilities', []))
-        self.update_types(pokemon_details.get('types', []))
-        self.update_stats(pokemon_details.get('stats', []))
-        self.load_and_display_sprite(pokemon_details.get('sprite_path', ''))
-        self.display_description(pokemon_details.get('descriptions', {}))
-        national_pokedex_number = pokemon_details.get('national_pokedex_number', 'N/A')
-        self.dexLabel.setText(f"N. {national_pokedex_number}")
-
-        gender_rate = pokemon_details.get('gender_rate', None)
-        if gender_rate:
-            female_rate = gender_rate['female']
+        record = self.pokedex.record(row, self.current_language)
+        self.settings.update(pokemon_id=record.pokemon_id)
+        self.update_abilities(record.abilities)
+        self.update_types(record.types)
+        self.update_stats(row)
+        self.update_weaknesses(row)
+        self.update_similar(row)
+        self.load_and_display_sprite(self.sprite_path(row))
+        self.prefetch_neighbors(index)
+        self.display_description(row)
+        self.dexLabel.setText(f"N. {record.dex_number}")
+
+        female_rate = record.female_rate()
+        if female_rate is not None:
             male_rate = 100 - female_rate
-            self.genderBar.setValue(int(male_rate))
+            self.set_bar_value(self.genderBar, int(male_rate))
             self.genderBar.setTextVisible(False)
             self.maleLabel.setText(f"♂ {male_rate:.1f}%")
             self.femaleLabel.setText(f"♀ {female_rate:.1f}%")
         else:
-            self.genderBar.setValue(0)
+            self.set_bar_value(self.genderBar, 0)
             self.maleLabel.setText("Genderless")
             self.femaleLabel.setText("")
 
-    def display_description(self, descriptions):
-        """Display Pokémon description based on current language."""
-        description = descriptions.get(self.current_language, 'Description not available')
-        wrapped_description = self.wrap_text(description, max_chars_per_line=40)
-        self.descLabel.setText(wrapped_description)
+    def update_similar(self, row):
+        """List the Pokémon closest to the selected one by stats, types and abilities."""
+        self.similarList.clear()
+        if self.analytics is None:
+            return
+        for similar_row in self.analytics.similar(row):
+            item = QtWidgets.QListWidgetItem(self.table_model.names.get(similar_row, 'N/A'))
+            item.setData(Qt.ItemDataRole.UserRole, similar_row)
+            item.setToolTip(f"N. {self.pokedex.dex_number[similar_row]}  {self.table_model.type_text(similar_row)}  "
+                            f"Total {self.analytics.totals[similar_row]}")
+            self.similarList.addItem(item)
+
+    def select_similar_pokemon(self, item):
+        """Select the Pokémon of a Similar item, clearing the search if it hides it."""
+        row = item.data(Qt.ItemDataRole.UserRole)
+        index = self.proxy_model.index_for_pokedex_row(row)
+        if not index.isValid():
+            self.searchBar.clear()
+            index = self.proxy_model.index_for_pokedex_row(row)
+        self.pokemonTableView.setCurrentIndex(index)
+        self.pokemonTableView.scrollTo(index)
+
+    def display_description(self, row):
+        """List the flavor text versions of a row in the current language and show the first one."""
+        self.flavor_texts = self.pokedex.flavor_texts(row, self.current_language)
+        self.flavorComboBox.blockSignals(True)
+        self.flavorComboBox.clear()
+        self.flavorComboBox.addItems([version_label(versions) for versions, _ in self.flavor_texts])
+        self.flavorComboBox.blockSignals(False)
+        self.flavorComboBox.setVisible(len(self.flavor_texts) > 1)
+        self.show_flavor_text()
+
+    def show_flavor_text(self):
+        """Show the flavor text picked in the version box, laid out for the width of the label."""
+        if not self.flavor_texts:
+            self.descLabel.setText('Description not available')
+            return
+        version = max(0, self.flavorComboBox.currentIndex())
+        width = max(self.descLabel.minimumWidth(), self.descLabel.contentsRect().width())
+        key = (self.displayed_row, self.current_language, version)
+        self.descLabel.setText(self.text_layouts.wrap(key, self.flavor_texts[version][1], width))
+
+    def resizeEvent(self, event):
+        super().resizeEvent(event)
+        if self.displayed_row is not None:
+            self.show_flavor_text()
+
+    def sprite_path(self, row):
+        """Sprite shown for a Pokédex row, honouring the shiny toggle."""
+        sprite_path = self.pokedex.sprite_paths[row]
+        if self.show_shiny and self.pokedex.flags[row] & FLAG_SHINY:
+            sprite_path = sprite_path.replace('.png', '_shiny.png')
+        return sprite_path
 
     def load_and_display_sprite(self, sprite_path):
         """Load and display Pokémon sprite based on shiny toggle."""
-        if self.show_shiny:
-            shiny_sprite_path = sprite_path.replace('.png', '_shiny.png')
-            if os.path.exists(shiny_sprite_path):
-                sprite_path = shiny_sprite_path
-
-        if sprite_path and os.path.exists(sprite_path):
-            pixmap = QPixmap(sprite_path)
-            if not pixmap.isNull():
-                pixmap = pixmap.scaled(384, 384)
-                self.spriteLabel.setPixmap(pixmap)
-            else:
-                print(f"Failed to load pixmap from {sprite_path}")
-        else:
-            print(f"Sprite file not found: {sprite_path}")
+        if not sprite_path:
+            self.wanted_pixmaps.pop(self.spriteLabel, None)
+            self.spriteLabel.clear()
+            return
+        self.show_pixmap(self.spriteLabel, sprite_path, SPRITE_SCALE)
+
+    def prefetch_neighbors(self, index):
+        """Decode the sprites of the rows around index ahead of time."""
+        for offset in range(1, PREFETCH_DISTANCE + 1):
+            for row in (index.row() + offset, index.row() - offset):
+                if 0 <= row < self.proxy_model.rowCount():
+                    sprite_path = self.sprite_path(self.proxy_model.pokedex_row(self.proxy_model.index(row, 0)))
+                    if sprite_path:
+                        self.pixmap_cache.prefetch(sprite_path, SPRITE_SCALE)
+
+    def show_pixmap(self, label, path, scale):
+        """Show a cached pixmap on label, or show it once it has been decoded.
+
+        A decode that finishes after the label was asked for another image
+        is ignored.
+        """
+        self.wanted_pixmaps[label] = path
+
+        def show(pixmap):
+            if self.wanted_pixmaps.get(label) == path:
+                label.setPixmap(pixmap)
+
+        self.pixmap_cache.request(path, scale, show)
 
     def update_abilities(self, abilities):
-        """Update the abilities display for the selected Pokémon."""
-        ability_labels = [self.findChild(QtWidgets.QLabel, 'ability1Label'),
-                          self.findChild(QtWidgets.QLabel, 'ability2Label'),
-                          self.findChild(QtWidgets.QLabel, 'ability3Label')]
+        """Update the abilities display for the selected Pokémon from its interned ability ids."""
+        ability_labels = self.ability_labels
 
         for i in range(3):
             if i < len(abilities):
-                ability_name = abilities[i]
-                ability_info = self.abilities.get(ability_name, {})
-                ability_display_name = ability_info.get(self.current_language, 'N/A')
+                ability_name = self.pokedex.ability_keys[abilities[i]]
+                ability_display_name = self.abilities.get(ability_name, 'N/A')
+                tooltip = self.ability_tooltip(ability_name)
             else:
                 ability_display_name = ''
+                tooltip = ''
 
             ability_labels[i].setText(ability_display_name)
+            ability_labels[i].setToolTip(tooltip)
             ability_labels[i].setVisible(True)
 
         for j in range(len(abilities), 3):
             ability_labels[j].setText('')
             ability_labels[j].setVisible(False)
 
+    def ability_tooltip(self, ability):
+        """List the other Pokémon that can have an ability, from the analytics' ability index."""
+        if self.analytics is None:
+            return ''
+        rows = [row for row in self.analytics.rows_with_ability(ability).tolist() if row != self.displayed_row]
+        if not rows:
+            return "No other Pokémon has this ability"
+        names = [self.table_model.names.get(row, 'N/A') for row in rows[:ABILITY_TOOLTIP_NAMES]]
+        if len(rows) > ABILITY_TOOLTIP_NAMES:
+            names.append(f"and {len(rows) - ABILITY_TOOLTIP_NAMES} more")
+        return f"Shared with {len(rows)} Pokémon:\n" + '\n'.join(names)
+
     def update_types(self, types):
-        """Update the type images for the selected Pokémon."""
-        type_labels = [self.type1Label, self.type2Label]
+        """Update the type images for the selected Pokémon from its interned type ids."""
+        type_labels = self.type_labels
         for i in range(2):
             if i < len(types):
-                type_image_path = f"types/{types[i]}.png"
+                type_image_path = f"types/{self.pokedex.type_names[types[i]]}.png"
                 self.load_and_display_types(type_image_path, type_labels[i])
                 type_labels[i].setVisible(True)
             else:
                 type_labels[i].setVisible(False)
 
-    def update_stats(self, stats):
-        """Update the stats display for the selected Pokémon."""
-        for (bar_name, label_name), stat in zip(self.stat_components, stats):
-            stat_name = next(iter(stat))
-            base_stat = stat[stat_name]
-            bar = self.findChild(QtWidgets.QProgressBar, bar_name)
-            label = self.findChild(QtWidgets.QLabel, label_name)
-            
+    def update_stats(self, row):
+        """Update the stats display for the selected Pokémon, with rankings once the analytics are loaded."""
+        analytics = self.analytics
+        stat_count = len(self.stat_widgets)
+        stats = self.pokedex.stats[row * stat_count:(row + 1) * stat_count]
+        for stat, (bar, label, rank_label) in enumerate(self.stat_widgets):
+            stat_name = self.pokedex.stat_names[stat]
+            base_stat = stats[stat]
             label.setText(f"{base_stat}")
-            bar.setValue(base_stat)
-            bar.setToolTip(f"{stat_name}: {base_stat}")
+            self.set_bar_value(bar, base_stat)
             bar.setVisible(True)
+            if analytics is None:
+                rank_label.setText('')
+                bar.setToolTip(f"{stat_name}: {base_stat}")
+                continue
+            top = analytics.top_percent(row, stat)
+            rank_label.setText(f"top {top:.0f}%" if top >= 1 else f"top {top:.1f}%")
+            bar.setToolTip(f"{stat_name}: {base_stat}, top {top:.1f}% "
+                           f"(total {analytics.totals[row]}, top {analytics.top_percent(row, stat_count):.1f}%)")
+
+    def set_bar_value(self, bar, value):
+        """Set a progress bar's value without the synchronous repaint QProgressBar.setValue may do."""
+        bar.setUpdatesEnabled(False)
+        bar.setValue(value)
+        bar.setUpdatesEnabled(True)
+
+    def update_weaknesses(self, row):
+        """Show the types the selected Pokémon takes extra damage from."""
+        if self.analytics is None:
+            self.weaknessLabel.setText('')
+            return
+        weaknesses = ', '.join(f"{name.capitalize()} ×{multiplier:g}"
+                               for name, multiplier in self.analytics.weaknesses(row))
+        resistances = ', '.join(f"{name.capitalize()} ×{multiplier:g}"
+                                for name, multiplier in self.analytics.resistances(row))
+        self.weaknessLabel.setText(f"Weak to: {weaknesses or 'nothing'}")
+        self.weaknessLabel.setToolTip(f"Resists: {resistances or 'nothing'}")
 
     def load_and_display_types(self, image_path, label):
         """Load an image from the given path and display it on the label."""
-        pixmap = QPixmap(image_path)
-        if not pixmap.isNull():
-            pixmap = pixmap.scaled(64, 64)
-            label.setPixmap(pixmap)
-            label.setAlignment(Qt.AlignmentFlag.AlignCenter)
-            label.setScaledContents(False)
-        else:
-            print(f"Failed to load image from path: {image_path}")
+        label.setAlignment(Qt.AlignmentFlag.AlignCenter)
+        label.setScaledContents(False)
+        self.show_pixmap(label, image_path, TYPE_ICON_SCALE)
 
     def toggle_shiny_sprite(self, checked):
         """Toggle between showing normal and shiny sprites."""
         self.show_shiny = checked
-        self.update_ui_with_selected_pokemon(self.pokemonTableView.currentIndex())
+        self.settings.update(shiny=checked)
+        if self.displayed_row is not None:
+            self.load_and_display_sprite(self.sprite_path(self.displayed_row))
+            self.prefetch_neighbors(self.pokemonTableView.currentIndex())
 
     def on_table_selection_changed(self, current, previous):
         """Handle selection change to update UI with selected Pokémon."""
+        if current.isValid() and self.proxy_model.pokedex_row(current) == self.displayed_row:
+            return
         self.update_ui_with_selected_pokemon(current)
 
     def select_random_pokemon(self):
-        """Select a random Pokémon from the table view."""
+        """Select a random Pokémon among the rows the search leaves visible."""
         model = self.pokemonTableView.model()
         row_count = model.rowCount()
 
@@ -346,15 +743,23 @@ class PokemonApp(QtWidgets.QMainWindow):
             print("No Pokémon available to select.")
             return
 
-        random_row = random.randint(0, row_count - 1)
-        random_index = model.index(random_row, 0)
+        random_index = model.index(random.randrange(row_count), 0)
         self.pokemonTableView.setCurrentIndex(random_index)
         self.pokemonTableView.scrollTo(random_index)
-        self.update_ui_with_selected_pokemon(random_index)
 
         
 if __name__ == "__main__":
+    profile_path = instrumentation.from_args(sys.argv)
+    recorder = None
+    if profile_path:
+        recorder = instrumentation.Recorder()
+        recorder.count_file_opens()
+        instrumentation.instrument(PokemonApp, INSTRUMENTED_HANDLERS, recorder)
     app = QtWidgets.QApplication(sys.argv)
-    window = PokemonApp()
+    window = PokemonApp(recorder, profile_path)
     window.show()
-    sys.exit(app.exec())
+    exit_code = app.exec()
+    window.settings.close()
+    if recorder is not None:
+        window.dump_profile()
+    sys.exit(exit_code)
@@ -0,0 +1,182 @@
+"""Headless queries against the compiled Pokédex, for scripts and pipelines.
+
+Queries use the search syntax of the QDex search bar: names in any
+language, type:, ability:, #number and stat comparisons such as speed>=100.
+
+    python qdex_cli.py "type:fire total>=600"
+    python qdex_cli.py --language fr --format csv bulbi
+    python qdex_cli.py --batch --format json < queries.txt
+
+With --batch every line of stdin is a query, answered against an index
+loaded once; JSON output is then one JSON line per query. The same lookups
+are available in Python:
+
+    from qdex_cli import Pokedex
+    dex = Pokedex(language='fr')
+    dex.query('type:dragon spe>100')
+"""
+import argparse
+import csv
+import json
+import os
+import sys
+
+from pokedex_format import MAX_ABILITIES, MAX_TYPES, NO_ABILITY, NO_TYPE, PokedexReader
+from search_index import SearchIndex
+
+BASE_DIR = os.path.dirname(os.path.abspath(sys.executable if getattr(sys, 'frozen', False) else __file__))
+DATA_DIR = os.path.join(BASE_DIR, 'data')
+DEFAULT_LANGUAGE = 'en'
+FORMATS = ('text', 'json', 'csv')
+
+
+class Pokedex:
+    """The compiled Pokédex with search indexes built per language on first use, without Qt.
+
+    Methods taking a language default to the one given at construction.
+    """
+
+    def __init__(self, data_dir=DATA_DIR, language=DEFAULT_LANGUAGE):
+        self.reader = PokedexReader(data_dir)
+        self.indexes = {}
+        self.language = language
+        self.index(language)
+
+    def index(self, language=None):
+        """The search index of a language. Indexes share their language-independent parts."""
+        language = language or self.language
+        index = self.indexes.get(language)
+        if index is None:
+            if language not in self.reader.languages:
+                raise KeyError(f"No language shard for {language!r}")
+            previous = next(iter(self.indexes.values()), None)
+            index = self.indexes[language] = SearchIndex(self.reader, language, previous=previous)
+        return index
+
+    def search(self, query='', language=None):
+        """Rows matching a query, in Pokédex order. An empty query matches every row."""
+        rows = self.index(language).search(query)
+        return list(range(self.reader.count)) if rows is None else sorted(rows)
+
+    def entry(self, row, language=None):
+        """One row as a flat dict of plain values, with names in a language."""
+        reader, language = self.reader, language or self.language
+        width = len(reader.stat_names)
+        types = reader.types[row * MAX_TYPES:(row + 1) * MAX_TYPES]
+        abilities = reader.abilities[row * MAX_ABILITIES:(row + 1) * MAX_ABILITIES]
+        ability_names = reader.ability_names(language)
+        stats = reader.stats[row * width:(row + 1) * width]
+        entry = {
+            'id': reader.pokemon_id[row],
+            'dex_number': reader.dex_number[row],
+            'name': reader.names(language).get(row),
+            'species': reader.species[row],
+            'types': [reader.type_names[t] for t in types if t != NO_TYPE],
+            'abilities': [ability_names.get(reader.ability_keys[a], reader.ability_keys[a])
+                          for a in abilities if a != NO_ABILITY],
+        }
+        entry.update(zip(reader.stat_names, stats))
+        entry['total'] = sum(stats)
+        return entry
+
+    def query(self, query='', language=None):
+        """Entries matching a query, in Pokédex order."""
+        return [self.entry(row, language) for row in self.search(query, language)]
+
+
+def build_query(words, types=(), abilities=(), stats=()):
+    """Combine free text and option filters into one search query."""
+    terms = list(words)
+    terms += [f"type:{name}" for name in types]
+    terms += [f"ability:{name}" for name in abilities]
+    terms += list(stats)
+    return ' '.join(terms)
+
+
+class Writer:
+    """Writes result sets to a stream as text, JSON or CSV."""
+
+    def __init__(self, stream, output_format, fields, batch=False):
+        self.stream = stream
+        self.format = output_format
+        self.fields = fields
+        self.batch = batch
+        self.csv = None
+        if output_format == 'csv':
+            self.csv = csv.writer(stream, lineterminator='\n')
+            self.csv.writerow((['query'] if batch else []) + fields)
+
+    @staticmethod
+    def cell(value):
+        return '/'.join(value) if isinstance(value, list) else value
+
+    def write(self, query, entries):
+        if self.format == 'json':
+            if self.batch:
+                self.stream.write(json.dumps({'query': query, 'results': entries}, ensure_ascii=False) + '\n')
+            else:
+                json.dump(entries, self.stream, ensure_ascii=False, indent=4)
+                self.stream.write('\n')
+        elif self.format == 'csv':
+            for entry in entries:
+                self.csv.writerow(([query] if self.batch else []) + [self.cell(entry[f]) for f in self.fields])
+        else:
+            if self.batch:
+                self.stream.write(f"# {query}: {len(entries)} results\n")
+            for entry in entries:
+                self.stream.write('\t'.join(str(self.cell(entry[f])) for f in self.fields) + '\n')
+
+
+def parse_args(argv=None):
+    parser = argparse.ArgumentParser(description="Query the compiled QDex Pokédex without the GUI.")
+    parser.add_argument('query', nargs='*', help="search terms, as typed in the QDex search bar")
+    parser.add_argument('--language', '-l', default=DEFAULT_LANGUAGE, help="language of names and name search")
+    parser.add_argument('--type', '-t', action='append', default=[], help="only this type (repeatable)")
+    parser.add_argument('--ability', '-a', action='append', default=[], help="only this ability (repeatable)")
+    parser.add_argument('--stat', '-s', action='append', default=[],
+                        help="stat comparison such as 'speed>=100' or 'total<400' (repeatable)")
+    parser.add_argument('--format', '-f', choices=FORMATS, default='text', help="output format (default: text)")
+    parser.add_argument('--fields', help="comma-separated fields to output (default: all)")
+    parser.add_argument('--limit', type=int, default=None, help="at most this many results per query")
+    parser.add_argument('--batch', action='store_true',
+                        help="read one query per line from stdin; the options above apply to every query")
+    parser.add_argument('--data-dir', default=DATA_DIR, help="compiled Pokédex directory")
+    return parser.parse_args(argv)
+
+
+def main(argv=None):
+    args = parse_args(argv)
+    try:
+        dex = Pokedex(args.data_dir, args.language)
+    except (OSError, ValueError, KeyError) as e:
+        print(f"Error loading data: {e}", file=sys.stderr)
+        return 1
+
+    fields = list(dex.entry(0)) if dex.reader.count else []
+    if args.fields:
+        fields = [field.strip() for field in args.fields.split(',')]
+        unknown = [field for field in fields if field not in dex.entry(0)]
+        if unknown:
+            print(f"Unknown fields: {', '.join(unknown)}", file=sys.stderr)
+            return 2
+
+    writer = Writer(sys.stdout, args.format, fields, batch=args.batch)
+    queries = (line.strip() for line in sys.stdin) if args.batch else [' '.join(args.query)]
+    if args.batch:
+        dex.index().warm_up()
+    for text in queries:
+        if args.batch and not text:
+            continue
+        rows = dex.search(build_query([text], args.type, args.ability, args.stat))[:args.limit]
+        entries = [dex.entry(row) for row in rows]
+        writer.write(text, [{field: entry[field] for field in fields} for entry in entries])
+    return 0
+
+
+if __name__ == "__main__":
+    try:
+        sys.exit(main())
+    except BrokenPipeError:
+        # The reader of our output, such as head, exited early.
+        os.dup2(os.open(os.devnull, os.O_WRONLY), sys.stdout.fileno())
+        sys.exit(1)
@@ -0,0 +1,242 @@
+"""Read-only HTTP/JSON service over the compiled Pokédex, built on asyncio.
+
+    python qdex_server.py --port 8765
+
+The data is loaded once and every tool on the machine can share it:
+
+* ``GET /languages``                      available languages
+* ``GET /pokemon?q=type:fire&lang=fr``    entries matching a search query
+                                          (QDex search bar syntax, optional
+                                          limit), in Pokédex order
+* ``GET /pokemon/<id>?lang=fr``           one entry with its flavor text
+* ``GET /sprites/<id>.png``               sprite bytes; <id>_shiny.png for the
+                                          shiny sprite
+
+Responses are JSON except for sprites. Each carries a strong ETag, and
+If-None-Match is answered with 304 Not Modified. The data never changes
+while the server runs, so encoded responses are kept in an LRU keyed by
+the normalized request and served without touching the index again.
+"""
+import argparse
+import asyncio
+import hashlib
+import json
+import os
+import re
+import sys
+from collections import OrderedDict
+from urllib.parse import parse_qs, unquote, urlsplit
+
+from qdex_cli import DATA_DIR, DEFAULT_LANGUAGE, Pokedex
+from sprite_archive import SPRITE_ARCHIVE_FILE, SpriteArchive, sprite_key
+
+DEFAULT_HOST = '127.0.0.1'
+DEFAULT_PORT = 8765
+CACHE_ENTRIES = 4096
+MAX_HEADER_LINES = 100
+REASONS = {200: 'OK', 304: 'Not Modified', 400: 'Bad Request', 404: 'Not Found', 405: 'Method Not Allowed',
+           500: 'Internal Server Error'}
+NUMBER = re.compile(r'[0-9]+')
+
+
+class HttpError(Exception):
+    def __init__(self, status, message):
+        super().__init__(message)
+        self.status = status
+
+
+class Response:
+    """An encoded response body with its content type and ETag."""
+
+    __slots__ = ('status', 'content_type', 'body', 'etag')
+
+    def __init__(self, status, content_type, body):
+        self.status = status
+        self.content_type = content_type
+        self.body = body
+        self.etag = f'"{hashlib.sha1(body).hexdigest()}"'
+
+    @classmethod
+    def json(cls, data, status=200):
+        return cls(status, 'application/json; charset=utf-8', json.dumps(data, ensure_ascii=False).encode('utf-8'))
+
+
+class QDexService:
+    """Answers requests from a Pokedex loaded once, caching encoded responses."""
+
+    def __init__(self, data_dir=DATA_DIR, language=DEFAULT_LANGUAGE, cache_entries=CACHE_ENTRIES):
+        self.dex = Pokedex(data_dir, language)
+        # Requests may ask for any language; keep every shard loaded rather than cycling the LRU.
+        self.dex.reader.max_languages = len(self.dex.reader.languages)
+        self.data_dir = data_dir
+        self.cache_entries = cache_entries
+        self.cache = OrderedDict()
+        self.stats = {'requests': 0, 'cache_hits': 0, 'not_modified': 0}
+        try:
+            self.archive = SpriteArchive(os.path.join(data_dir, SPRITE_ARCHIVE_FILE))
+        except (OSError, ValueError) as e:
+            print(f"Sprite archive not available, reading sprite files: {e}")
+            self.archive = None
+
+    def warm_up(self):
+        """Build every language's search index ahead of the first request."""
+        for language in self.dex.reader.languages:
+            self.dex.index(language)
+        self.dex.index().warm_up()
+
+    def get(self, target):
+        """Response for a request target such as '/pokemon?q=pika', from the cache when possible."""
+        url = urlsplit(target)
+        params = {name: values[-1] for name, values in parse_qs(url.query).items()}
+        key = (url.path, tuple(sorted(params.items())))
+        response = self.cache.get(key)
+        if response is not None:
+            self.cache.move_to_end(key)
+            self.stats['cache_hits'] += 1
+            return response
+        try:
+            response = self.route(unquote(url.path), params)
+        except HttpError as e:
+            return Response.json({'error': str(e)}, e.status)
+        self.cache[key] = response
+        while len(self.cache) > self.cache_entries:
+            self.cache.popitem(last=False)
+        return response
+
+    def route(self, path, params):
+        parts = [part for part in path.split('/') if part]
+        if parts == ['languages']:
+            return Response.json(self.dex.reader.languages)
+        if parts == ['pokemon']:
+            return self.search(params)
+        if len(parts) == 2 and parts[0] == 'pokemon':
+            return Response.json(self.pokemon(self.row(parts[1]), self.language(params)))
+        if len(parts) == 2 and parts[0] == 'sprites' and parts[1].endswith('.png'):
+            name = parts[1][:-len('.png')]
+            shiny = name.endswith('_shiny')
+            return self.sprite(self.row(name[:-len('_shiny')] if shiny else name), shiny)
+        raise HttpError(404, f"No such resource: {path}")
+
+    def language(self, params):
+        language = params.get('lang', self.dex.language)
+        if language not in self.dex.reader.languages:
+            raise HttpError(404, f"No such language: {language}")
+        return language
+
+    def row(self, pokemon_id):
+        row = self.dex.reader.row(int(pokemon_id)) if NUMBER.fullmatch(pokemon_id) else None
+        if row is None:
+            raise HttpError(404, f"No Pokémon with ID {pokemon_id}")
+        return row
+
+    def search(self, params):
+        language = self.language(params)
+        limit = params.get('limit')
+        if limit is not None and not NUMBER.fullmatch(limit):
+            raise HttpError(400, "limit must be a non-negative integer")
+        rows = self.dex.search(params.get('q', ''), language)
+        if limit is not None:
+            rows = rows[:int(limit)]
+        return Response.json([self.dex.entry(row, language) for row in rows])
+
+    def pokemon(self, row, language):
+        entry = self.dex.entry(row, language)
+        entry['description'] = self.dex.reader.descriptions(language).get(row)
+        entry['sprite'] = f"/sprites/{entry['id']}.png" if self.dex.reader.sprite_paths[row] else None
+        return entry
+
+    def sprite(self, row, shiny):
+        path = self.dex.reader.sprite_paths[row]
+        if path and shiny:
+            path = path.replace('.png', '_shiny.png')
+        if self.archive is not None and path and sprite_key(path) in self.archive:
+            return Response(200, 'image/png', bytes(self.archive.read(path)))
+        try:
+            with open(os.path.join(os.path.dirname(os.path.abspath(self.data_dir)), path), 'rb') as f:
+                return Response(200, 'image/png', f.read())
+        except (OSError, TypeError):
+            raise HttpError(404, "No sprite for this Pokémon")
+
+    async def handle(self, reader, writer):
+        """Serve one connection, keeping it open between requests unless asked to close it."""
+        try:
+            while True:
+                request_line = await reader.readline()
+                if not request_line:
+                    break
+                headers = {}
+                for _ in range(MAX_HEADER_LINES):
+                    line = await reader.readline()
+                    if line in (b'\r\n', b'\n', b''):
+                        break
+                    name, _, value = line.decode('latin-1').partition(':')
+                    headers[name.strip().lower()] = value.strip()
+                try:
+                    method, target, version = request_line.decode('latin-1').split()
+                except ValueError:
+                    writer.write(self.encode(Response.json({'error': "Malformed request"}, 400), False, close=True))
+                    break
+                close = headers.get('connection', '').lower() == 'close' or version == 'HTTP/1.0'
+                if method not in ('GET', 'HEAD'):
+                    response = Response.json({'error': f"{method} is not supported"}, 405)
+                else:
+                    try:
+                        response = self.get(target)
+                    except Exception as e:
+                        print(f"Error handling {method} {target}: {e!r}", file=sys.stderr)
+                        response = Response.json({'error': "Internal server error"}, 500)
+                self.stats['requests'] += 1
+                writer.write(self.encode(response, method == 'HEAD', close, headers.get('if-none-match')))
+                await writer.drain()
+                if close:
+                    break
+        except (ConnectionError, asyncio.IncompleteReadError):
+            pass
+        finally:
+            writer.close()
+
+    def encode(self, response, head_only, close=False, if_none_match=None):
+        status, body = response.status, response.body
+        if status == 200 and if_none_match and response.etag in (tag.strip() for tag in if_none_match.split(',')):
+            self.stats['not_modified'] += 1
+            status, body = 304, b''
+        lines = [f"HTTP/1.1 {status} {REASONS[status]}", f"ETag: {response.etag}",
+                 f"Content-Length: {len(body)}", "Cache-Control: no-cache"]
+        if status != 304:
+            lines.append(f"Content-Type: {response.content_type}")
+        if close:
+            lines.append("Connection: close")
+        head = ('\r\n'.join(lines) + '\r\n\r\n').encode('latin-1')
+        return head if head_only or not body else head + body
+
+
+async def serve(service, host=DEFAULT_HOST, port=DEFAULT_PORT):
+    server = await asyncio.start_server(service.handle, host, port)
+    address = server.sockets[0].getsockname()
+    print(f"Serving {service.dex.reader.count} Pokémon on http://{address[0]}:{address[1]}", flush=True)
+    async with server:
+        await server.serve_forever()
+
+
+def parse_args(argv=None):
+    parser = argparse.ArgumentParser(description="Serve the compiled QDex Pokédex as read-only HTTP/JSON.")
+    parser.add_argument('--host', default=DEFAULT_HOST, help=f"address to listen on (default: {DEFAULT_HOST})")
+    parser.add_argument('--port', type=int, default=DEFAULT_PORT, help=f"port to listen on (default: {DEFAULT_PORT})")
+    parser.add_argument('--language', default=DEFAULT_LANGUAGE, help="language used when a request has no lang")
+    parser.add_argument('--cache-entries', type=int, default=CACHE_ENTRIES, help="responses kept in memory")
+    parser.add_argument('--data-dir', default=DATA_DIR, help="compiled Pokédex directory")
+    return parser.parse_args(argv)
+
+
+if __name__ == "__main__":
+    args = parse_args()
+    try:
+        service = QDexService(args.data_dir, args.language, args.cache_entries)
+    except (OSError, ValueError, KeyError) as e:
+        print(f"Error loading data: {e}", file=sys.stderr)
+        sys.exit(1)
+    service.warm_up()
+    try:
+        asyncio.run(serve(service, args.host, args.port))
+    except KeyboardInterrupt:
+        pass
@@ -0,0 +1,215 @@
+"""Accent-insensitive search over the compiled Pokédex.
+
+Queries are free text plus optional filters, all combined with AND:
+
+* ``type:fire``       rows with a type starting with "fire"
+* ``ability:levit``   rows with an ability whose name or key contains "levit"
+* ``#25`` or ``25``   rows with national Pokédex number 25
+* ``speed>=100``      rows whose base stat compares as given; stats are
+  hp, atk, def, spa, spd, spe (or their full names) and total, and the
+  operators are <, <=, =, >= and >
+
+Free text matches names as a substring, in the current language and in
+every other language (so "Bulbizarre" finds Bulbasaur in English).
+When nothing matches, names within a small edit distance of the query are
+returned instead.
+"""
+import operator
+import re
+from collections import defaultdict
+
+from unidecode import unidecode
+
+from pokedex_format import NO_ABILITY, NO_TYPE, MAX_ABILITIES, MAX_TYPES
+
+FUZZY_MIN_LENGTH = 4
+STAT_ALIASES = {'hp': 0, 'atk': 1, 'def': 2, 'spa': 3, 'spd': 4, 'spe': 5, 'total': None}
+STAT_TERM = re.compile(r'^([a-z-]+)(<=|>=|<|>|=)(\d+)$')
+DEX_NUMBER_TERM = re.compile(r'#?([0-9]+)')
+COMPARISONS = {'<': operator.lt, '<=': operator.le, '=': operator.eq, '>=': operator.ge, '>': operator.gt}
+
+
+def normalize(text):
+    """Fold text to lowercase ASCII so accents and scripts do not matter."""
+    return unidecode(text).lower().strip()
+
+
+def trigrams(text):
+    return {text[i:i + 3] for i in range(len(text) - 2)}
+
+
+def edit_distance(a, b, limit):
+    """Levenshtein distance between a and b, or limit + 1 once it exceeds limit."""
+    if abs(len(a) - len(b)) > limit:
+        return limit + 1
+    previous = list(range(len(b) + 1))
+    for i, char_a in enumerate(a, 1):
+        current = [i]
+        for j, char_b in enumerate(b, 1):
+            current.append(min(previous[j] + 1, current[j - 1] + 1, previous[j - 1] + (char_a != char_b)))
+        if min(current) > limit:
+            return limit + 1
+        previous = current
+    return previous[-1]
+
+
+class NameIndex:
+    """Normalized names with a trigram index, each name mapping to the rows it belongs to."""
+
+    def __init__(self):
+        self.names = defaultdict(set)
+        self.grams = defaultdict(set)
+
+    def add(self, name, row):
+        if not name:
+            return
+        if name not in self.names:
+            for gram in trigrams(name):
+                self.grams[gram].add(name)
+        self.names[name].add(row)
+
+    def candidates(self, query):
+        """Names that may contain query. Short queries fall back to every name."""
+        grams = trigrams(query)
+        if not grams:
+            return self.names.keys()
+        postings = sorted((self.grams.get(gram, ()) for gram in grams), key=len)
+        return set(postings[0]).intersection(*postings[1:])
+
+    def substring(self, query):
+        rows = set()
+        for name in self.candidates(query):
+            if query in name:
+                rows |= self.names[name]
+        return rows
+
+    def fuzzy(self, query):
+        """Rows whose name, or the start of it, is within a small edit distance of query."""
+        limit = 1 if len(query) < 7 else 2
+        grams = trigrams(query)
+        candidates = set()
+        for gram in grams:
+            candidates |= self.grams.get(gram, set())
+        rows = set()
+        for name in candidates:
+            if min(edit_distance(query, name, limit), edit_distance(query, name[:len(query)], limit)) <= limit:
+                rows |= self.names[name]
+        return rows
+
+
+class SearchIndex:
+    """Search index over one language, with lazy cross-language aliases.
+
+    The aliases and filter indexes do not depend on the language, so an index
+    built from a previous one for the same Pokédex reuses them.
+    """
+
+    def __init__(self, pokedex, language, previous=None):
+        self.pokedex = pokedex
+        self.language = language
+        self.primary = NameIndex()
+        for row, name in enumerate(pokedex.names(language)):
+            self.primary.add(normalize(name), row)
+        self.ability_names = {key: normalize(name) for key, name in pokedex.ability_names(language).items()}
+        self._aliases = None
+        self._by_type = None
+        self._by_ability = None
+        self._by_dex = None
+        if previous is not None and previous.pokedex is pokedex:
+            self._aliases = previous._aliases
+            self._by_type, self._by_ability, self._by_dex = previous._by_type, previous._by_ability, previous._by_dex
+
+    @property
+    def aliases(self):
+        """Names in every language, built on first use."""
+        if self._aliases is None:
+            self._aliases = NameIndex()
+            for language in self.pokedex.languages:
+                for row, name in enumerate(self.pokedex.language(language, cache=False).names):
+                    self._aliases.add(normalize(name), row)
+        return self._aliases
+
+    def warm_up(self):
+        """Build the lazy parts of the index ahead of the first query."""
+        self.aliases
+        self._build_filters()
+
+    def _build_filters(self):
+        if self._by_type is not None:
+            return
+        self._by_type = defaultdict(set)
+        self._by_ability = defaultdict(set)
+        self._by_dex = defaultdict(set)
+        pokedex = self.pokedex
+        for row in range(pokedex.count):
+            for type_id in pokedex.types[row * MAX_TYPES:(row + 1) * MAX_TYPES]:
+                if type_id != NO_TYPE:
+                    self._by_type[pokedex.type_names[type_id]].add(row)
+            for ability_id in pokedex.abilities[row * MAX_ABILITIES:(row + 1) * MAX_ABILITIES]:
+                if ability_id != NO_ABILITY:
+                    self._by_ability[pokedex.ability_keys[ability_id]].add(row)
+            self._by_dex[pokedex.dex_number[row]].add(row)
+
+    def search(self, query):
+        """Return the set of matching rows, or None when the query does not filter anything."""
+        text_terms, filters = [], []
+        for term in query.split():
+            lowered = term.lower()
+            stat = STAT_TERM.match(lowered)
+            number = DEX_NUMBER_TERM.fullmatch(lowered)
+            if lowered.startswith('type:'):
+                filters.append(self._match_type(normalize(term[5:])))
+            elif lowered.startswith('ability:'):
+                filters.append(self._match_ability(normalize(term[8:])))
+            elif stat and self._stat_column(stat.group(1)) != -1:
+                filters.append(self._match_stat(*stat.groups()))
+            elif number:
+                self._build_filters()
+                filters.append(self._by_dex.get(int(number.group(1)), set()))
+            else:
+                text_terms.append(term)
+
+        text = normalize(' '.join(text_terms))
+        if text:
+            filters.append(self._match_name(text))
+        if not filters:
+            return None
+        return set.intersection(*filters)
+
+    def _match_name(self, text):
+        rows = self.primary.substring(text) | self.aliases.substring(text)
+        if not rows and len(text) >= FUZZY_MIN_LENGTH:
+            rows = self.primary.fuzzy(text) | self.aliases.fuzzy(text)
+        return rows
+
+    def _stat_column(self, name):
+        """Column of a stat name or alias in the stats array, None for the total, -1 if unknown."""
+        if name in STAT_ALIASES:
+            return STAT_ALIASES[name]
+        stat_names = self.pokedex.stat_names
+        return stat_names.index(name) if name in stat_names else -1
+
+    def _match_stat(self, name, comparison, value):
+        column, compare, value = self._stat_column(name), COMPARISONS[comparison], int(value)
+        stats, width = self.pokedex.stats, len(self.pokedex.stat_names)
+        if column is None:
+            return {row for row in range(self.pokedex.count)
+                    if compare(sum(stats[row * width:(row + 1) * width]), value)}
+        return {row for row in range(self.pokedex.count) if compare(stats[row * width + column], value)}
+
+    def _match_type(self, text):
+        self._build_filters()
+        rows = set()
+        for type_name, type_rows in self._by_type.items():
+            if type_name.startswith(text):
+                rows |= type_rows
+        return rows
+
+    def _match_ability(self, text):
+        self._build_filters()
+        text = text.replace('-', ' ')
+        rows = set()
+        for key, ability_rows in self._by_ability.items():
+            if text in key.replace('-', ' ') or text in self.ability_names.get(key, '').replace('-', ' '):
+                rows |= ability_rows
+        return rows
@@ -0,0 +1,126 @@
+"""User settings kept in memory and saved to a per-user JSON file in the background.
+
+Updates only change the in-memory values and wake a writer thread, which
+waits until no update has arrived for a short delay, then writes the whole
+file once. Files are written to a temporary file in the same directory
+and renamed over the old one, so a crash never leaves a truncated file.
+
+The file lives in the platform's config directory (QDEX_SETTINGS
+overrides the path). On first run it starts from the settings.json
+shipped next to QDex, if there is one.
+"""
+import json
+import os
+import sys
+import threading
+import time
+
+from atomic_file import write_json_atomic
+
+ENV_VAR = 'QDEX_SETTINGS'
+SETTINGS_FILE = 'settings.json'
+DEFAULTS_FILE = os.path.join(os.path.dirname(os.path.abspath(sys.argv[0] if getattr(sys, 'frozen', False)
+                                                             else __file__)), SETTINGS_FILE)
+WRITE_DELAY = 0.5
+
+
+def config_dir():
+    """Per-user configuration directory of QDex."""
+    if sys.platform == 'win32':
+        return os.path.join(os.environ.get('APPDATA') or os.path.expanduser('~'), 'QDex')
+    if sys.platform == 'darwin':
+        return os.path.expanduser('~/Library/Application Support/QDex')
+    return os.path.join(os.environ.get('XDG_CONFIG_HOME') or os.path.expanduser('~/.config'), 'qdex')
+
+
+def settings_path():
+    return os.environ.get(ENV_VAR) or os.path.join(config_dir(), SETTINGS_FILE)
+
+
+def read_json(path):
+    try:
+        with open(path, 'r', encoding='utf-8') as f:
+            data = json.load(f)
+        return data if isinstance(data, dict) else {}
+    except (OSError, ValueError):
+        return {}
+
+
+class SettingsStore:
+    """Settings loaded once, with debounced writes on a background thread.
+
+    The lock is only held to change values or copy them; files are written
+    outside it so the GUI thread never waits on the disk.
+    """
+
+    def __init__(self, path=None, delay=WRITE_DELAY, defaults_path=DEFAULTS_FILE):
+        self.path = path or settings_path()
+        self.delay = delay
+        self.values = read_json(self.path) if os.path.exists(self.path) else read_json(defaults_path)
+        self.writes = 0
+        self._condition = threading.Condition()
+        self._write_lock = threading.Lock()
+        self._dirty_at = None
+        self._version = 0
+        self._written_version = 0
+        self._closed = False
+        self._thread = None
+
+    def get(self, key, default=None):
+        return self.values.get(key, default)
+
+    def update(self, **values):
+        """Change settings. They are written once no update has arrived for the write delay."""
+        with self._condition:
+            if all(self.values.get(key) == value for key, value in values.items()):
+                return
+            self.values.update(values)
+            self._version += 1
+            self._dirty_at = time.monotonic()
+            if self._thread is None:
+                self._thread = threading.Thread(target=self._run, name='settings-writer', daemon=True)
+                self._thread.start()
+            self._condition.notify()
+
+    def _run(self):
+        while True:
+            with self._condition:
+                while not self._closed and (self._dirty_at is None or time.monotonic() < self._dirty_at + self.delay):
+                    timeout = None if self._dirty_at is None else self._dirty_at + self.delay - time.monotonic()
+                    self._condition.wait(timeout)
+                if self._closed:
+                    return
+                snapshot = self._take_snapshot()
+            self._write(*snapshot)
+
+    def _take_snapshot(self):
+        self._dirty_at = None
+        return self._version, dict(self.values)
+
+    def _write(self, version, values):
+        with self._write_lock:
+            if version <= self._written_version:
+                return
+            try:
+                write_json_atomic(self.path, values)
+                self._written_version = version
+                self.writes += 1
+            except OSError as e:
+                print(f"Error saving settings to {self.path}: {e}")
+
+    def flush(self):
+        """Write pending changes now, on the calling thread."""
+        with self._condition:
+            if self._dirty_at is None:
+                return
+            snapshot = self._take_snapshot()
+        self._write(*snapshot)
+
+    def close(self):
+        """Write pending changes and stop the writer thread."""
+        self.flush()
+        with self._condition:
+            self._closed = True
+            self._condition.notify()
+        if self._thread is not None:
+            self._thread.join()
@@ -1,6 +1,7 @@
 from cx_Freeze import setup, Executable
 import sys
 import os
+from build_ui import build_ui
 
 build_dir = "build/QDex"
 base = None
@@ -10,12 +11,17 @@ if sys.platform == "win32":
     system_icon = "icons/icon.ico"
 
 build_exe_options = {
-    "include_files": ["design.ui", "icons/", "sprites/", "font/", "types/", "abilities.json", "settings.json", "pokemon_details.json"],
+    "include_files": ["icons/", "font/", "types/", "data/", "settings.json"],
     "build_exe": build_dir
 }
 
+# Ship the compiled design_ui module instead of parsing design.ui at start-up.
+build_ui()
+
 executables = [
-    Executable("qdex.py", base=base, icon=system_icon)
+    Executable("qdex.py", base=base, icon=system_icon),
+    # Console build of the headless query tool.
+    Executable("qdex_cli.py", target_name="qdex-cli", icon=system_icon)
 ]
 
 setup(
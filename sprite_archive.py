@@ -0,0 +1,77 @@
+"""Single-file archive of the sprites referenced by the Pokédex.
+
+The archive is a QDEX container (see pokedex_format) with three sections:
+``paths``, a string table of sprite paths relative to the data root;
+``offsets``, count + 1 u32 offsets into ``images``; and ``images``, the
+PNG files concatenated in Pokédex order, each normal sprite followed by its
+shiny variant, then the type icons. The header's ``prescale`` maps a
+top-level directory such as ``sprites`` to the factor its images were
+scaled up by when the archive was built. Readers memory-map the file and
+hand out zero-copy slices.
+"""
+import os
+import struct
+
+from pokedex_format import Container, encode_strings, write_container
+
+SPRITE_ARCHIVE_FILE = 'sprites.bin'
+
+
+def sprite_key(path):
+    """Normalize a sprite path such as './sprites/pokemon_1.png' to an archive key."""
+    return os.path.normpath(path).replace(os.sep, '/')
+
+
+def sprite_sources(store, base_dir='.'):
+    """Archive keys of the normal and shiny sprites of every record of a PokedexStore found under base_dir."""
+    keys = {}
+    for record in store:
+        if not record.sprite_path:
+            continue
+        for path in (record.sprite_path, record.sprite_path.replace('.png', '_shiny.png')):
+            key = sprite_key(path)
+            if key not in keys and os.path.exists(os.path.join(base_dir, key)):
+                keys[key] = None
+    return list(keys)
+
+
+def write_sprite_archive(output_path, images, prescale=None):
+    """Write images, a dict of archive keys to encoded bytes, to output_path. Returns their total size."""
+    offsets = [0]
+    for blob in images.values():
+        offsets.append(offsets[-1] + len(blob))
+    write_container(output_path, {'count': len(images), 'prescale': prescale or {}}, {
+        'paths': encode_strings(list(images)),
+        'offsets': struct.pack(f'<{len(offsets)}I', *offsets),
+        'images': b''.join(images.values()),
+    })
+    return offsets[-1]
+
+
+class SpriteArchive:
+    """Memory-mapped sprite archive. Reads are thread-safe and do not copy."""
+
+    def __init__(self, path):
+        container = Container(path)
+        self.count = container.header['count']
+        self.prescales = container.header.get('prescale', {})
+        self.offsets = container.section('offsets').cast('I')
+        self.images = container.section('images')
+        self.index = {path: i for i, path in enumerate(container.strings('paths'))}
+
+    def __contains__(self, path):
+        return sprite_key(path) in self.index
+
+    def __len__(self):
+        return self.count
+
+    def prescale(self, path):
+        """Factor the archived image of path was scaled up by."""
+        return self.prescales.get(sprite_key(path).split('/', 1)[0], 1)
+
+    def read(self, path):
+        """Encoded image data for a sprite path, or None if it is not in the archive."""
+        i = self.index.get(sprite_key(path))
+        if i is None:
+            return None
+        return self.images[self.offsets[i]:self.offsets[i + 1]]
@@ -0,0 +1,135 @@
+"""Bounded cache of scaled pixmaps, decoded off the GUI thread.
+
+Sprites are shown at four times their size; decoding and scaling one takes a
+few milliseconds, which is enough to make the table stutter when the
+selection moves quickly. The cache keeps recently shown pixmaps and lets
+callers prefetch the ones they expect to need next. Images found in a
+SpriteArchive are decoded straight from its memory map; anything else is
+read from disk. Images are requested at a scale factor relative to their
+source files, and only scaled by whatever the archive did not pre-scale.
+"""
+from collections import OrderedDict
+
+from PyQt6.QtCore import QObject, QRunnable, QThreadPool, Qt, pyqtSignal
+from PyQt6.QtGui import QImage, QPixmap
+
+DEFAULT_BUDGET = 24 * 1024 * 1024
+SPRITE_SCALE = 4
+TYPE_ICON_SCALE = 1
+
+
+class _DecodeSignals(QObject):
+    decoded = pyqtSignal(object, QImage, bool)
+
+
+class _DecodeTask(QRunnable):
+    """Decode and scale one image on a worker thread."""
+
+    def __init__(self, key, load, signals):
+        super().__init__()
+        self.key = key
+        self.load = load
+        self.signals = signals
+
+    def run(self):
+        path, scale = self.key
+        image, prescale, from_file = self.load(path)
+        if not image.isNull() and scale != prescale:
+            image = image.scaled(image.width() * scale // prescale, image.height() * scale // prescale,
+                                 Qt.AspectRatioMode.IgnoreAspectRatio, Qt.TransformationMode.FastTransformation)
+        self.signals.decoded.emit(self.key, image, from_file)
+
+
+class PixmapCache(QObject):
+    """LRU cache of scaled pixmaps, bounded by their size in bytes.
+
+    Images are decoded and scaled on a QThreadPool and only converted to a
+    QPixmap once they are back on the GUI thread. Callbacks waiting for the
+    same image are coalesced into a single decode.
+    """
+
+    failed = pyqtSignal(str)
+
+    def __init__(self, budget=DEFAULT_BUDGET, pool=None, archive=None, parent=None):
+        super().__init__(parent)
+        self.budget = budget
+        self.archive = archive
+        self.pool = pool or QThreadPool.globalInstance()
+        self.cost = 0
+        self.stats = {'hits': 0, 'misses': 0, 'decoded': 0, 'file_reads': 0, 'failed': 0}
+        self._pixmaps = OrderedDict()
+        self._pending = {}
+        self._signals = _DecodeSignals(self)
+        self._signals.decoded.connect(self._on_decoded)
+
+    @staticmethod
+    def key(path, scale):
+        return (path, scale)
+
+    def get(self, path, scale):
+        """Return the cached pixmap for path at scale, or None."""
+        key = self.key(path, scale)
+        pixmap = self._pixmaps.get(key)
+        if pixmap is not None:
+            self._pixmaps.move_to_end(key)
+        return pixmap
+
+    def request(self, path, scale, callback=None):
+        """Deliver the pixmap to callback, right away if cached, otherwise once decoded."""
+        pixmap = self.get(path, scale)
+        self.stats['hits' if pixmap is not None else 'misses'] += 1
+        if pixmap is not None:
+            if callback is not None:
+                callback(pixmap)
+            return
+        key = self.key(path, scale)
+        callbacks = self._pending.get(key)
+        if callbacks is None:
+            self._pending[key] = callbacks = []
+            self.pool.start(_DecodeTask(key, self.load_image, self._signals))
+        if callback is not None:
+            callbacks.append(callback)
+
+    def load_image(self, path):
+        """Decode the image at path as stored. Returns it with the factor it was pre-scaled by and
+        whether it was read from a file rather than the archive.
+
+        Runs on worker threads, so it leaves the stats alone; _on_decoded counts file reads on the GUI thread.
+        """
+        data = self.archive.read(path) if self.archive is not None else None
+        if data is None:
+            return QImage(path), 1, True
+        return QImage.fromData(data), self.archive.prescale(path), False
+
+    def prefetch(self, path, scale):
+        """Decode an image ahead of time so a later request is served from the cache."""
+        self.request(path, scale)
+
+    def _on_decoded(self, key, image, from_file):
+        callbacks = self._pending.pop(key, [])
+        self.stats['decoded'] += 1
+        self.stats['file_reads'] += from_file
+        if image.isNull():
+            self.stats['failed'] += 1
+            self.failed.emit(key[0])
+            return
+        pixmap = QPixmap.fromImage(image)
+        self._insert(key, pixmap)
+        for callback in callbacks:
+            callback(pixmap)
+
+    def hit_rate(self):
+        """Share of requests served from the cache, prefetches included."""
+        requests = self.stats['hits'] + self.stats['misses']
+        return self.stats['hits'] / requests if requests else 0.0
+
+    def _insert(self, key, pixmap):
+        self._pixmaps[key] = pixmap
+        self.cost += self._cost(pixmap)
+        while self.cost > self.budget and len(self._pixmaps) > 1:
+            _, evicted = self._pixmaps.popitem(last=False)
+            self.cost -= self._cost(evicted)
+
+    @staticmethod
+    def _cost(pixmap):
+        return pixmap.width() * pixmap.height() * max(pixmap.depth(), 8) // 8
@@ -0,0 +1,73 @@
+"""Sprite processing stage run by update_data.py before sprites are archived.
+
+Every image has its fully transparent border trimmed and is re-encoded as
+PNG at maximum compression, keeping the original bytes when that is not
+smaller. Optionally images are pre-scaled by an integer factor with
+nearest-neighbour sampling. Only QtGui's QImage is used, which needs no
+QApplication, so images are processed in a pool of worker processes.
+"""
+import os
+from concurrent.futures import ProcessPoolExecutor
+
+import numpy as np
+from PyQt6.QtCore import QBuffer, QByteArray, QIODevice, QRect, Qt
+from PyQt6.QtGui import QImage
+
+PNG_MAX_COMPRESSION = 0  # QImage.save quality; 0 is the smallest PNG.
+
+
+def opaque_rect(image):
+    """Bounding rectangle of the pixels that are not fully transparent, or None if there are none."""
+    argb = image.convertToFormat(QImage.Format.Format_ARGB32)
+    bits = argb.constBits()
+    bits.setsize(argb.sizeInBytes())
+    pixels = np.frombuffer(bits, dtype=np.uint32).reshape(argb.height(), argb.bytesPerLine() // 4)
+    ys, xs = np.nonzero(pixels[:, :argb.width()] >> 24)
+    if not len(xs):
+        return None
+    return QRect(int(xs.min()), int(ys.min()), int(xs.max() - xs.min() + 1), int(ys.max() - ys.min() + 1))
+
+
+def encode_png(image):
+    data = QByteArray()
+    buffer = QBuffer(data)
+    buffer.open(QIODevice.OpenModeFlag.WriteOnly)
+    image.save(buffer, 'PNG', PNG_MAX_COMPRESSION)
+    return bytes(data)
+
+
+def process_image(data, scale=1):
+    """Trim, recompress and scale one encoded image. Returns PNG bytes, or data if it cannot be decoded."""
+    image = QImage.fromData(data)
+    if image.isNull():
+        return data
+    rect = opaque_rect(image)
+    trimmed = rect is not None and rect != image.rect()
+    if trimmed:
+        image = image.copy(rect)
+    if scale != 1:
+        image = image.scaled(image.width() * scale, image.height() * scale, Qt.AspectRatioMode.IgnoreAspectRatio,
+                             Qt.TransformationMode.FastTransformation)
+    encoded = encode_png(image)
+    if not trimmed and scale == 1 and len(data) <= len(encoded):
+        return data
+    return encoded
+
+
+def _process_file(job):
+    path, scale = job
+    with open(path, 'rb') as f:
+        data = f.read()
+    return len(data), process_image(data, scale)
+
+
+def process_files(base_dir, scales, workers=None):
+    """Process the images named by scales, a dict of archive keys to scale factors, relative to base_dir.
+
+    Returns the processed images by key and the total size of the source files.
+    """
+    jobs = [(os.path.join(base_dir, key), scale) for key, scale in scales.items()]
+    with ProcessPoolExecutor(max_workers=workers) as executor:
+        results = list(executor.map(_process_file, jobs, chunksize=32))
+    images = {key: data for key, (_, data) in zip(scales, results)}
+    return images, sum(size for size, _ in results)
@@ -0,0 +1,62 @@
+"""Line breaking of flavor text with QTextLayout, cached by Pokémon, language and width.
+
+QTextLayout breaks lines by the Unicode line breaking rules and the real
+advances of the font, so text without spaces such as Chinese and Japanese
+wraps between characters, and punctuation stays off the start of a line.
+The result is the text with a newline at every break, which the label then
+shows as is. Layouts are kept in a small LRU, so selecting a Pokémon again
+or switching back to a language costs a dictionary lookup.
+"""
+from collections import OrderedDict
+
+from PyQt6.QtGui import QTextLayout, QTextOption
+
+LAYOUT_CACHE_ENTRIES = 512
+
+
+class TextLayoutCache:
+    """Wrapped text by (key, width) for one font, least recently used first."""
+
+    def __init__(self, font, max_entries=LAYOUT_CACHE_ENTRIES):
+        self.font = font
+        self.max_entries = max_entries
+        self.entries = OrderedDict()
+        self.option = QTextOption()
+        self.option.setWrapMode(QTextOption.WrapMode.WrapAtWordBoundaryOrAnywhere)
+        self.stats = {'hits': 0, 'misses': 0}
+
+    def set_font(self, font):
+        """Lay out with another font from now on, dropping the layouts made with the old one."""
+        self.font = font
+        self.entries.clear()
+
+    def wrap(self, key, text, width):
+        """text broken into lines no wider than width pixels. key names the text, e.g. (pokemon_id, language)."""
+        cache_key = (key, width)
+        wrapped = self.entries.get(cache_key)
+        if wrapped is not None:
+            self.entries.move_to_end(cache_key)
+            self.stats['hits'] += 1
+            return wrapped
+        self.stats['misses'] += 1
+        wrapped = self.entries[cache_key] = '\n'.join(self.lines(text, width))
+        while len(self.entries) > self.max_entries:
+            self.entries.popitem(last=False)
+        return wrapped
+
+    def lines(self, text, width):
+        # Qt positions count UTF-16 code units, which differ from str indices past the BMP.
+        utf16 = text.encode('utf-16-le')
+        layout = QTextLayout(text, self.font)
+        layout.setTextOption(self.option)
+        lines = []
+        layout.beginLayout()
+        while True:
+            line = layout.createLine()
+            if not line.isValid():
+                break
+            line.setLineWidth(width)
+            start = 2 * line.textStart()
+            lines.append(utf16[start:start + 2 * line.textLength()].decode('utf-16-le').rstrip())
+        layout.endLayout()
+        return lines
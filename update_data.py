@@ -1,51 +1,291 @@
+import argparse
 import json
 import os
+import re
+import shutil
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+
 import requests
+from requests.adapters import HTTPAdapter
+
+from atomic_file import write_json_atomic
+from http_cache import ResponseCache
+from pokedex_format import compile_pokedex
+from pokedex_store import PokedexStore, SchemaError
+from sprite_archive import SPRITE_ARCHIVE_FILE, sprite_sources, write_sprite_archive
+from sprite_processing import process_files
+from verify_data import PREVIOUS_SUFFIX
 
 BASE_DIR = os.path.dirname(os.path.abspath(__file__))
 SPRITES_DIR = os.path.join(BASE_DIR, 'sprites')
+CACHE_DIR = os.path.join(BASE_DIR, '.cache', 'http')
+API_BASE_URL = "https://pokeapi.co/api/v2"
+DEFAULT_WORKERS = 8
+DEFAULT_RATE_LIMIT = 20.0
+MAX_RETRIES = 5
+RETRY_STATUS_CODES = {429, 500, 502, 503, 504}
+FIRST_VARIETY_ID = 10001
+# Ideographs, kana, CJK punctuation and full-width forms: scripts written without spaces.
+CJK_CHARACTER = '[\u3000-\u30ff\u3400-\u4dbf\u4e00-\u9fff\uf900-\ufaff\uff00-\uffef]'
+CJK_LINE_BREAK = re.compile(f'(?<={CJK_CHARACTER})[\n\f]+(?={CJK_CHARACTER})')
+
+
+class RateLimiter:
+    """Token bucket shared by every worker thread."""
+
+    def __init__(self, rate, burst=None):
+        self.rate = rate
+        self.capacity = burst or max(1.0, rate)
+        self.tokens = self.capacity
+        self.updated = time.monotonic()
+        self.lock = threading.Lock()
+
+    def acquire(self):
+        """Block until a request may be sent."""
+        if not self.rate:
+            return
+        while True:
+            with self.lock:
+                now = time.monotonic()
+                self.tokens = min(self.capacity, self.tokens + (now - self.updated) * self.rate)
+                self.updated = now
+                if self.tokens >= 1:
+                    self.tokens -= 1
+                    return
+                wait = (1 - self.tokens) / self.rate
+            time.sleep(wait)
+
+
+class ApiClient:
+    """Pooled, rate-limited PokeAPI client that retries with exponential backoff.
+
+    With a ResponseCache, responses still within their max-age are served
+    without touching the network and stale ones are revalidated with
+    conditional requests.
+    """
+
+    def __init__(self, base_url=API_BASE_URL, workers=DEFAULT_WORKERS, rate_limit=DEFAULT_RATE_LIMIT,
+                 max_retries=MAX_RETRIES, sprites_dir=SPRITES_DIR, cache=None, revalidate=False):
+        self.base_url = base_url.rstrip('/')
+        self.workers = workers
+        self.max_retries = max_retries
+        self.sprites_dir = sprites_dir
+        self.cache = cache
+        self.revalidate = revalidate
+        self.limiter = RateLimiter(rate_limit)
+        self.session = requests.Session()
+        adapter = HTTPAdapter(pool_connections=workers, pool_maxsize=workers)
+        self.session.mount('http://', adapter)
+        self.session.mount('https://', adapter)
+
+    def url(self, path):
+        """Build an absolute API URL from a path such as 'pokemon/1'."""
+        return f"{self.base_url}/{path}"
+
+    def get(self, url):
+        """GET a URL through the cache, if any. Returns the final response."""
+        if self.cache is None:
+            return self.send(url)
+
+        meta = self.cache.lookup(url)
+        if meta and not self.revalidate and self.cache.is_fresh(meta):
+            self.cache.hit_fresh()
+            return self.cache.load(url, meta)
+
+        response = self.send(url, self.cache.conditional_headers(meta) if meta else None)
+        if response.status_code == 304 and meta:
+            return self.cache.revalidated(url, meta, response)
+        if response.status_code == 200:
+            return self.cache.store(url, response, meta)
+        return response
+
+    def send(self, url, headers=None):
+        """Send a GET request, retrying throttled or failed requests."""
+        for attempt in range(self.max_retries + 1):
+            self.limiter.acquire()
+            try:
+                response = self.session.get(url, headers=headers, timeout=30)
+            except requests.RequestException as e:
+                if attempt == self.max_retries:
+                    raise
+                print(f"Request to {url} failed ({e}), retrying")
+                time.sleep(self.backoff(attempt))
+                continue
+
+            if response.status_code not in RETRY_STATUS_CODES or attempt == self.max_retries:
+                return response
+
+            retry_after = response.headers.get('Retry-After', '')
+            delay = float(retry_after) if retry_after.isdigit() else self.backoff(attempt)
+            print(f"Got {response.status_code} from {url}, retrying in {delay:.1f}s")
+            time.sleep(delay)
+        return response
+
+    @staticmethod
+    def backoff(attempt):
+        """Exponential backoff delay in seconds for the given retry attempt."""
+        return min(30.0, 0.5 * 2 ** attempt)
+
+
+class Checkpoint:
+    """Append-only record of finished entries so an interrupted refresh can resume."""
+
+    def __init__(self, path, resume=True):
+        self.path = path
+        self.lock = threading.Lock()
+        self.completed = {}
+        if resume and os.path.exists(path):
+            with open(path, 'r', encoding='utf-8') as f:
+                for line in f:
+                    try:
+                        entry = json.loads(line)
+                    except json.JSONDecodeError:
+                        break  # Truncated last line from an interrupted write.
+                    self.completed[entry['index']] = entry['data']
+            print(f"Resuming from {path}: {len(self.completed)} entries already fetched")
+        self.file = open(path, 'a' if resume else 'w', encoding='utf-8')
+
+    def add(self, index, data):
+        """Record a finished entry."""
+        line = json.dumps({'index': index, 'data': data}, ensure_ascii=False)
+        with self.lock:
+            self.completed[index] = data
+            self.file.write(line + '\n')
+            self.file.flush()
+
+    def close(self, remove=False):
+        """Close the checkpoint, deleting it once the refresh has been written out."""
+        self.file.close()
+        if remove:
+            os.remove(self.path)
+
+
+def fetch_batch(executor, fetch_one, checkpoint, batch, results):
+    """Fetch the indices of batch missing from results in parallel. Returns how many were found."""
+    def fetch_and_record(i):
+        data = fetch_one(i)
+        if data is not None:
+            checkpoint.add(i, data)
+        return data
+
+    futures = {i: executor.submit(fetch_and_record, i) for i in batch if i not in results}
+    found = sum(1 for i in batch if i in results)
+    for i, future in futures.items():
+        data = future.result()
+        if data is not None:
+            results[i] = data
+            found += 1
+    return found
+
+
+def fetch_indices(fetch_one, checkpoint, limit=None, workers=DEFAULT_WORKERS):
+    """Fetch consecutive indices in parallel until a whole batch returns nothing.
+
+    Indices that fail inside the range are skipped instead of ending the refresh.
+    """
+    results = dict(checkpoint.completed)
+    index = 1
+    with ThreadPoolExecutor(max_workers=workers) as executor:
+        while not (limit and index > limit):
+            batch = range(index, index + workers * 4)
+            if limit:
+                batch = range(index, min(batch.stop, limit + 1))
+            if not fetch_batch(executor, fetch_one, checkpoint, batch, results):
+                break
+            index = batch.stop
+    return {i: results[i] for i in sorted(results) if i < index}
+
+
+def fetch_listed(fetch_one, checkpoint, indices, workers=DEFAULT_WORKERS):
+    """Fetch the given indices in parallel, skipping those that return nothing."""
+    results = {i: data for i, data in checkpoint.completed.items() if i in indices}
+    with ThreadPoolExecutor(max_workers=workers) as executor:
+        fetch_batch(executor, fetch_one, checkpoint, indices, results)
+    return {i: results[i] for i in sorted(results)}
+
+
+def fetch_variety_ids(client, limit=None):
+    """IDs of the alternate forms, megas and regional variants listed by /pokemon.
+
+    Their IDs start at FIRST_VARIETY_ID, after every species' default form.
+    """
+    response = client.get(client.url("pokemon?limit=100000"))
+    if response.status_code != 200:
+        print(f"Failed to retrieve the Pokémon list: {response.status_code}")
+        return []
+    ids = sorted(int(entry['url'].rstrip('/').rsplit('/', 1)[1]) for entry in response.json()['results'])
+    ids = [pokemon_id for pokemon_id in ids if pokemon_id >= FIRST_VARIETY_ID]
+    return ids[:limit] if limit else ids
+
 
-def fetch_pokemon_details(pokemon_index):
-    """Fetch details for a specific Pokémon from the API and save sprites."""
-    url = f"https://pokeapi.co/api/v2/pokemon/{pokemon_index}"
-    response = requests.get(url)
+def not_modified(*responses):
+    """True when every response was served unchanged from the cache."""
+    return all(getattr(response, 'not_modified', False) for response in responses)
+
+
+def current_shape(entry):
+    """True when a stored entry has every field the extractor now writes, with normalized flavor text."""
+    return ('flavor_texts' in entry and
+            all(normalize_flavor_text(text) == text for text in entry.get('descriptions', {}).values()))
+
+
+def fetch_pokemon_details(pokemon_index, client, previous=None):
+    """Fetch details for a specific Pokémon from the API and save sprites.
+
+    When neither the Pokémon nor its species changed upstream, the previous
+    entry is returned as is instead of being rebuilt, unless it was written
+    by an older version that lacked fields now extracted.
+    """
+    response = client.get(client.url(f"pokemon/{pokemon_index}"))
 
     if response.status_code == 200:
         data = response.json()
         species_url = data['species']['url']
-        species_response = requests.get(species_url)
-        
+        species_response = client.get(species_url)
+
         if species_response.status_code == 200:
             species_data = species_response.json()
+            form_response = None
+            if not data.get('is_default', True) and data['forms']:
+                form_response = client.get(data['forms'][0]['url'])
 
             sprite_url = data['sprites']['front_default']
             sprite_filename = f"pokemon_{pokemon_index}.png"
-            sprite_path = os.path.join(SPRITES_DIR, sprite_filename)
-            download_and_save_sprite(sprite_url, sprite_path)
+            sprite_path = os.path.join(client.sprites_dir, sprite_filename)
+            if sprite_url:
+                download_and_save_sprite(client, sprite_url, sprite_path)
 
             shiny_sprite_path = None
             if 'front_shiny' in data['sprites'] and data['sprites']['front_shiny']:
                 shiny_sprite_url = data['sprites']['front_shiny']
                 shiny_sprite_filename = f"pokemon_{pokemon_index}_shiny.png"
-                shiny_sprite_path = os.path.join(SPRITES_DIR, shiny_sprite_filename)
-                download_and_save_sprite(shiny_sprite_url, shiny_sprite_path)
-            
+                shiny_sprite_path = os.path.join(client.sprites_dir, shiny_sprite_filename)
+                download_and_save_sprite(client, shiny_sprite_url, shiny_sprite_path)
+
+            responses = [r for r in (response, species_response, form_response) if r is not None]
+            if previous is not None and not_modified(*responses) and current_shape(previous):
+                return previous
+
             pokemon_details = extract_pokemon_details(data, species_data)
-            pokemon_details['sprite_path'] = f"./sprites/{sprite_filename}"
-            pokemon_details['descriptions'] = fetch_pokemon_descriptions(species_data)
+            if form_response is not None and form_response.status_code == 200:
+                pokemon_details['names'] = variety_names(pokemon_details['names'], form_response.json())
+            pokemon_details['sprite_path'] = f"./sprites/{sprite_filename}" if sprite_url else None
             pokemon_details['national_pokedex_number'] = species_data['id']
 
             gender_rate = species_data.get('gender_rate', -1)
             if gender_rate == -1:
                 pokemon_details['gender_rate'] = None
             else:
-                female_rate = (gender_rate / 8) * 100 
+                female_rate = (gender_rate / 8) * 100
                 male_rate = 100 - female_rate
                 pokemon_details['gender_rate'] = {
                     'female': (female_rate),
                     'male': (male_rate)
                 }
 
+            print(f"Fetched details for Pokemon index {pokemon_index}")
             return pokemon_details
         else:
             print(f"Failed to retrieve species data for Pokemon index {pokemon_index}: {species_response.status_code}")
@@ -54,15 +294,34 @@ def fetch_pokemon_details(pokemon_index):
     return None
 
 
-def fetch_pokemon_descriptions(species_data):
-    """Fetch Pokémon descriptions in all available languages."""
-    descriptions = {}
+def normalize_flavor_text(text):
+    """Flavor text as one paragraph, without the line and page breaks of the game text boxes.
+
+    Soft hyphens and the breaks after them are dropped, a break after a
+    hyphen inside a word is removed, and other breaks become spaces. Between
+    CJK characters a break becomes nothing, or an ideographic space in text
+    that separates words with them as Japanese does. Runs of spaces
+    collapse. Normalizing normalized text changes nothing.
+    """
+    text = re.sub('\xad[\n\f]*', '', text)
+    text = re.sub(r'(?<=\w-)[\n\f]+(?=\w)', '', text)
+    text = CJK_LINE_BREAK.sub('\u3000' if '\u3000' in text else '', text)
+    return re.sub(r'[ \t\n\r\f\v]+', ' ', text).strip()
+
+def fetch_flavor_texts(species_data):
+    """Every distinct flavor text per language, normalized, with the game versions that use it, oldest first."""
+    flavor_texts = {}
     for entry in species_data['flavor_text_entries']:
-        language = entry['language']['name']
-        description = entry['flavor_text']
-        if language not in descriptions:
-            descriptions[language] = description
-    return descriptions
+        texts = flavor_texts.setdefault(entry['language']['name'], [])
+        text = normalize_flavor_text(entry['flavor_text'])
+        existing = next((item for item in texts if item['text'] == text), None)
+        if existing is None:
+            existing = {'text': text, 'versions': []}
+            texts.append(existing)
+        version = (entry.get('version') or {}).get('name')
+        if version and version not in existing['versions']:
+            existing['versions'].append(version)
+    return flavor_texts
 
 def extract_pokemon_details(data, species_data):
     """Extract and structure Pokémon details from API response."""
@@ -75,70 +334,207 @@ def extract_pokemon_details(data, species_data):
     pokemon_details['types'] = [poke_type['type']['name'] for poke_type in data['types']]
     pokemon_details['abilities'] = [ability['ability']['name'] for ability in data['abilities']]
     pokemon_details['stats'] = [{stat['stat']['name']: stat['base_stat']} for stat in data['stats']]
-    pokemon_details['descriptions'] = fetch_pokemon_descriptions(species_data)
+    flavor_texts = fetch_flavor_texts(species_data)
+    # The description of each language is its first flavor text.
+    pokemon_details['descriptions'] = {language: texts[0]['text'] for language, texts in flavor_texts.items()}
+    pokemon_details['flavor_texts'] = flavor_texts
 
     return pokemon_details
 
-def download_and_save_sprite(sprite_url, sprite_path):
-    """Download sprite from URL and save it to sprite_path."""
-    response = requests.get(sprite_url)
+def variety_names(species_names, form_data):
+    """Names of an alternate form from its /pokemon-form entry.
+
+    The form's own full names are used where it has them, such as
+    "Mega Charizard X"; otherwise the species name followed by the form
+    name, such as "Vulpix (Alolan Form)".
+    """
+    full_names = {entry['language']['name']: entry['name'] for entry in form_data.get('names', [])}
+    form_names = {entry['language']['name']: entry['name'] for entry in form_data.get('form_names', [])}
+    names = {}
+    for language, name in species_names.items():
+        if language in full_names:
+            names[language] = full_names[language]
+        elif language in form_names:
+            names[language] = f"{name} ({form_names[language]})"
+        else:
+            names[language] = name
+    return names
+
+def download_and_save_sprite(client, sprite_url, sprite_path):
+    """Download sprite from URL and save it to sprite_path, unless the file already has those bytes."""
+    response = client.get(sprite_url)
     if response.status_code == 200:
+        if os.path.exists(sprite_path):
+            with open(sprite_path, 'rb') as f:
+                if f.read() == response.content:
+                    return
         with open(sprite_path, 'wb') as f:
             f.write(response.content)
         print(f"Saved sprite: {sprite_path}")
     else:
         print(f"Failed to download sprite from {sprite_url}")
 
-def fetch_and_save_all_pokemon_details(limit=None, output_file="pokemon_details.json"):
-    """Fetch and save details for all Pokémon up to the specified limit to a JSON file."""
-    all_pokemon_details = {}
-    pokemon_index = 1
-    
-    while True:
-        if limit and pokemon_index > limit:
-            break
-        
-        pokemon_details = fetch_pokemon_details(pokemon_index)
-        if pokemon_details:
-            all_pokemon_details[f"pokemon_{pokemon_index}"] = pokemon_details
-            print(f"Fetched details for Pokemon index {pokemon_index}")
-            pokemon_index += 1
-        else:
-            break 
+def fetch_ability(ability_index, client, previous=None):
+    """Fetch the localized names of a single ability. previous is the last refresh's abilities.json."""
+    response = client.get(client.url(f"ability/{ability_index}"))
+    if response.status_code == 200:
+        data = response.json()
+        if previous and not_modified(response) and data['name'] in previous:
+            return {'name': data['name'], 'names': previous[data['name']]}
+        ability_names = {entry['language']['name']: entry['name'] for entry in data['names']}
+        print(f"Fetched data for Ability index {ability_index}")
+        return {'name': data['name'], 'names': ability_names}
+    print(f"Failed to retrieve data for Ability index {ability_index}: {response.status_code}")
+    return None
+
+def load_previous(output_file):
+    """Load the dataset written by the previous refresh, if any."""
+    try:
+        with open(output_file, 'r') as f:
+            return json.load(f)
+    except (OSError, ValueError):
+        return {}
+
+def save_if_changed(output_file, data, previous):
+    """Write a dataset only if it differs from the previous one. Returns True if written.
+
+    The file it replaces is kept with PREVIOUS_SUFFIX, for verify_data.py to
+    report the changes. The new data goes to a temporary file renamed over
+    the old one, so a failed write never leaves the dataset missing or
+    truncated.
+    """
+    if data == previous:
+        return False
+    if os.path.exists(output_file):
+        shutil.copyfile(output_file, output_file + PREVIOUS_SUFFIX)
+    write_json_atomic(output_file, data)
+    return True
+
+def fetch_and_save_all_pokemon_details(client, limit=None, output_file="pokemon_details.json", resume=True,
+                                       varieties=True):
+    """Fetch and save details for all Pokémon up to the specified limit to a JSON file.
 
-    with open(output_file, 'w') as f:
-        json.dump(all_pokemon_details, f, indent=4)
-    
-    print(f"Pokemon details have been saved to {output_file}.")
+    With varieties, alternate forms, megas and regional variants follow the
+    default forms, keyed by their own Pokémon ID.
+    """
+    previous = load_previous(output_file)
+    checkpoint = Checkpoint(f"{output_file}.checkpoint", resume=resume)
+    fetch_one = lambda i: fetch_pokemon_details(i, client, previous.get(f"pokemon_{i}"))
+    fetched = fetch_indices(fetch_one, checkpoint, limit, client.workers)
+    if varieties:
+        fetched.update(fetch_listed(fetch_one, checkpoint, fetch_variety_ids(client, limit), client.workers))
+    all_pokemon_details = {f"pokemon_{i}": details for i, details in fetched.items()}
 
-def fetch_and_save_abilities(limit=None, output_file="abilities.json"):
+    try:
+        PokedexStore.from_json(all_pokemon_details)
+    except SchemaError as e:
+        print(f"Not saving {output_file}, the fetched data is invalid: {e}")
+        return
+    changed = sum(1 for key, details in all_pokemon_details.items() if previous.get(key) != details)
+    if save_if_changed(output_file, all_pokemon_details, previous):
+        print(f"Pokemon details have been saved to {output_file} ({changed} changed entries). "
+              f"Run verify_data.py to review them.")
+    else:
+        print(f"Pokemon details in {output_file} are already up to date.")
+    checkpoint.close(remove=True)
+
+def fetch_and_save_abilities(client, limit=None, output_file="abilities.json", resume=True):
     """Fetch abilities data from the API up to the specified limit and save to a file."""
-    abilities = {}
-    i = 1
-    while True:
-        if limit and i > limit:
-            break
-        
-        url = f"https://pokeapi.co/api/v2/ability/{i}"
-        response = requests.get(url)
-        if response.status_code == 200:
-            data = response.json()
-            ability_names = {entry['language']['name']: entry['name'] for entry in data['names']}
-            abilities[data['name']] = ability_names
-            print(f"Fetched data for Ability index {i}")
-            i += 1
-        else:
-            print(f"Failed to retrieve data for Ability index {i}: {response.status_code}")
-            break
+    previous = load_previous(output_file)
+    checkpoint = Checkpoint(f"{output_file}.checkpoint", resume=resume)
+    fetched = fetch_indices(lambda i: fetch_ability(i, client, previous), checkpoint, limit, client.workers)
+    abilities = {ability['name']: ability['names'] for ability in fetched.values()}
+    try:
+        PokedexStore.from_json({}, abilities)
+    except SchemaError as e:
+        print(f"Not saving {output_file}, the fetched data is invalid: {e}")
+        return
 
-    with open(output_file, 'w') as f:
-        json.dump(abilities, f, indent=4)
-    
-    print(f"Abilities have been refreshed and saved to {output_file}.")
+    if save_if_changed(output_file, abilities, previous):
+        print(f"Abilities have been refreshed and saved to {output_file}.")
+    else:
+        print(f"Abilities in {output_file} are already up to date.")
+    checkpoint.close(remove=True)
+
+def compile_pokedex_file(details_file="pokemon_details.json", abilities_file="abilities.json", output_dir="data",
+                         sprite_scale=1, processes=None):
+    """Compile the JSON datasets into the binary Pokédex and sprite archive loaded by qdex.py.
+
+    Sprites and type icons are trimmed and recompressed on the way into the
+    archive, and sprites are pre-scaled by sprite_scale.
+    """
+    with open(details_file, 'r') as f:
+        details = json.load(f)
+    with open(abilities_file, 'r') as f:
+        abilities = json.load(f)
+
+    store = PokedexStore.from_json(details, abilities)
+    for record in store:
+        # Datasets fetched before flavor text was normalized at refresh time.
+        record.descriptions = {language: normalize_flavor_text(text) for language, text in record.descriptions.items()}
+        record.flavor_texts = {language: tuple((versions, normalize_flavor_text(text)) for versions, text in texts)
+                               for language, texts in record.flavor_texts.items()}
+    base_dir = os.path.dirname(os.path.abspath(details_file))
+    compile_pokedex(store, output_dir, base_dir=base_dir)
+    print(f"Compiled Pokédex has been saved to {output_dir}.")
+
+    scales = dict.fromkeys(sprite_sources(store, base_dir), sprite_scale)
+    if not scales:
+        print(f"No sprites found next to {details_file}; the sprite archive will only hold type icons.")
+    types_dir = os.path.join(base_dir, 'types')
+    if os.path.isdir(types_dir):
+        scales.update((f"types/{name}", 1) for name in sorted(os.listdir(types_dir)) if name.endswith('.png'))
+    start = time.perf_counter()
+    images, source_size = process_files(base_dir, scales, processes)
+    size = write_sprite_archive(os.path.join(output_dir, SPRITE_ARCHIVE_FILE), images,
+                                {'sprites': sprite_scale, 'types': 1})
+    change = f" ({(size - source_size) / source_size:+.1%})" if source_size else ''
+    print(f"Processed {len(images)} images in {time.perf_counter() - start:.1f}s: "
+          f"{source_size / 1024 / 1024:.2f} MiB -> {size / 1024 / 1024:.2f} MiB{change} in {SPRITE_ARCHIVE_FILE}.")
+
+
+def parse_args(argv=None):
+    parser = argparse.ArgumentParser(description="Refresh QDex data from PokeAPI.")
+    parser.add_argument('target', nargs='?', choices=['pokemon', 'abilities', 'all', 'compile'], default='pokemon',
+                        help="which dataset to refresh, or 'compile' to only rebuild the compiled "
+                             "Pokédex (default: pokemon)")
+    parser.add_argument('--limit', type=int, default=None, help="stop after this many entries")
+    parser.add_argument('--workers', type=int, default=DEFAULT_WORKERS, help="concurrent requests")
+    parser.add_argument('--rate', type=float, default=DEFAULT_RATE_LIMIT,
+                        help="maximum requests per second, 0 for unlimited")
+    parser.add_argument('--retries', type=int, default=MAX_RETRIES, help="retries per request")
+    parser.add_argument('--base-url', default=API_BASE_URL, help="PokeAPI base URL")
+    parser.add_argument('--sprites-dir', default=SPRITES_DIR, help="where sprites are written")
+    parser.add_argument('--output-dir', default='.', help="where the JSON files are written")
+    parser.add_argument('--no-varieties', action='store_true',
+                        help="skip alternate forms, megas and regional variants")
+    parser.add_argument('--fresh', action='store_true', help="ignore checkpoints from an interrupted run")
+    parser.add_argument('--sprite-scale', type=int, default=1,
+                        help="store sprites pre-scaled by this factor (the UI shows them at 4)")
+    parser.add_argument('--processes', type=int, default=None, help="sprite processing processes (default: CPUs)")
+    parser.add_argument('--cache-dir', default=CACHE_DIR, help="where HTTP responses are cached")
+    parser.add_argument('--no-cache', action='store_true', help="bypass the HTTP response cache")
+    parser.add_argument('--revalidate', action='store_true',
+                        help="revalidate cached responses even if they are still fresh")
+    return parser.parse_args(argv)
 
 if __name__ == "__main__":
-    if not os.path.exists(SPRITES_DIR):
-        os.makedirs(SPRITES_DIR)
-        
-    fetch_and_save_all_pokemon_details(limit=0)
-    #fetch_and_save_abilities(limit=10)
+    args = parse_args()
+    if not os.path.exists(args.sprites_dir):
+        os.makedirs(args.sprites_dir)
+
+    cache = None if args.no_cache else ResponseCache(args.cache_dir)
+    client = ApiClient(args.base_url, args.workers, args.rate, args.retries, args.sprites_dir, cache, args.revalidate)
+    if args.target in ('pokemon', 'all'):
+        fetch_and_save_all_pokemon_details(client, limit=args.limit, resume=not args.fresh,
+                                           varieties=not args.no_varieties,
+                                           output_file=os.path.join(args.output_dir, "pokemon_details.json"))
+    if args.target in ('abilities', 'all'):
+        fetch_and_save_abilities(client, limit=args.limit, resume=not args.fresh,
+                                 output_file=os.path.join(args.output_dir, "abilities.json"))
+    if cache is not None and args.target != 'compile':
+        print(f"HTTP cache: {cache.summary()}")
+
+    compile_pokedex_file(os.path.join(args.output_dir, "pokemon_details.json"),
+                         os.path.join(args.output_dir, "abilities.json"),
+                         os.path.join(args.output_dir, "data"), args.sprite_scale, args.processes)
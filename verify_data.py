@@ -0,0 +1,266 @@
+"""Check the refreshed datasets for broken references and report what changed since the previous version.
+
+    python verify_data.py                  # against the .previous files the last refresh left behind
+    python verify_data.py --previous HEAD  # against the datasets of a git revision
+    python verify_data.py --previous old/  # against a directory holding older datasets
+
+One pass over pokemon_details.json checks every entry: its schema, its
+sprite and shiny sprite files, its abilities against abilities.json, its
+type icons and its names and flavor text in every language. Errors break
+the app and make the command exit with status 1; warnings are gaps it
+shows as 'N/A' or an empty label. The diff report lists the entries and
+abilities added, removed and changed, and which fields changed.
+"""
+import argparse
+import json
+import os
+import subprocess
+import sys
+import time
+from collections import Counter
+
+from pokedex_store import PokedexStore, SchemaError
+
+DETAILS_FILE = 'pokemon_details.json'
+ABILITIES_FILE = 'abilities.json'
+PREVIOUS_SUFFIX = '.previous'
+TYPES_DIR = 'types'
+LOCALIZED_FIELDS = ('names', 'descriptions', 'flavor_texts')
+SHOWN_KEYS = 5
+
+
+class Report:
+    """Errors and warnings of a dataset as (where, message) pairs, with language coverage."""
+
+    def __init__(self):
+        self.errors = []
+        self.warnings = []
+        self.coverage = {}
+        self.count = 0
+        self.used_abilities = 0
+
+    def error(self, where, message):
+        self.errors.append((where, message))
+
+    def warning(self, where, message):
+        self.warnings.append((where, message))
+
+
+def load_json(path):
+    with open(path, 'r', encoding='utf-8') as f:
+        return json.load(f)
+
+
+def load_datasets(details_file, abilities_file):
+    return load_json(details_file), load_json(abilities_file)
+
+
+def load_previous(previous, details_file, abilities_file):
+    """The datasets to compare against: a directory, a git revision, or by default the .previous files.
+
+    update_data.py keeps a .previous file each time it replaces a dataset, so
+    by default each dataset is compared with its version before its last
+    change, or with itself if it has none. Returns (None, None) when neither
+    has a .previous file.
+    """
+    if previous is None:
+        paths = [path + PREVIOUS_SUFFIX for path in (details_file, abilities_file)]
+        if not any(os.path.exists(path) for path in paths):
+            return None, None
+        return tuple(load_json(path if os.path.exists(path) else path[:-len(PREVIOUS_SUFFIX)]) for path in paths)
+    if os.path.isdir(previous):
+        return load_datasets(os.path.join(previous, os.path.basename(details_file)),
+                             os.path.join(previous, os.path.basename(abilities_file)))
+    datasets = []
+    for path in (details_file, abilities_file):
+        directory, name = os.path.split(os.path.abspath(path))
+        result = subprocess.run(['git', 'show', f'{previous}:./{name}'], cwd=directory, capture_output=True)
+        if result.returncode != 0:
+            raise ValueError(result.stderr.decode('utf-8', 'replace').strip())
+        datasets.append(json.loads(result.stdout))
+    return tuple(datasets)
+
+
+def shown(keys):
+    """Up to SHOWN_KEYS keys, and how many more there are."""
+    text = ', '.join(keys[:SHOWN_KEYS])
+    return text + (f" and {len(keys) - SHOWN_KEYS} more" if len(keys) > SHOWN_KEYS else '')
+
+
+def verify(details, abilities, base_dir='.'):
+    """Check every entry's schema, sprites, abilities, types and languages in one pass. Returns a Report."""
+    report = Report()
+    store = PokedexStore()
+    for key, names in abilities.items():
+        try:
+            store.add_ability(key, names)
+        except SchemaError as e:
+            report.error(f"abilities.{key}", str(e))
+
+    listings = {}
+
+    def file_exists(path):
+        # One directory listing per directory instead of a stat per file.
+        directory, name = os.path.split(os.path.normpath(os.path.join(base_dir, path)))
+        if directory not in listings:
+            listings[directory] = set(os.listdir(directory)) if os.path.isdir(directory) else set()
+        return name in listings[directory]
+
+    keys = []
+    present = {'names': {}, 'descriptions': {}}
+    used_abilities = set()
+    for key, entry in details.items():
+        try:
+            record = store.add_entry(key, entry)
+        except SchemaError as e:
+            report.error(key, str(e))
+            continue
+        keys.append(key)
+        if record.sprite_path is None:
+            report.warning(key, "no sprite")
+        elif not file_exists(record.sprite_path):
+            report.error(key, f"sprite {record.sprite_path} does not exist")
+        elif not file_exists(record.sprite_path.replace('.png', '_shiny.png')):
+            report.warning(key, "no shiny sprite")
+        for ability in entry['abilities']:
+            used_abilities.add(ability)
+            if ability not in abilities:
+                report.error(key, f"ability {ability} is not in {ABILITIES_FILE}")
+        for name in entry['types']:
+            if not file_exists(f"{TYPES_DIR}/{name}.png"):
+                report.error(key, f"type {name} has no icon in {TYPES_DIR}/")
+        for field in present:
+            for language, text in getattr(record, field).items():
+                if text:
+                    present[field].setdefault(language, set()).add(key)
+
+    report.count = len(keys)
+    report.used_abilities = len(used_abilities)
+    for language in sorted(set(present['names']) | set(present['descriptions'])):
+        names = present['names'].get(language, set())
+        descriptions = present['descriptions'].get(language, set())
+        ability_gaps = sorted(a for a in used_abilities if a in abilities and not abilities[a].get(language))
+        report.coverage[language] = {
+            'names': len(names),
+            'descriptions': len(descriptions),
+            'abilities': len(used_abilities) - len(ability_gaps),
+        }
+        for field, missing in (('names', [key for key in keys if key not in names]),
+                               ('flavor text', [key for key in keys if key not in descriptions]),
+                               ('ability names', ability_gaps)):
+            if missing:
+                report.warning(language, f"{field} missing for {len(missing)}: {shown(missing)}")
+    return report
+
+
+def changed_fields(old, new):
+    """Fields that differ between two entries; localized fields are named per language, as 'names.fr'."""
+    fields = []
+    for field in sorted(set(old) | set(new)):
+        before, after = old.get(field), new.get(field)
+        if before == after:
+            continue
+        if field in LOCALIZED_FIELDS and isinstance(before, dict) and isinstance(after, dict):
+            fields += [f"{field}.{language}" for language in sorted(set(before) | set(after))
+                       if before.get(language) != after.get(language)]
+        else:
+            fields.append(field)
+    return fields
+
+
+def diff_datasets(previous_details, details, previous_abilities, abilities):
+    """Entries and abilities added, removed and changed, with the changed fields of each entry."""
+    changed = {key: changed_fields(previous_details[key], entry) for key, entry in details.items()
+               if key in previous_details and previous_details[key] != entry}
+    return {
+        'added': [key for key in details if key not in previous_details],
+        'removed': [key for key in previous_details if key not in details],
+        'changed': changed,
+        'fields': dict(Counter(field for fields in changed.values() for field in fields).most_common()),
+        'abilities': {
+            'added': [key for key in abilities if key not in previous_abilities],
+            'removed': [key for key in previous_abilities if key not in abilities],
+            'changed': [key for key, names in abilities.items()
+                        if key in previous_abilities and previous_abilities[key] != names],
+        },
+    }
+
+
+def print_report(report, diff, elapsed, limit):
+    print(f"Checked {report.count} entries and {report.used_abilities} abilities in {elapsed * 1000:.0f} ms.")
+    print("Coverage:")
+    for language, counts in report.coverage.items():
+        print(f"  {language:8} names {counts['names']}/{report.count}   "
+              f"flavor text {counts['descriptions']}/{report.count}   "
+              f"abilities {counts['abilities']}/{report.used_abilities}")
+    for label, problems in (("Errors", report.errors), ("Warnings", report.warnings)):
+        if problems:
+            print(f"{label} ({len(problems)}):")
+            for where, message in problems[:limit]:
+                print(f"  {where}: {message}")
+            if len(problems) > limit:
+                print(f"  ... {len(problems) - limit} more")
+    if diff is None:
+        print("No previous dataset to compare against.")
+        return
+    abilities = diff['abilities']
+    print(f"Changes: {len(diff['added'])} added, {len(diff['removed'])} removed, "
+          f"{len(diff['changed'])} changed entries; abilities {len(abilities['added'])} added, "
+          f"{len(abilities['removed'])} removed, {len(abilities['changed'])} changed.")
+    for label, keys in (("Added", diff['added']), ("Removed", diff['removed']),
+                        ("Added abilities", abilities['added']), ("Removed abilities", abilities['removed']),
+                        ("Changed abilities", abilities['changed'])):
+        if keys:
+            print(f"  {label}: {shown(keys)}")
+    if diff['fields']:
+        print("  Changed fields: " + ', '.join(f"{field} {n}" for field, n in diff['fields'].items()))
+    for key, fields in list(diff['changed'].items())[:limit]:
+        print(f"  {key}: {', '.join(fields)}")
+    if len(diff['changed']) > limit:
+        print(f"  ... {len(diff['changed']) - limit} more changed entries")
+
+
+def parse_args(argv=None):
+    parser = argparse.ArgumentParser(
+        description="Verify the QDex datasets and report changes since the previous version.")
+    parser.add_argument('--details', default=DETAILS_FILE, help=f"Pokémon dataset (default: {DETAILS_FILE})")
+    parser.add_argument('--abilities', default=ABILITIES_FILE, help=f"abilities dataset (default: {ABILITIES_FILE})")
+    parser.add_argument('--previous', help="git revision or directory of the datasets to compare against "
+                                           f"(default: the {PREVIOUS_SUFFIX} files kept by update_data.py)")
+    parser.add_argument('--json', action='store_true', help="print the report as JSON")
+    parser.add_argument('--limit', type=int, default=50, help="problems and changed entries listed in text output")
+    return parser.parse_args(argv)
+
+
+def main(argv=None):
+    args = parse_args(argv)
+    start = time.perf_counter()
+    try:
+        details, abilities = load_datasets(args.details, args.abilities)
+        previous_details, previous_abilities = load_previous(args.previous, args.details, args.abilities)
+    except (OSError, ValueError) as e:
+        print(f"Error loading data: {e}", file=sys.stderr)
+        return 2
+    report = verify(details, abilities, os.path.dirname(os.path.abspath(args.details)))
+    diff = None
+    if previous_details is not None:
+        diff = diff_datasets(previous_details, details, previous_abilities, abilities)
+    elapsed = time.perf_counter() - start
+
+    if args.json:
+        json.dump({
+            'entries': report.count,
+            'elapsed_ms': elapsed * 1000,
+            'coverage': report.coverage,
+            'errors': [{'where': where, 'message': message} for where, message in report.errors],
+            'warnings': [{'where': where, 'message': message} for where, message in report.warnings],
+            'diff': diff,
+        }, sys.stdout, ensure_ascii=False, indent=4)
+        print()
+    else:
+        print_report(report, diff, elapsed, args.limit)
+    return 1 if report.errors else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())